@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Asenkron (ASGI) çalışma modu.
+
+Gecikmeli uç noktalar (rontgen_listesi, adli_sicil) simüle gecikmeyi event
+loop üzerinde asyncio.sleep ile bekler; bekleme sırasında worker başka
+istekleri işlemeye devam eder. Yanıt gövdesi yine aynı Flask handler'ı
+tarafından üretilir, bu yüzden tüm uç noktaların çıktısı WSGI moduyla aynıdır.
+
+Flask çağrısı (üretim, kodlama, sıkıştırma) event loop'u bloklamasın diye
+worker başına bir iş parçacığı havuzunda çalışır; havuz boyutu gthread
+modundaki gibi NABI_THREAD ile belirlenir (varsayılan 8). Loop yalnızca
+bekleme ve G/Ç ile uğraşır.
+
+Çalıştırma (uvicorn isteğe bağlı bağımlılıktır):
+    uvicorn asgi:app --workers 4
+    gunicorn -k uvicorn.workers.UvicornWorker asgi:app
+"""
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import gecikme
+import kabul
+import kota
+import metrik
+from backend import app as flask_app, tc_dogrula
+
+# Tüm rotalar statik olduğu için yol -> endpoint eşlemesi bir kez kurulur
+_ROTALAR = {
+    kural.rule: kural.endpoint
+    for kural in flask_app.url_map.iter_rules()
+    if kural.endpoint in gecikme.GECIKMELI_UC_NOKTALAR
+}
+
+# İş parçacıkları ilk istekte açılır; preload edilen master'da havuz boş kalır
+_yurutucu = ThreadPoolExecutor(max_workers=int(os.environ.get('NABI_THREAD', 8)),
+                               thread_name_prefix='asgi-wsgi')
+
+def _environ_kur(scope, govde):
+    """ASGI scope'undan PEP 3333 uyumlu WSGI environ üretir"""
+    sunucu = scope.get('server') or ('localhost', 80)
+    istemci = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': sunucu[0],
+        'SERVER_PORT': str(sunucu[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': istemci[0],
+        'REMOTE_PORT': str(istemci[1]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(govde),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for ad, deger in scope.get('headers', ()):
+        ad = ad.decode('latin-1').upper().replace('-', '_')
+        deger = deger.decode('latin-1')
+        if ad == 'CONTENT_TYPE' or ad == 'CONTENT_LENGTH':
+            environ[ad] = deger
+            continue
+        anahtar = 'HTTP_' + ad
+        environ[anahtar] = f"{environ[anahtar]},{deger}" if anahtar in environ else deger
+    return environ
+
+def _wsgi_cagir(environ, kapi=None):
+    """Flask uygulamasını senkron çağırır; (durum, başlıklar, gövde) döner.
+
+    Havuzdaki bir iş parçacığında çalışır; kabul kapısı verildiyse çağrı
+    bitince burada boşaltılır.
+    """
+    try:
+        return _wsgi_yanit(environ)
+    finally:
+        if kapi is not None:
+            kapi.cik()
+
+def _wsgi_yanit(environ):
+    sonuc = {}
+
+    def start_response(durum, basliklar, exc_info=None):
+        sonuc['durum'] = int(durum.split(' ', 1)[0])
+        sonuc['basliklar'] = [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in basliklar]
+
+    yanit = flask_app(environ, start_response)
+    try:
+        govde = b''.join(yanit)
+    finally:
+        if hasattr(yanit, 'close'):
+            yanit.close()
+    return sonuc['durum'], sonuc['basliklar'], govde
+
+async def _govde_oku(receive):
+    parcalar = []
+    while True:
+        mesaj = await receive()
+        if mesaj['type'] == 'http.disconnect':
+            return None
+        parcalar.append(mesaj.get('body', b''))
+        if not mesaj.get('more_body'):
+            return b''.join(parcalar)
+
+async def _yasam_dongusu(receive, send):
+    while True:
+        mesaj = await receive()
+        if mesaj['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif mesaj['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await _yasam_dongusu(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    govde = await _govde_oku(receive)
+    if govde is None:
+        return
+    environ = _environ_kur(scope, govde)
+
+    uc_nokta = _ROTALAR.get(scope['path'])
+    kapi = is_ = None
+    try:
+        if uc_nokta is not None and scope['method'] in ('GET', 'HEAD') and kota.sinirlayici is not None:
+            # Hız sınırı beklemeden önce denetlenir; ret 429'u Flask katmanında üretilir
+            bekleme = kota.sinirlayici.denetle(environ, uc_nokta)
+            environ[kota.ORTAM_ANAHTARI] = bekleme or 0
+            if bekleme:
+                uc_nokta = None
+        if uc_nokta is not None and scope['method'] in ('GET', 'HEAD'):
+            tc = parse_qs(environ['QUERY_STRING']).get('tc', [''])[0]
+            # Geçersiz TC'ler beklemeden 404 alır (senkron moddaki sırayla aynı)
+            if tc_dogrula(tc):
+                # Kabul kontrolü beklemesiz denenir; ret 503'ü Flask katmanında üretilir
+                kapi = kabul.kapilar.get(uc_nokta)
+                if kapi is not None:
+                    neden, _ = kapi.gir(bekle=False)
+                    environ[kabul.ORTAM_ANAHTARI] = True if neden is None else neden
+                    if neden is not None:
+                        kapi = None
+                if environ.get(kabul.ORTAM_ANAHTARI, True) is True:
+                    sure = gecikme.gecikme_suresi(uc_nokta, tc, gecikme.butce_oku(environ))
+                    if sure > 0:
+                        t0 = asyncio.get_running_loop().time()
+                        await asyncio.sleep(sure)
+                        metrik.kayitci.sure(uc_nokta, 'gecikme', asyncio.get_running_loop().time() - t0)
+                    environ[gecikme.ORTAM_ANAHTARI] = True
+
+        is_ = _yurutucu.submit(_wsgi_cagir, environ, kapi)
+        durum, basliklar, govde = await asyncio.wrap_future(is_)
+    finally:
+        # Bekleme sırasında bağlantı koparsa (iptal) da yer boşaltılır; iş
+        # başladıysa kapı iş parçacığında, başlamadan iptal edildiyse burada
+        if kapi is not None and (is_ is None or is_.cancelled()):
+            kapi.cik()
+    await send({'type': 'http.response.start', 'status': durum, 'headers': basliklar})
+    await send({'type': 'http.response.body', 'body': govde})
@@ -1,83 +1,162 @@
 # -*- coding: utf-8 -*-
-from flask import Flask, jsonify, request, Response
+from flask import Flask, jsonify, request, Response, g, has_request_context
 import hashlib
-import random
-import json
-from datetime import datetime, timedelta
+import hmac
+import os
 import time
+from datetime import datetime
+
+from onbellek import LRUOnbellek, ParcaOnbellegi, YanitOnbellegi, YanitSablonu
+import baglam
+import gecikme
+import hizli_yol
+import kabul
+from kisi import KisiKaydi
+import kota
+import metrik
+import paylasimli
+import ornekleyici
+import profil
+import projeksiyon
+import serilestirme
+import sikistirma
+import sozluk
+import tanim
 
 app = Flask(__name__)
 
+# Kişi profili önbelleği (aynı TC için art arda gelen sorgularda yeniden üretimi önler)
+kisi_onbellegi = LRUOnbellek(
+    kapasite=int(os.environ.get('NABI_KISI_ONBELLEK_KAPASITE', 4096)),
+    ttl=float(os.environ.get('NABI_KISI_ONBELLEK_TTL', 0))
+)
+
+# Seed kalıntılarına bağlı, kimlikler arasında paylaşılan alt bölümler (0: kapalı)
+parca_onbellegi = ParcaOnbellegi(kapasite=int(os.environ.get('NABI_PARCA_ONBELLEK_KAPASITE', 1024)))
+
 # JSON yanıtlarında Türkçe karakter desteği
 class UTF8JsonResponse(Response):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.headers['Content-Type'] = 'application/json; charset=utf-8'
 
+def girinti_istendi():
+    """İstemci ?pretty=1 ile girintili çıktı istedi mi"""
+    return has_request_context() and request.args.get('pretty', '') not in ('', '0', 'false')
+
+def alan_secimi():
+    """?fields= projeksiyonu; verilmediyse None"""
+    secim = g.get('alan_secimi', _SECIM_YOK)
+    if secim is _SECIM_YOK:
+        secim = g.alan_secimi = projeksiyon.ayristir(request.args.get('fields', ''))
+    return secim
+
+_SECIM_YOK = object()
+
+def alan_istendi(*alanlar):
+    """Üst düzey alanlardan biri yanıta girecek mi; handler'lar pahalı bölümleri buna göre üretir"""
+    secim = alan_secimi()
+    return secim is None or secim.istendi(alanlar)
+
+JSON_MIMETYPE = 'application/json; charset=utf-8'
+
 def jsonify_utf8(*args, **kwargs):
-    """Türkçe karakter desteği olan jsonify"""
-    return app.response_class(
-        json.dumps(dict(*args, **kwargs), ensure_ascii=False, indent=2),
-        mimetype='application/json; charset=utf-8'
-    )
+    """Türkçe karakter desteği olan jsonify (varsayılan sıkışık, ?pretty=1 ile girintili)"""
+    veri = dict(*args, **kwargs)
+    if has_request_context() and g.get('tc_baglami') is not None:
+        # Projeksiyon yalnızca kayıt yanıtlarına uygulanır (404 gövdesine değil)
+        secim = alan_secimi()
+        if secim is not None:
+            veri = secim.uygula(veri)
+    return _json_yaniti(veri, girinti_istendi())
+
+def kisi_yaniti(kisi, ek):
+    """`jsonify_utf8({**kisi, **ek})` ile aynı gövde, birleştirilmiş sözlük kurmadan.
+
+    Sıkışık çıktıda kişi alanları kaydın önceden kodlanmış parçasından gelir;
+    yalnızca uç noktaya özel `ek` alanları kodlanır. Girintili çıktı ve ?fields=
+    projeksiyonu tüm yanıtı gerektirdiği için sözlük yoluna düşer. `ek` kişi
+    alanlarını yeniden tanımlamamalıdır.
+    """
+    if girinti_istendi() or (has_request_context() and alan_secimi() is not None):
+        return jsonify_utf8({**kisi, **ek})
+    return _json_yaniti(ek, False, onek=kisi.parca)
+
+def _json_yaniti(veri, girintili, onek=None):
+    t0 = time.perf_counter()
+    if has_request_context() and 'yanit_onbellek_anahtari' in g:
+        # Önbellek ıskası: gövdeyi anlık alanlardan bölünmüş şablon olarak kodla
+        sablon, govde = _sablon_olustur(request.endpoint, veri, girintili, onek)
+        g.yanit_sablonu = sablon
+    else:
+        govde = serilestirme.kodla(veri, girintili=girintili)
+        if onek is not None:
+            govde = serilestirme.nesneye_ekle(onek, govde)
+    olcum = g.get('olcum') if has_request_context() else None
+    if olcum is not None:
+        olcum.serilestirme += time.perf_counter() - t0
+    return app.response_class(govde, mimetype=JSON_MIMETYPE)
+
+def _sablon_olustur(uc_nokta, veri, girintili, onek=None):
+    """(şablon, gövde); gövde şablonun veri içindeki anlık değerlerle birleşimidir"""
+    sablon = YanitSablonu.olustur(veri, ANLIK_ALANLAR.get(uc_nokta, ()),
+                                  lambda v: serilestirme.kodla(v, girintili=girintili), onek)
+    return sablon, sablon.birlestir([veri[alan] for alan in sablon.alanlar], serilestirme.kodla)
+
+def _sablondan_govde(uc_nokta, sablon):
+    """Önbellek isabeti: anlık alanlar şimdi üretilip şablona yerleştirilir"""
+    anlik = ANLIK_ALANLAR.get(uc_nokta)
+    degerler = [anlik[alan]() for alan in sablon.alanlar] if anlik else ()
+    return sablon.birlestir(degerler, serilestirme.kodla)
 
 # ========== TC DOĞRULAMA ALGORİTMASI ==========
 def tc_dogrula(tc):
-    """TC kimlik numarası doğrulama algoritması"""
-    if not tc or len(tc) != 11 or not tc.isdigit() or tc[0] == '0':
-        return False
-    
-    # Algoritma 1: 1,3,5,7,9. rakamların toplamı
-    tekler = sum(int(tc[i]) for i in range(0, 9, 2))
-    
-    # Algoritma 2: 2,4,6,8. rakamların toplamı
-    ciftler = sum(int(tc[i]) for i in range(1, 9, 2))
-    
-    # 10. rakam kontrolü
-    if ((tekler * 7) - ciftler) % 10 != int(tc[9]):
-        return False
-    
-    # 11. rakam kontrolü
-    if (sum(int(tc[i]) for i in range(10)) % 10) != int(tc[10]):
+    """TC kimlik numarası doğrulama algoritması.
+
+    Rakamlar ASCII kodlarından okunur (int() çağrısı ve üreteç yok): 1, 3, 5,
+    7, 9. hanelerin toplamı T ve 2, 4, 6, 8. hanelerin toplamı Ç ise
+    10. hane (7T - Ç) mod 10, 11. hane ilk on hanenin toplamı mod 10'dur.
+    """
+    if not tc or len(tc) != 11 or not tc.isascii() or not tc.isdigit() or tc[0] == '0':
         return False
-    
-    return True
+    r = tc.encode('ascii')
+    tekler = r[0] + r[2] + r[4] + r[6] + r[8] - 5 * 48
+    ciftler = r[1] + r[3] + r[5] + r[7] - 4 * 48
+    onuncu = r[9] - 48
+    return (tekler * 7 - ciftler) % 10 == onuncu and (tekler + ciftler + onuncu) % 10 == r[10] - 48
+
+def tc_red_nedeni(tc):
+    """Geçerli TC için None; değilse ret nedeni: eksik, bicim ya da saglama"""
+    if tc_dogrula(tc):
+        return None
+    if not tc:
+        return 'eksik'
+    if len(tc) != 11 or not tc.isascii() or not tc.isdigit() or tc[0] == '0':
+        return 'bicim'
+    return 'saglama'
 
 # ========== TC'DEN KİŞİ BİLGİSİ ÜRETME ==========
 def tcden_kisi_uret(tc):
-    """TC'den deterministik ama benzersiz kişi bilgisi üretir"""
+    """TC'den deterministik ama benzersiz kişi bilgisi üretir.
+
+    Sonuç önbellekte paylaşılan salt okunur bir KisiKaydi'dır; handler'lar
+    yanıtı kisi_yaniti ile yazar.
+    """
+    return kisi_onbellegi.getir_veya_uret(tc, lambda: _kisi_hesapla(tc))
+
+def _kisi_hesapla(tc):
+    """Önbellek ıskasında profili sıfırdan hesaplar"""
     
-    # TC'yi seed olarak kullan
+    # TC'yi seed olarak kullan (tüm seçimler seed aritmetiğiyle yapılır,
+    # global random durumuna dokunulmaz)
     seed = int(tc)
-    random.seed(seed)
-    
-    # İsim listeleri (Türkçe karakterlerle)
-    adlar = ["Ahmet", "Mehmet", "Ali", "Veli", "Mustafa", "Hasan", "Hüseyin", 
-             "İbrahim", "Yusuf", "Murat", "Ömer", "Fatma", "Ayşe", "Zeynep", 
-             "Emine", "Hatice", "Elif", "Merve", "Esra", "Selma", "Cem", "Can",
-             "Burak", "Berke", "Deniz", "Eren", "Kaan", "Arda", "Emir", "Efe"]
-    
-    soyadlar = ["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Yıldız", "Arslan",
-                "Koç", "Polat", "Kılıç", "Aksoy", "Erdoğan", "Öztürk", "Aydın",
-                "Taş", "Kara", "Sarı", "Güneş", "Bulut", "Ateş", "Deniz", "Toprak"]
-    
-    sehirler = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Adana", 
-                "Konya", "Gaziantep", "Kayseri", "Mersin", "Eskişehir", "Trabzon",
-                "Samsun", "Diyarbakır", "Erzurum", "Van", "Malatya", "Şanlıurfa"]
     
-    ilceler = {
-        "İstanbul": ["Kadıköy", "Beşiktaş", "Şişli", "Üsküdar", "Beyoğlu", "Fatih", "Bakırköy"],
-        "Ankara": ["Çankaya", "Keçiören", "Yenimahalle", "Altındağ", "Mamak", "Etimesgut"],
-        "İzmir": ["Karşıyaka", "Bornova", "Konak", "Buca", "Bayraklı", "Çiğli"],
-        "Bursa": ["Osmangazi", "Yıldırım", "Nilüfer", "Gemlik", "İnegöl"],
-        "Antalya": ["Muratpaşa", "Konyaaltı", "Kepez", "Alanya", "Manavgat"]
-    }
-    
-    # TC'ye özel seçimler
-    ad = adlar[seed % len(adlar)]
-    soyad = soyadlar[(seed // 100) % len(soyadlar)]
-    sehir = sehirler[(seed // 10000) % len(sehirler)]
-    ilce = ilceler.get(sehir, ["Merkez"])[(seed // 1000) % len(ilceler.get(sehir, ["Merkez"]))]
+    # TC'ye özel seçimler (tablolar sozluk modülünde, import'ta bir kez kurulur)
+    ad = sozluk.ADLAR[seed % len(sozluk.ADLAR)]
+    soyad = sozluk.SOYADLAR[(seed // 100) % len(sozluk.SOYADLAR)]
+    sehir = sozluk.SEHIRLER[(seed // 10000) % len(sozluk.SEHIRLER)]
+    ilceler = sozluk.ILCELER.get(sehir, sozluk.ILCE_VARSAYILAN)
+    ilce = ilceler[(seed // 1000) % len(ilceler)]
     
     # Doğum yılı (1950-2005 arası)
     dogum_yili = 1950 + (seed % 56)
@@ -93,335 +172,567 @@ def tcden_kisi_uret(tc):
     telefon = f"05{((seed % 90) + 10):02d}{seed % 10000:04d}{seed % 10000:04d}"
     
     # Anne adı
-    anne_adlari = ["Fatma", "Ayşe", "Zeynep", "Emine", "Hatice", "Havva", "Meryem", "Şükran", "Gülşah"]
-    anne_adi = anne_adlari[seed % len(anne_adlari)]
+    anne_adi = sozluk.ANNE_ADLARI[seed % len(sozluk.ANNE_ADLARI)]
     
     # Baba adı
-    baba_adlari = ["Mehmet", "Ali", "Mustafa", "Hasan", "Hüseyin", "İbrahim", "Osman", "Ramazan", "Yusuf"]
-    baba_adi = baba_adlari[(seed // 100) % len(baba_adlari)]
-    
-    # Mahalle isimleri
-    mahalleler = ["Atatürk", "Cumhuriyet", "İstiklal", "Zafer", "Barış", "Şehitler", "Bahçelievler",
-                 "Yenişehir", "Çarşı", "Merkez", "Kültür", "Güzeltepe", "Çamlık", "Orhangazi"]
-    
-    mahalle = f"{mahalleler[seed % len(mahalleler)]} Mahallesi"
-    
-    random.seed()  # Seed'i sıfırla
-    
-    return {
-        "tc": tc,
-        "ad": ad,
-        "soyad": soyad,
-        "dogumTarihi": f"{dogum_gunu:02d}.{dogum_ayi:02d}.{dogum_yili}",
-        "dogumYeri": sehir,
-        "babaAdi": baba_adi,
-        "anneAdi": anne_adi,
-        "cinsiyet": cinsiyet,
-        "il": sehir,
-        "ilce": ilce,
-        "mahalle": mahalle,
-        "sokak": f"{['Atatürk', 'Cumhuriyet', 'İnönü', 'Fevzi Çakmak'][seed % 4]} Sokak",
-        "kapiNo": str((seed % 99) + 1),
-        "daireNo": str((seed % 20) + 1),
-        "telefon": telefon,
-        "_seed": seed  # Debug için
-    }
+    baba_adi = sozluk.BABA_ADLARI[(seed // 100) % len(sozluk.BABA_ADLARI)]
+    
+    # Mahalle
+    mahalle = f"{sozluk.MAHALLELER[seed % len(sozluk.MAHALLELER)]} Mahallesi"
+    
+    return KisiKaydi(
+        tc=tc,
+        ad=ad,
+        soyad=soyad,
+        dogumTarihi=f"{dogum_gunu:02d}.{dogum_ayi:02d}.{dogum_yili}",
+        dogumYeri=sehir,
+        babaAdi=baba_adi,
+        anneAdi=anne_adi,
+        cinsiyet=cinsiyet,
+        il=sehir,
+        ilce=ilce,
+        mahalle=mahalle,
+        sokak=f"{sozluk.SOKAKLAR[seed % 4]} Sokak",
+        kapiNo=str((seed % 99) + 1),
+        daireNo=str((seed % 20) + 1),
+        telefon=telefon,
+        _seed=seed,  # Debug için
+    )
 
 # ========== ORTAK FONKSİYONLAR ==========
 def kayit_bulunamadi():
-    return jsonify_utf8({
+    return app.response_class(bulunamadi_govdesi(girinti_istendi()), status=404, mimetype=JSON_MIMETYPE)
+
+# 404 gövdesi önceden kodlanır; yalnızca saniyelik zaman damgası yerleştirilir
+_BULUNAMADI_SABLONLARI = tuple(
+    YanitSablonu.olustur({
         "status": "error",
         "message": "Kayıt bulunamadı veya geçersiz TC kimlik numarası.",
+        "timestamp": None
+    }, ('timestamp',), lambda v, girintili=girintili: serilestirme.kodla(v, girintili=girintili))
+    for girintili in (False, True)
+)
+_bulunamadi_govdeleri = (None, ())  # (saniye, (sıkışık gövde, girintili gövde))
+
+def bulunamadi_govdesi(girintili):
+    """Bu saniyenin 404 gövdesi; zaman damgası saniye hassasiyetindedir"""
+    global _bulunamadi_govdeleri
+    saniye = int(time.time())
+    onbellek = _bulunamadi_govdeleri
+    if onbellek[0] != saniye:
+        damga = datetime.fromtimestamp(saniye).isoformat()
+        onbellek = _bulunamadi_govdeleri = (
+            saniye, tuple(s.birlestir((damga,), serilestirme.kodla) for s in _BULUNAMADI_SABLONLARI))
+    return onbellek[1][girintili]
+
+def servis_yogun(yeniden_dene):
+    """Kabul kontrolü reddi: 503"""
+    return _tekrar_dene_yaniti(503, "Servis şu anda yoğun, lütfen daha sonra tekrar deneyin.", yeniden_dene)
+
+def cok_fazla_istek(yeniden_dene):
+    """Hız sınırı reddi: 429"""
+    return _tekrar_dene_yaniti(429, "Çok fazla istek, lütfen daha sonra tekrar deneyin.", yeniden_dene)
+
+def _tekrar_dene_yaniti(durum, mesaj, yeniden_dene):
+    # Alan seçimi uygulanmaz; Retry-After saniye cinsinden
+    yanit = app.response_class(serilestirme.kodla({
+        "status": "error",
+        "message": mesaj,
         "timestamp": datetime.now().isoformat()
-    }), 404
+    }, girintili=girinti_istendi()), status=durum, mimetype=JSON_MIMETYPE)
+    yanit.headers['Retry-After'] = str(yeniden_dene)
+    return yanit
 
 def tarih_uret(tc, gun_fark=0):
     """TC'ye özel tarih üret"""
     seed = int(tc)
-    tarih = datetime(2023, (seed % 12) + 1, (seed % 28) + 1)
-    if gun_fark:
-        tarih = tarih - timedelta(days=gun_fark)
-    return tarih.strftime("%Y-%m-%d")
+    return baglam.tarih((seed % 12) + 1, (seed % 28) + 1, gun_fark)
 
 def tarih_saat_uret(tc):
     """TC'ye özel tarih-saat üret"""
-    seed = int(tc)
-    tarih = datetime(2023, (seed % 12) + 1, (seed % 28) + 1, 
-                    (seed % 24), (seed % 60), (seed % 60))
-    return tarih.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return baglam.tarih_saat(int(tc))
 
-# ========== API ENDPOINT'LERİ ==========
+def istek_baglami():
+    """Bu isteğin doğrulanmış TC bağlamı; TC geçersizse None.
+
+    Bağlam normalde ön işlemede kurulur; kancasız çağrılarda (ör. handler'ın
+    doğrudan ölçülmesi) ilk kullanımda kurulur.
+    """
+    kimlik = g.get('tc_baglami', _BAGLAM_YOK)
+    if kimlik is _BAGLAM_YOK:
+        tc = request.args.get('tc', '')
+        kimlik = g.tc_baglami = baglam.TCBaglami(tc) if tc_dogrula(tc) else None
+    return kimlik
+
+_BAGLAM_YOK = object()
+
+# ========== YANIT ÖNBELLEĞİ ==========
+def _simdi(bicim=None):
+    """Şu anki zamanı verilen strftime biçiminde (yoksa ISO) döndüren üretici"""
+    if bicim is None:
+        return lambda: datetime.now().isoformat()
+    return lambda: datetime.now().strftime(bicim)
+
+# Yanıtların saate bağlı alanları: uç nokta -> {alan: üretici}.
+# Bunların dışındaki her alan (uç nokta, tc) ikilisinin saf fonksiyonudur.
+ANLIK_ALANLAR = {
+    'asi_kayitlari': {'sorguTarihi': _simdi("%Y-%m-%d %H:%M:%S")},
+    'rontgen_listesi': {'sorguZamani': _simdi()},
+    'recete_gecmisi': {'sonSorgulama': _simdi("%d.%m.%Y %H:%M")},
+    'adli_sicil': {'verilisTarihi': _simdi("%d.%m.%Y")},
+    'kredi_risk': {'sorguTarihi': _simdi("%Y-%m-%d")},
+}
+
+# Üretim mantığı değiştiğinde artırılır; tüm istemci ETag'leri ve paylaşılan
+# önbellekte kalmış gövdeler geçersiz olur
+VERI_SURUMU = os.environ.get('NABI_VERI_SURUMU', '1')
+
+# Önceden kodlanmış yanıt gövdeleri; isabette üretim ve JSON kodlama atlanır
+yanit_onbellegi = YanitOnbellegi(
+    kapasite=int(os.environ.get('NABI_YANIT_ONBELLEK_KAPASITE', 8192)),
+    ttl=float(os.environ.get('NABI_YANIT_ONBELLEK_TTL', 0)),
+    bayt_butcesi=int(os.environ.get('NABI_YANIT_ONBELLEK_BAYT', 64 * 1024 * 1024)),
+    # Worker'lar arası paylaşılan ikinci seviye (NABI_PAYLASIMLI_BAYT > 0 ise)
+    paylasimli=paylasimli.ortamdan(surum=VERI_SURUMU)
+)
 
-@app.route('/api/v1/nufus/sorgu', methods=['GET'])
-def nufus_sorgu():
+# ========== KOŞULLU İSTEK (ETag) ==========
+# Anlık alanı olmayan uç noktaların gövdesi (uç nokta, tc) için hiç değişmez:
+# güçlü ETag alır ve istemcide önbelleğe alınabilir. Anlık alanı olanlar zayıf
+# ETag alır (saat alanı dışında eşdeğer) ve her kullanımda yeniden doğrulanır.
+CACHE_CONTROL_DETERMINISTIK = os.environ.get('NABI_CACHE_CONTROL', 'private, max-age=3600')
+CACHE_CONTROL_ANLIK = 'private, no-cache'
+
+def etag_hesapla(uc_nokta, tc, varyant=''):
+    """Gövdeyi üretmeden (uç nokta, tc, veri sürümü, varyant) için ETag değeri"""
+    anahtar = f"{uc_nokta}\0{tc}\0{VERI_SURUMU}\0{varyant}".encode('utf-8')
+    return hashlib.blake2b(anahtar, digest_size=12).hexdigest()
+
+def _dogrulayici_ekle(response, etag, uc_nokta):
+    response.set_etag(etag, weak=uc_nokta in ANLIK_ALANLAR)
+    response.headers['Cache-Control'] = CACHE_CONTROL[uc_nokta]
+    return response
+
+# ========== İSTEK ÖN İŞLEME ==========
+@app.before_request
+def _on_isleme():
+    """Geçerli TC'li API isteklerinde gecikme, 304 ve yanıt önbelleğini uygular.
+
+    Geçersiz TC'ler doğrudan handler'a bırakılır ve orada 404 alır.
+    """
+    olcum = g.olcum = metrik.Olcum(time.perf_counter())
+    uc_nokta = request.endpoint
+    if _ornekleyici is not None:
+        _ornekleyici.istek_basladi(uc_nokta or metrik.ESLESMEYEN)
+    if uc_nokta not in ONBELLEKLI_UC_NOKTALAR:
+        olcum.handler = time.perf_counter()
+        return None
+    # İstemci hız sınırı: TC doğrulamasından ve üretimden önce
+    if kota.sinirlayici is not None:
+        bekleme = request.environ.get(kota.ORTAM_ANAHTARI)
+        if bekleme is None:
+            bekleme = kota.sinirlayici.denetle(request.environ, uc_nokta)
+        if bekleme:
+            return cok_fazla_istek(bekleme)
     tc = request.args.get('tc', '')
-    
-    if not tc_dogrula(tc):
-        return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    medeni_haller = ["Bekar", "Evli", "Dul", "Boşanmış"]
-    
-    response = {
-        **kisi,
-        "medeniHal": medeni_haller[seed % len(medeni_haller)],
-        "postaKodu": f"34{(int(tc) % 900) + 100}",
-        "kayitTarihi": tarih_uret(tc, 2000),
-        "verildigiYer": f"{kisi['ilce']} Nüfus Müdürlüğü",
-        "seriNo": f"A{int(tc) % 100000:05d}",
-        "cuzdanNo": f"{int(tc) % 1000000:06d}",
-        "sonGuncelleme": tarih_saat_uret(tc),
-        "kayitDurumu": "Aktif",
-        "verilisNedeni": "İlk Nüfus Cüzdanı",
-        "kutukIl": kisi['il'],
-        "kutukIlce": kisi['ilce'],
-        "kutukMahalle": kisi['mahalle'],
-        "ulus": "T.C. Vatandaşı",
-        "dini": "İslam" if seed % 10 != 0 else "Belirtmek İstemiyor",
-        "kanGrubu": ["A Rh+", "A Rh-", "B Rh+", "B Rh-", "0 Rh+", "0 Rh-", "AB Rh+", "AB Rh-"][seed % 8]
-    }
-    return jsonify_utf8(response)
+    kimlik = g.tc_baglami = baglam.TCBaglami(tc) if tc_dogrula(tc) else None
+    simdi = time.perf_counter()
+    olcum.dogrulama = simdi - olcum.baslangic
+    if kimlik is None:
+        olcum.handler = simdi
+        return None
+
+    # Kabul kontrolü: sınırı dolu yavaş rota beklemeye girmeden 503 alır
+    kapi = kabul.kapilar.get(uc_nokta)
+    if kapi is not None:
+        onceki = request.environ.get(kabul.ORTAM_ANAHTARI)
+        if onceki is None:
+            neden, beklenen = kapi.gir()
+            olcum.kabul = beklenen
+            if neden is not None:
+                return servis_yogun(kapi.yeniden_dene)
+            g.kabul_kapisi = kapi
+        elif onceki is not True:
+            return servis_yogun(kapi.yeniden_dene)  # ASGI katmanında reddedildi
+        simdi = time.perf_counter()
+
+    # Simüle servis gecikmesi (ASGI modunda zaten beklenmişse atlanır)
+    if uc_nokta in gecikme.GECIKMELI_UC_NOKTALAR and not request.environ.get(gecikme.ORTAM_ANAHTARI):
+        gecikme.uygula(uc_nokta, tc, request.environ)
+        request.environ[gecikme.ORTAM_ANAHTARI] = True
+        onceki, simdi = simdi, time.perf_counter()
+        olcum.gecikme = simdi - onceki
+
+    girintili = girinti_istendi()
+    secim = alan_secimi()
+    secim_anahtari = secim.anahtar if secim is not None else ''
+    kodlama = sikistirma.kodlama_sec(request.headers.get('Accept-Encoding', ''))
+    g.kodlama = kodlama
+    # Güçlü ETag her temsil için farklı olmalı: girinti, alan seçimi ve içerik kodlaması dahil
+    etag = etag_hesapla(uc_nokta, tc, ('p' if girintili else 'c') + (kodlama or '')
+                        + (f"|{secim_anahtari}" if secim_anahtari else ''))
+    g.etag = etag
+    if request.if_none_match.contains_weak(etag):
+        return _dogrulayici_ekle(app.response_class(status=304), etag, uc_nokta)
+
+    if not yanit_onbellegi.etkin:
+        olcum.handler = time.perf_counter()
+        return None
+    anahtar = (tc, girintili, secim_anahtari)
+    sablon = yanit_onbellegi.getir(uc_nokta, anahtar)
+    if sablon is None:
+        g.yanit_onbellek_anahtari = anahtar
+        olcum.handler = time.perf_counter()
+        return None
+    g.yanit_sablonu = sablon
+    g.yanit_onbellek_isabet_anahtari = anahtar
+    t0 = time.perf_counter()
+    govde = _sablondan_govde(uc_nokta, sablon)
+    olcum.serilestirme += time.perf_counter() - t0
+    return app.response_class(govde, mimetype=JSON_MIMETYPE)
+
+def _sikistir(response, kodlama, sablon):
+    veri = _sikistirilmis(response.get_data(), kodlama, sablon)
+    if veri is not None:
+        response.set_data(veri)
+        response.headers['Content-Encoding'] = kodlama
+
+def _sikistirilmis(govde, kodlama, sablon):
+    """Gövdenin sıkıştırılmış hali; eşikten küçükse None"""
+    if len(govde) < sikistirma.ESIK:
+        return None
+    if sablon is not None and not sablon.alanlar:
+        # Sabit gövde: sıkıştırılmış hali şablonla birlikte önbellekte tutulur
+        return sablon.sikistirilmis_getir(kodlama, sikistirma.sikistir)
+    return sikistirma.sikistir(govde, kodlama)
+
+@app.after_request
+def _son_isleme(response):
+    olcum = g.get('olcum')
+    bitis_handler = time.perf_counter()
+    if 'kodlama' in g:
+        response.vary.add('Accept-Encoding')
+    if response.status_code == 200:
+        _basarili_yanit_isle(response, olcum)
+    if olcum is not None:
+        _metrik_kaydet(response, olcum, bitis_handler)
+    return response
+
+def _basarili_yanit_isle(response, olcum):
+    etag = g.get('etag')
+    if etag is not None:
+        _dogrulayici_ekle(response, etag, request.endpoint)
+    sablon = g.pop('yanit_sablonu', None)
+    kodlama = g.get('kodlama')
+    if kodlama is not None:
+        t0 = time.perf_counter()
+        _sikistir(response, kodlama, sablon)
+        if olcum is not None:
+            olcum.serilestirme += time.perf_counter() - t0
+    # Sıkıştırmadan sonra konur: yeni sıkıştırılmış kopya da paylaşılan önbelleğe gider
+    if sablon is not None:
+        anahtar = g.get('yanit_onbellek_anahtari')
+        if anahtar is not None:
+            yanit_onbellegi.koy(request.endpoint, anahtar, sablon)
+        elif sablon.kirli:
+            yanit_onbellegi.koy(request.endpoint, g.yanit_onbellek_isabet_anahtari, sablon)
+
+def _metrik_kaydet(response, olcum, bitis_handler):
+    asamalar = [('toplam', time.perf_counter() - olcum.baslangic)]
+    if olcum.dogrulama is not None:
+        asamalar.append(('dogrulama', olcum.dogrulama))
+    if olcum.kabul is not None:
+        asamalar.append(('kabul', olcum.kabul))
+    if olcum.gecikme is not None:
+        asamalar.append(('gecikme', olcum.gecikme))
+    if olcum.handler is not None:
+        # Handler içindeki JSON kodlama serileştirmeye yazıldığı için üretimden düşülür
+        uretim = bitis_handler - olcum.handler - olcum.serilestirme
+        asamalar.append(('uretim', max(uretim, 0.0)))
+    if olcum.serilestirme:
+        asamalar.append(('serilestirme', olcum.serilestirme))
+    boyut = 0 if response.is_streamed else response.calculate_content_length() or 0
+    metrik.kayitci.istek(request.endpoint or metrik.ESLESMEYEN, response.status_code, boyut, asamalar)
+
+# ========== METRİKLER ==========
+def _onbellek_sayaclari():
+    yield ('kisi', '', kisi_onbellegi.isabet, kisi_onbellegi.iska)
+    yield ('parca', '', parca_onbellegi.isabet, parca_onbellegi.iska)
+    for uc_nokta, s in yanit_onbellegi.istatistik()['ucNoktalar'].items():
+        yield ('yanit', uc_nokta, s['isabet'], s['iska'])
+    if yanit_onbellegi.paylasimli is not None:
+        yield ('paylasimli', '', yanit_onbellegi.paylasimli.isabet, yanit_onbellegi.paylasimli.iska)
+
+metrik.kayitci.onbellek_kaynagi_ekle(_onbellek_sayaclari)
+
+if kota.sinirlayici is not None:
+    metrik.kayitci.olcu_kaynagi_ekle(kota.olculer, kota.OLCU_TANIMLARI)
+
+# Kabul kontrolü (NABI_KABUL); kapalıyken kanca da metrik de eklenmez
+if kabul.kapilar:
+    metrik.kayitci.olcu_kaynagi_ekle(kabul.olculer, kabul.OLCU_TANIMLARI)
+
+    @app.teardown_request
+    def _kabul_birak(hata):
+        kapi = g.pop('kabul_kapisi', None)
+        if kapi is not None:
+            kapi.cik()
+
+@app.route('/metrics', methods=['GET'])
+def metrikler():
+    """Prometheus metin biçiminde metrikler (tüm worker'lar toplanmış)"""
+    return app.response_class(metrik.kayitci.prometheus(), mimetype=metrik.PROMETHEUS_MIMETYPE)
+
+# Sürekli açık örnekleyici (NABI_ORNEKLEYICI_HZ); yığınlar Flask.wsgi_app'te kesilir
+_ornekleyici = ornekleyici.kur(Flask.wsgi_app.__code__)
+if _ornekleyici is not None:
+    app.teardown_request(lambda hata: _ornekleyici.istek_bitti())
+    ornekleyici.sinyal_kur()
+
+# Yığın örnekleri iç yapıyı açığa çıkarır; anahtar verilmemişse uç nokta hiç kaydedilmez
+if _ornekleyici is not None and profil.ANAHTAR:
+    @app.route('/debug/ornekler', methods=['GET'])
+    def ornekler():
+        """Bu worker'ın biriken örnekleri (collapsed); ?sifirla=1, ?rota=<endpoint>"""
+        if not hmac.compare_digest(request.headers.get('X-Nabi-Profil', ''), profil.ANAHTAR):
+            return app.response_class('Yetkisiz\n', status=403, mimetype='text/plain')
+        metin = _ornekleyici.collapsed(request.args.get('rota') or None,
+                                       sifirla=request.args.get('sifirla', '') not in ('', '0', 'false'))
+        return app.response_class(metin, mimetype='text/plain')
+
+# ========== BİLDİRİMSEL UÇ NOKTALAR ==========
+# uç nokta -> tanim.Tanim; alanları ve bağımlılıkları başlangıçta bilinir
+TANIMLAR = {}
+
+def tanimli_rota(yol, uc_nokta, alanlar, ara=None):
+    """Alan tanımından derlenmiş handler'ı kaydeder (bkz. tanim.py).
+
+    TC doğrulama, kişi kaydı ve yazım tüm tanımlı uç noktalarda bu tek yoldan
+    geçer; alan seçimi varsa yalnızca istenen alanlar üretilir.
+    """
+    t = TANIMLAR[uc_nokta] = tanim.Tanim(uc_nokta, alanlar, ara)
+    uret = t.uret
+
+    def handler():
+        kimlik = istek_baglami()
+        if kimlik is None:
+            return kayit_bulunamadi()
+        kisi = tcden_kisi_uret(kimlik.tc)
+        secim = alan_secimi()
+        if secim is not None:
+            return jsonify_utf8({**kisi, **t.secimli(secim)(kimlik, kisi, kimlik.seed)})
+        if girinti_istendi():
+            return jsonify_utf8({**kisi, **uret(kimlik, kisi, kimlik.seed)})
+        return _json_yaniti(uret(kimlik, kisi, kimlik.seed), False, onek=kisi.parca)
+
+    handler.__name__ = handler.__qualname__ = uc_nokta
+    app.add_url_rule(yol, uc_nokta, handler, methods=['GET'])
+    return t
+
+# ========== API ENDPOINT'LERİ ==========
+
+tanimli_rota('/api/v1/nufus/sorgu', 'nufus_sorgu', {
+    "medeniHal": lambda seed: sozluk.MEDENI_HALLER[seed % len(sozluk.MEDENI_HALLER)],
+    "postaKodu": lambda seed: f"34{(seed % 900) + 100}",
+    "kayitTarihi": lambda kimlik: kimlik.tarih(2000),
+    "verildigiYer": lambda kisi: f"{kisi.ilce} Nüfus Müdürlüğü",
+    "seriNo": lambda seed: f"A{seed % 100000:05d}",
+    "cuzdanNo": lambda seed: f"{seed % 1000000:06d}",
+    "sonGuncelleme": lambda kimlik: kimlik.tarih_saat(),
+    "kayitDurumu": "Aktif",
+    "verilisNedeni": "İlk Nüfus Cüzdanı",
+    "kutukIl": lambda kisi: kisi.il,
+    "kutukIlce": lambda kisi: kisi.ilce,
+    "kutukMahalle": lambda kisi: kisi.mahalle,
+    "ulus": "T.C. Vatandaşı",
+    "dini": lambda seed: "İslam" if seed % 10 != 0 else "Belirtmek İstemiyor",
+    "kanGrubu": lambda seed: sozluk.KAN_GRUPLARI[seed % 8]
+})
 
 @app.route('/api/v1/saglik/asi-kayitlari', methods=['GET'])
 def asi_kayitlari():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    asi_turleri = [
-        "COVID-19 (BioNTech)", "COVID-19 (Sinovac)", "Tetanoz", 
-        "Hepatit B", "Grip Aşısı", "Kızamık-Kabakulak-Kızamıkçık",
-        "Suçiçeği", "Zatürre (Pnömokok)", "HPV Aşısı", "Menenjit Aşısı",
-        "Kuduz Aşısı", "Tüberküloz Aşısı (BCG)"
-    ]
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     # TC'ye özel aşı kayıtları
     asi_sayisi = (seed % 5) + 3  # 3-7 arası aşı
     asi_kayitlari = []
     
-    for i in range(asi_sayisi):
-        asi_adi = asi_turleri[(seed + i*7) % len(asi_turleri)]
-        asi_kayitlari.append({
-            "asiAdi": asi_adi,
-            "doz": (i % 3) + 1,
-            "tarih": tarih_uret(tc, (i+1)*45),
-            "saglikMerkezi": f"{kisi['il']} Aile Sağlığı Merkezi",
-            "lotNo": f"LOT{(seed + i) % 10000:04d}",
-            "uygulayan": f"Dr. {['Ahmet', 'Mehmet', 'Ayşe', 'Fatma'][(seed+i) % 4]} {['Yılmaz', 'Kaya', 'Demir', 'Çelik'][(seed+i) % 4]}",
-            "uygulamaYeri": ["Sol Kol", "Sağ Kol", "Kalçadan"][(seed+i) % 3],
-            "saglikPersonelNo": f"SH{(seed + i) % 10000:05d}"
-        })
+    if alan_istendi('asiKayitlari', 'sonAsiTarihi'):
+        for i in range(asi_sayisi):
+            asi_adi = sozluk.ASI_TURLERI[(seed + i*7) % len(sozluk.ASI_TURLERI)]
+            asi_kayitlari.append({
+                "asiAdi": asi_adi,
+                "doz": (i % 3) + 1,
+                "tarih": kimlik.tarih((i+1)*45),
+                "saglikMerkezi": f"{kisi.il} Aile Sağlığı Merkezi",
+                "lotNo": f"LOT{(seed + i) % 10000:04d}",
+                "uygulayan": f"Dr. {sozluk.ASI_UYGULAYAN_ADLARI[(seed+i) % 4]} {sozluk.ASI_UYGULAYAN_SOYADLARI[(seed+i) % 4]}",
+                "uygulamaYeri": sozluk.ASI_UYGULAMA_YERLERI[(seed+i) % 3],
+                "saglikPersonelNo": f"SH{(seed + i) % 10000:05d}"
+            })
     
     response = {
-        **kisi,
         "asiKayitlari": asi_kayitlari,
         "toplamAsiSayisi": asi_sayisi,
         "sonAsiTarihi": asi_kayitlari[-1]["tarih"] if asi_kayitlari else None,
         "asiKartNo": f"AS{seed % 100000:06d}",
-        "sorguTarihi": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "sorguTarihi": ANLIK_ALANLAR['asi_kayitlari']['sorguTarihi'](),
         "saglikGuvencesi": "Genel Sağlık Sigortası",
-        "aileHekimi": f"Dr. {['Ali', 'Veli', 'Zeynep', 'Elif'][seed % 4]} {['Yıldız', 'Şahin', 'Arslan'][seed % 3]}",
+        "aileHekimi": f"Dr. {sozluk.AILE_HEKIMI_ADLARI[seed % 4]} {sozluk.AILE_HEKIMI_SOYADLARI[seed % 3]}",
         "aileHekimiTel": f"0{((seed % 90) + 10):02d} {((seed % 900) + 100):03d} {seed % 10000:04d}",
         "asiTakipSistemi": "Merkezi Aşı Takip Sistemi (MATS)",
         "uyari": "Bir sonraki aşı tarihiniz için aile hekiminize başvurunuz."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
 
 @app.route('/api/v1/saglik/rontgen-listesi', methods=['GET'])
 def rontgen_listesi():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    # Gerçekçi gecikme
-    time.sleep(random.uniform(0.2, 0.7))
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    tetkik_turleri = [
-        "Akciğer Röntgeni (PA)", "Akciğer Röntgeni (Lateral)",
-        "Batın Grafisi", "El Bileği Röntgeni", "Ayak Bileği Röntgeni",
-        "Beyin MR", "Bel MR", "Diz MR", "Boyun MR", "Kalp EKO",
-        "Karın USG", "Tiroid USG", "Mamografi", "Diş Panoramik Röntgen"
-    ]
-    
-    sonuclar = [
-        "Normal sınırlarda", "Minimal patoloji", "Hafif dejeneratif değişiklikler",
-        "Akciğer parankim alanlarında minimal fibrotik değişiklikler",
-        "Kemik yapılarda osteoporotik değişiklikler",
-        "Patoloji saptanmadı", "Hafif osteoartrit bulguları",
-        "Minimal plevral kalınlaşma", "Normal anatomik yapı"
-    ]
-    
-    hastaneler = [
-        f"{kisi['il']} Eğitim ve Araştırma Hastanesi",
-        f"Özel {kisi['il']} Medicalpark Hastanesi",
-        f"{kisi['il']} Devlet Hastanesi",
-        f"{kisi['il']} Üniversitesi Hastanesi",
-        f"{kisi['il']} Şehir Hastanesi",
-        f"Özel {kisi['il']} Anadolu Hastanesi"
-    ]
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     tetkik_sayisi = (seed % 4) + 2  # 2-5 tetkik
     tetkikler = []
     
-    for i in range(tetkik_sayisi):
-        tetkik_turu = tetkik_turleri[(seed + i*11) % len(tetkik_turleri)]
-        doktor_adi = ['Ali', 'Veli', 'Ayşe', 'Fatma', 'Zeynep', 'Mehmet'][(seed+i) % 6]
-        doktor_soyadi = ['Yıldız', 'Şahin', 'Demir', 'Çelik', 'Arslan', 'Koç'][(seed+i) % 6]
+    if alan_istendi('tetkikler', 'sonTetkikTarihi'):
+        for i in range(tetkik_sayisi):
+            tetkik_turu = sozluk.TETKIK_TURLERI[(seed + i*11) % len(sozluk.TETKIK_TURLERI)]
+            doktor_adi = sozluk.RADYOLOG_ADLARI[(seed+i) % 6]
+            doktor_soyadi = sozluk.RADYOLOG_SOYADLARI[(seed+i) % 6]
         
-        tetkikler.append({
-            "tetkikId": f"TET-2023-{seed % 10000:04d}{i}",
-            "tetkikTuru": tetkik_turu,
-            "tarih": tarih_uret(tc, (i+1)*60),
-            "saat": f"{(seed % 12) + 8:02d}:{seed % 60:02d}",
-            "sonuc": sonuclar[(seed + i*13) % len(sonuclar)],
-            "aciklama": f"{kisi['ad']} {kisi['soyad']} için yapılan {tetkik_turu.lower()} tetkiki normal sınırlardadır.",
-            "kurum": hastaneler[(seed + i*17) % len(hastaneler)],
-            "doktor": f"Dr. {doktor_adi} {doktor_soyadi}",
-            "doktorBrans": ["Radyoloji", "Nöroradyoloji", "Ortopedi", "Kardiyoloji", "Genel Cerrahi"][(seed+i) % 5],
-            "bolum": ["Radyoloji", "Görüntüleme Merkezi", "MR Ünitesi", "Tomografi Ünitesi"][(seed+i) % 4],
-            "goruntuNo": f"IMG-{(seed + i) % 1000000:06d}",
-            "raporNo": f"RAP-2023-{(seed + i) % 10000:04d}",
-            "isteyenDoktor": f"Dr. {['Ahmet', 'Mehmet', 'Ayşe'][(seed+i) % 3]} {['Yılmaz', 'Kaya'][(seed+i) % 2]}",
-            "tetkikNotu": "Tetkik hastanın onamı alınarak yapılmıştır."
-        })
+            tetkikler.append({
+                "tetkikId": f"TET-2023-{seed % 10000:04d}{i}",
+                "tetkikTuru": tetkik_turu,
+                "tarih": kimlik.tarih((i+1)*60),
+                "saat": f"{(seed % 12) + 8:02d}:{seed % 60:02d}",
+                "sonuc": sozluk.TETKIK_SONUCLARI[(seed + i*13) % len(sozluk.TETKIK_SONUCLARI)],
+                "aciklama": f"{kisi.ad} {kisi.soyad} için yapılan {tetkik_turu.lower()} tetkiki normal sınırlardadır.",
+                "kurum": sozluk.HASTANE_KALIPLARI[(seed + i*17) % len(sozluk.HASTANE_KALIPLARI)].format_map(kisi),
+                "doktor": f"Dr. {doktor_adi} {doktor_soyadi}",
+                "doktorBrans": sozluk.TETKIK_BRANSLARI[(seed+i) % 5],
+                "bolum": sozluk.TETKIK_BOLUMLERI[(seed+i) % 4],
+                "goruntuNo": f"IMG-{(seed + i) % 1000000:06d}",
+                "raporNo": f"RAP-2023-{(seed + i) % 10000:04d}",
+                "isteyenDoktor": f"Dr. {sozluk.ISTEYEN_DOKTOR_ADLARI[(seed+i) % 3]} {sozluk.ISTEYEN_DOKTOR_SOYADLARI[(seed+i) % 2]}",
+                "tetkikNotu": "Tetkik hastanın onamı alınarak yapılmıştır."
+            })
     
     response = {
-        **kisi,
         "hastaNo": f"HST-{seed % 10000:04d}",
         "tetkikler": tetkikler,
         "toplamTetkik": tetkik_sayisi,
         "sonTetkikTarihi": tetkikler[-1]["tarih"] if tetkikler else None,
         "raporDurumu": "Tüm raporlar tamamlandı",
-        "saglikKurumu": hastaneler[seed % len(hastaneler)],
-        "sorguZamani": datetime.now().isoformat(),
+        "saglikKurumu": sozluk.HASTANE_KALIPLARI[seed % len(sozluk.HASTANE_KALIPLARI)].format_map(kisi),
+        "sorguZamani": ANLIK_ALANLAR['rontgen_listesi']['sorguZamani'](),
         "saglikBilgiSistemi": "Merkezi Hastane Randevu Sistemi (MHRS)",
         "uyari": "Raporlarınızı saklayınız, kontrol için yanınızda bulundurunuz."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
+
+@parca_onbellegi.kalintili
+def _recete_ilaclari(ilk, adet):
+    return tuple(sozluk.ILACLAR[(ilk + j) % len(sozluk.ILACLAR)] for j in range(adet))
 
 @app.route('/api/v1/eczane/recete-gecmisi', methods=['GET'])
 def recete_gecmisi():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    ilaclar = [
-        {"ad": "PAROL 500 mg", "kutu": "20 tablet", "kullanim": "Günde 3x1", "etkenMadde": "Parasetamol"},
-        {"ad": "MAJEZİK", "kutu": "12 tablet", "kullanim": "Gerektiğinde 1", "etkenMadde": "Tiyoprofenik asit"},
-        {"ad": "VENTOLİN 100 mcg", "kutu": "200 doz", "kullanim": "Günde 2x2", "etkenMadde": "Salbutamol"},
-        {"ad": "CORASPİN 100 mg", "kutu": "30 tablet", "kullanim": "Günde 1x1", "etkenMadde": "Asetilsalisilik asit"},
-        {"ad": "ATECOR 10 mg", "kutu": "28 tablet", "kullanim": "Günde 1x1", "etkenMadde": "Atorvastatin"},
-        {"ad": "CRESTOR 20 mg", "kutu": "28 tablet", "kullanim": "Günde 1x1", "etkenMadde": "Rosuvastatin"},
-        {"ad": "ARVELES 25 mg", "kutu": "20 tablet", "kullanim": "Gerektiğinde 1", "etkenMadde": "Dexketoprofen"},
-        {"ad": "AUGMENTİN 1g", "kutu": "14 tablet", "kullanim": "Günde 2x1", "etkenMadde": "Amoksisilin/Klavulanat"},
-        {"ad": "ZİNCO 15 mg", "kutu": "30 kapsül", "kullanim": "Günde 1x1", "etkenMadde": "Çinko"},
-        {"ad": "BEREKET VİTAMİN", "kutu": "30 tablet", "kullanim": "Günde 1x1", "etkenMadde": "Multivitamin"}
-    ]
-    
-    eczaneler = [
-        f"{kisi['ilce']} Merkez Eczanesi",
-        f"{kisi['ilce']} Sağlık Eczanesi",
-        f"{kisi['ilce']} 24 Saat Eczanesi",
-        f"{kisi['il']} Eczanesi",
-        f"{kisi['mahalle']} Eczanesi",
-        f"Özel {kisi['ilce']} Eczanesi"
-    ]
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     recete_sayisi = (seed % 4) + 2  # 2-5 reçete
     receteler = []
     toplam_tutar = 0
     
-    for i in range(recete_sayisi):
-        ilac_sayisi = (seed % 3) + 2  # 2-4 ilaç
-        secilen_ilaclar = [ilaclar[(seed + i*7 + j) % len(ilaclar)] for j in range(ilac_sayisi)]
+    if alan_istendi('receteler', 'toplamHarcama', 'sgkToplamKatki', 'hastaToplamKatki'):
+        for i in range(recete_sayisi):
+            ilac_sayisi = (seed % 3) + 2  # 2-4 ilaç
+            secilen_ilaclar = _recete_ilaclari((seed + i*7) % len(sozluk.ILACLAR), ilac_sayisi)
         
-        recete_tutar = sum([((seed + i + j) % 50) + 20 for j in range(ilac_sayisi)])
-        toplam_tutar += recete_tutar
+            recete_tutar = sum([((seed + i + j) % 50) + 20 for j in range(ilac_sayisi)])
+            toplam_tutar += recete_tutar
         
-        doktor_brans = ["Dahiliye", "Kardiyoloji", "Genel Cerrahi", "Aile Hekimliği", "Kulak Burun Boğaz", "Göz Hastalıkları"][(seed+i) % 6]
+            doktor_brans = sozluk.RECETE_BRANSLARI[(seed+i) % 6]
         
-        receteler.append({
-            "receteNo": f"2023-{seed % 1000000:06d}{i}",
-            "tarih": tarih_uret(tc, (i+1)*45),
-            "durum": "Kullanıldı",
-            "doktor": {
-                "adi": f"Dr. {['Ahmet', 'Mehmet', 'Ayşe', 'Fatma', 'Zeynep'][(seed+i) % 5]}",
-                "soyadi": ["Yılmaz", "Kaya", "Demir", "Çelik", "Şahin"][(seed+i) % 5],
-                "uzmanlik": doktor_brans,
-                "hastane": f"{kisi['il']} {doktor_brans} Hastanesi",
-                "sicilNo": f"DR-{(seed + i) % 10000:05d}"
-            },
-            "ilaclar": secilen_ilaclar,
-            "eczane": {
-                "adi": eczaneler[(seed + i*11) % len(eczaneler)],
-                "telefon": f"0{((seed % 90) + 10):02d} {((seed % 900) + 100):03d} {(seed + i) % 10000:04d}",
-                "adres": f"{kisi['ilce']} {kisi['mahalle']} Sokak No:{((seed + i) % 50) + 1}",
-                "eczaci": f"Ecz. {['Ali', 'Veli', 'Ayşe'][(seed+i) % 3]} {['Yıldız', 'Kaya'][(seed+i) % 2]}",
-                "eczaciSicilNo": f"ECZ-{(seed + i) % 10000:05d}"
-            },
-            "toplamTutar": f"{recete_tutar:.2f} TL",
-            "sgkKatki": f"{(recete_tutar * 0.7):.2f} TL",
-            "hastaKatki": f"{(recete_tutar * 0.3):.2f} TL",
-            "receteTipi": ["Normal", "Yeşil", "Kırmızı", "Turuncu"][(seed+i) % 4],
-            "teslimTarihi": tarih_uret(tc, (i+1)*45 - 1),
-            "receteBarkod": f"RB{(seed + i) % 100000000000:012d}"
-        })
+            receteler.append({
+                "receteNo": f"2023-{seed % 1000000:06d}{i}",
+                "tarih": kimlik.tarih((i+1)*45),
+                "durum": "Kullanıldı",
+                "doktor": {
+                    "adi": f"Dr. {sozluk.RECETE_DOKTOR_ADLARI[(seed+i) % 5]}",
+                    "soyadi": sozluk.RECETE_DOKTOR_SOYADLARI[(seed+i) % 5],
+                    "uzmanlik": doktor_brans,
+                    "hastane": f"{kisi.il} {doktor_brans} Hastanesi",
+                    "sicilNo": f"DR-{(seed + i) % 10000:05d}"
+                },
+                "ilaclar": secilen_ilaclar,
+                "eczane": {
+                    "adi": sozluk.ECZANE_KALIPLARI[(seed + i*11) % len(sozluk.ECZANE_KALIPLARI)].format_map(kisi),
+                    "telefon": f"0{((seed % 90) + 10):02d} {((seed % 900) + 100):03d} {(seed + i) % 10000:04d}",
+                    "adres": f"{kisi.ilce} {kisi.mahalle} Sokak No:{((seed + i) % 50) + 1}",
+                    "eczaci": f"Ecz. {sozluk.ECZACI_ADLARI[(seed+i) % 3]} {sozluk.ECZACI_SOYADLARI[(seed+i) % 2]}",
+                    "eczaciSicilNo": f"ECZ-{(seed + i) % 10000:05d}"
+                },
+                "toplamTutar": f"{recete_tutar:.2f} TL",
+                "sgkKatki": f"{(recete_tutar * 0.7):.2f} TL",
+                "hastaKatki": f"{(recete_tutar * 0.3):.2f} TL",
+                "receteTipi": sozluk.RECETE_TIPLERI[(seed+i) % 4],
+                "teslimTarihi": kimlik.tarih((i+1)*45 - 1),
+                "receteBarkod": f"RB{(seed + i) % 100000000000:012d}"
+            })
     
     response = {
-        **kisi,
         "receteler": receteler,
         "sonUcAyReceteSayisi": recete_sayisi,
         "toplamHarcama": f"{toplam_tutar:.2f} TL",
         "sgkToplamKatki": f"{(toplam_tutar * 0.7):.2f} TL",
         "hastaToplamKatki": f"{(toplam_tutar * 0.3):.2f} TL",
-        "sonSorgulama": datetime.now().strftime("%d.%m.%Y %H:%M"),
+        "sonSorgulama": ANLIK_ALANLAR['recete_gecmisi']['sonSorgulama'](),
         "saglikGuvencesi": "SGK (Genel Sağlık Sigortası)",
         "receteTakipNo": f"RT{seed % 100000000:09d}",
         "uyari": "Reçetelerinizi saklayınız, ilaçlarınızı doktorunuzun önerdiği şekilde kullanınız."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
 
 @app.route('/api/v1/adli-sicil/kayit', methods=['GET'])
 def adli_sicil():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    time.sleep(random.uniform(0.4, 1.0))
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     # TC son rakamına göre sicil durumu
-    if int(tc[-1]) % 3 == 0:
+    if kimlik.rakamlar[-1] % 3 == 0:
         durum = "TEMİZ"
         aciklama = "Herhangi bir mahkumiyet kaydı bulunmamaktadır."
         kayitlar = []
-    elif int(tc[-1]) % 3 == 1:
+    elif kimlik.rakamlar[-1] % 3 == 1:
         durum = "KAYITLI (Hafif)"
         aciklama = "Küçük trafik cezaları mevcuttur."
         kayitlar = [{
             "tip": "Trafik Cezası",
-            "tarih": tarih_uret(tc, 180),
+            "tarih": kimlik.tarih(180),
             "aciklama": "Hız sınırı ihlali - 25 km/h fazla",
             "ceza": "350 TL",
             "durum": "Ödendi",
-            "mahkeme": f"{kisi['il']} Trafik Mahkemesi",
+            "mahkeme": f"{kisi.il} Trafik Mahkemesi",
             "dosyaNo": f"2023/TF-{seed % 1000:04d}"
         }]
     else:
@@ -430,37 +741,37 @@ def adli_sicil():
         kayitlar = [
             {
                 "tip": "Trafik Cezası",
-                "tarih": tarih_uret(tc, 120),
+                "tarih": kimlik.tarih(120),
                 "aciklama": "Park yasağı ihlali",
                 "ceza": "150 TL",
                 "durum": "Ödendi",
-                "mahkeme": f"{kisi['il']} Trafik Mahkemesi",
+                "mahkeme": f"{kisi.il} Trafik Mahkemesi",
                 "dosyaNo": f"2023/TF-{(seed + 1) % 1000:04d}"
             },
             {
                 "tip": "Kabahat",
-                "tarih": tarih_uret(tc, 300),
+                "tarih": kimlik.tarih(300),
                 "aciklama": "Gürültü yapma",
                 "ceza": "250 TL",
                 "durum": "Ödendi",
-                "mahkeme": f"{kisi['ilce']} Sulh Ceza Mahkemesi",
+                "mahkeme": f"{kisi.ilce} Sulh Ceza Mahkemesi",
                 "dosyaNo": f"2022/KB-{seed % 1000:04d}"
             }
         ]
     
     sorgu_gecmisi = []
-    if seed % 2 == 0:
+    if seed % 2 == 0 and alan_istendi('sorguGecmisi'):
         sorgu_gecmisi.append({
-            "tarih": tarih_uret(tc, 90),
+            "tarih": kimlik.tarih(90),
             "amac": "İş başvurusu",
-            "sorgulayan": f"{['ABC', 'XYZ', 'TECH', 'GLOBAL'][seed % 4]} Şirketi",
+            "sorgulayan": f"{sozluk.SORGULAYAN_SIRKETLER[seed % 4]} Şirketi",
             "sonuc": "Olumlu",
             "sorguKodu": f"SORG-2023-{seed % 1000:03d}"
         })
     
-    if seed % 3 == 0:
+    if seed % 3 == 0 and alan_istendi('sorguGecmisi'):
         sorgu_gecmisi.append({
-            "tarih": tarih_uret(tc, 180),
+            "tarih": kimlik.tarih(180),
             "amac": "Vize başvurusu",
             "sorgulayan": "Almanya Konsolosluğu",
             "sonuc": "Olumlu",
@@ -468,123 +779,103 @@ def adli_sicil():
         })
     
     response = {
-        **kisi,
-        "sicilNo": f"ADS-{kisi['il'][:3].upper()}-2023-{seed % 1000:03d}",
+        "sicilNo": f"ADS-{kisi.il[:3].upper()}-2023-{seed % 1000:03d}",
         "kayitDurumu": durum,
         "aciklama": aciklama,
         "kayitlar": kayitlar,
         "sorguGecmisi": sorgu_gecmisi,
-        "sonSorguTarihi": tarih_uret(tc, seed % 30),
-        "sorguMercii": f"{kisi['il']} Adli Sicil ve İstatistik Müdürlüğü",
+        "sonSorguTarihi": kimlik.tarih(seed % 30),
+        "sorguMercii": f"{kisi.il} Adli Sicil ve İstatistik Müdürlüğü",
         "belgeNo": f"2023/BS-{seed % 10000:04d}",
         "gecerlilikSuresi": "90 gün",
-        "verilisTarihi": datetime.now().strftime("%d.%m.%Y"),
+        "verilisTarihi": ANLIK_ALANLAR['adli_sicil']['verilisTarihi'](),
         "sistemMesaji": "Bu belge elektronik imza ile onaylanmıştır.",
-        "guvenlikKodu": f"GKO-{hashlib.md5(tc.encode()).hexdigest()[:8].upper()}",
+        "guvenlikKodu": f"GKO-{hashlib.md5(kimlik.tc.encode()).hexdigest()[:8].upper()}",
         "uyari": "Bu belge resmi kurumlarca 90 gün süreyle geçerlidir."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
 
 @app.route('/api/v1/pasaport/sorgu', methods=['GET'])
 def pasaport_sorgu():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     # Pasaport tipi belirleme
-    pasaport_tipleri = [
-        {"tip": "Umuma Mahsus (Bordo)", "kod": "P"},
-        {"tip": "Hususi (Yeşil)", "kod": "G"},
-        {"tip": "Hizmet (Gri)", "kod": "S"},
-        {"tip": "Diplomatik (Siyah)", "kod": "D"}
-    ]
-    
-    secilen_tip = pasaport_tipleri[seed % len(pasaport_tipleri)]
+    secilen_tip = sozluk.PASAPORT_TIPLERI[seed % len(sozluk.PASAPORT_TIPLERI)]
     
     # Seyahat geçmişi
-    ulkeler = ["Almanya", "Fransa", "Hollanda", "İtalya", "İspanya", "Yunanistan", "ABD", "İngiltere", "Japonya"]
-    sehirler = ["Berlin", "Paris", "Amsterdam", "Roma", "Barcelona", "Atina", "New York", "Londra", "Tokyo"]
-    
     seyahat_sayisi = (seed % 4) + 1  # 1-4 seyahat
     seyahat_kayitlari = []
     
-    for i in range(seyahat_sayisi):
-        ulke = ulkeler[(seed + i*5) % len(ulkeler)]
-        seyahat_kayitlari.append({
-            "ulke": ulke,
-            "giris": tarih_uret(tc, (i+1)*90),
-            "cikis": tarih_uret(tc, (i+1)*90 - 7),
-            "sehir": sehirler[(seed + i*5) % len(sehirler)],
-            "amac": ["Turizm", "İş", "Eğitim", "Aile Ziyareti"][(seed+i) % 4],
-            "sure": "7 gün"
-        })
+    if alan_istendi('seyahatKayitlari'):
+        for i in range(seyahat_sayisi):
+            ulke = sozluk.ULKELER[(seed + i*5) % len(sozluk.ULKELER)]
+            seyahat_kayitlari.append({
+                "ulke": ulke,
+                "giris": kimlik.tarih((i+1)*90),
+                "cikis": kimlik.tarih((i+1)*90 - 7),
+                "sehir": sozluk.YURTDISI_SEHIRLER[(seed + i*5) % len(sozluk.YURTDISI_SEHIRLER)],
+                "amac": sozluk.SEYAHAT_AMACLARI[(seed+i) % 4],
+                "sure": "7 gün"
+            })
     
     # Vize bilgileri
     vize_bilgileri = []
-    if seed % 3 != 0:  # %66 ihtimal vize
-        vize_ulkeler = ["ABD", "İngiltere", "Kanada", "Avustralya", "Japonya", "Çin"]
+    if seed % 3 != 0 and alan_istendi('vizeBilgileri'):  # %66 ihtimal vize
         vize_bilgileri.append({
-            "ulke": vize_ulkeler[seed % len(vize_ulkeler)],
-            "tip": ["B1/B2", "Turist", "Öğrenci", "İş"][seed % 4],
-            "baslangic": tarih_uret(tc, 200),
-            "bitis": tarih_uret(tc, -365*5),  # 5 yıl sonra
+            "ulke": sozluk.VIZE_ULKELERI[seed % len(sozluk.VIZE_ULKELERI)],
+            "tip": sozluk.VIZE_TIPLERI[seed % 4],
+            "baslangic": kimlik.tarih(200),
+            "bitis": kimlik.tarih(-365*5),  # 5 yıl sonra
             "durum": "Aktif",
             "vizeNo": f"VZ{seed % 100000000:09d}",
             "girisHakki": "Çoklu giriş"
         })
     
     response = {
-        **kisi,
         "pasaportNo": f"{secilen_tip['kod']}{seed % 100000000:08d}",
         "tip": secilen_tip["tip"],
-        "verilisTarihi": tarih_uret(tc, 300),
-        "sonGecerlilikTarihi": tarih_uret(tc, -365*5),  # 5 yıl ileri
-        "verilenYer": f"{kisi['il']} İl Göç İdaresi Müdürlüğü",
-        "verenAmir": f"Şube Müdürü {['Ahmet', 'Mehmet', 'Ayşe'][seed % 3]} {['Yılmaz', 'Kaya'][seed % 2]}",
+        "verilisTarihi": kimlik.tarih(300),
+        "sonGecerlilikTarihi": kimlik.tarih(-365*5),  # 5 yıl ileri
+        "verilenYer": f"{kisi.il} İl Göç İdaresi Müdürlüğü",
+        "verenAmir": f"Şube Müdürü {sozluk.AMIR_ADLARI[seed % 3]} {sozluk.AMIR_SOYADLARI[seed % 2]}",
         "durum": "AKTİF",
         "seyahatKayitlari": seyahat_kayitlari,
         "vizeBilgileri": vize_bilgileri,
         "toplamSeyahat": seyahat_sayisi,
         "kayipCaldirmaDurumu": "Yok",
         "kayipCaldirmaTarihi": None,
-        "sonGuncelleme": tarih_saat_uret(tc),
+        "sonGuncelleme": kimlik.tarih_saat(),
         "pasaportSeriNo": f"PS{seed % 100000:06d}",
         "uyruk": "T.C.",
         "davetliUlke": None,
         "pasaportResimNo": f"PR{(seed % 1000000):06d}",
         "uyari": "Pasaportunuzun geçerlilik süresini takip ediniz."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
+
+@parca_onbellegi.kalintili
+def _ehliyet_siniflari(ilk, adet):
+    return tuple(sozluk.EHLIYET_SINIFLARI[(ilk + i) % len(sozluk.EHLIYET_SINIFLARI)] for i in range(adet))
 
 @app.route('/api/v1/ehliyet/sorgu', methods=['GET'])
 def ehliyet_sorgu():
-    tc = request.args.get('tc', '')
+    kimlik = istek_baglami()
     
-    if not tc_dogrula(tc):
+    if kimlik is None:
         return kayit_bulunamadi()
     
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    siniflar = [
-        {"kod": "A1", "aciklama": "Motor (125 cc'ye kadar)"},
-        {"kod": "A2", "aciklama": "Motor (35 kW'ya kadar)"},
-        {"kod": "B", "aciklama": "Otomobil, Kamyonet"},
-        {"kod": "C", "aciklama": "Kamyon"},
-        {"kod": "D", "aciklama": "Otobüs"},
-        {"kod": "E", "aciklama": "Römorklu Araçlar"},
-        {"kod": "F", "aciklama": "Traktör"}
-    ]
+    kisi = tcden_kisi_uret(kimlik.tc)
+    seed = kimlik.seed
     
     # TC'ye özel sınıflar seç
     secilen_sinif_sayisi = (seed % 3) + 1  # 1-3 sınıf
-    secilen_siniflar = [sinifler[(seed + i) % len(siniflar)] for i in range(secilen_sinif_sayisi)]
-    
-    kan_gruplari = ["A Rh+", "A Rh-", "B Rh+", "B Rh-", "0 Rh+", "0 Rh-", "AB Rh+", "AB Rh-"]
+    secilen_siniflar = _ehliyet_siniflari(seed % len(sozluk.EHLIYET_SINIFLARI), secilen_sinif_sayisi)
     
     ceza_puani = seed % 20  # 0-19 arası
     if ceza_puani > 10:
@@ -595,12 +886,11 @@ def ehliyet_sorgu():
         durum_aciklama = "Ehliyet kullanılabilir"
     
     cezalar = []
-    if seed % 4 != 0:  # %75 ihtimal ceza
-        ceza_tipleri = ["Hız İhlali", "Park İhlali", "Emniyet Kemeri", "Kırmızı Işık", "Alkollü Araç Kullanma"]
+    if seed % 4 != 0 and alan_istendi('cezalar'):  # %75 ihtimal ceza
         for i in range((seed % 3) + 1):  # 1-3 ceza
             cezalar.append({
-                "tip": ceza_tipleri[(seed + i) % len(ceza_tipleri)],
-                "tarih": tarih_uret(tc, (i+1)*30),
+                "tip": sozluk.CEZA_TIPLERI[(seed + i) % len(sozluk.CEZA_TIPLERI)],
+                "tarih": kimlik.tarih((i+1)*30),
                 "puan": (i+1)*5,
                 "tutar": f"{(seed % 500) + 100} TL",
                 "durum": "Ödendi" if (seed + i) % 2 == 0 else "Ödenmedi",
@@ -608,441 +898,414 @@ def ehliyet_sorgu():
             })
     
     response = {
-        **kisi,
         "ehliyetNo": f"E{seed % 10000000000:011d}",
         "sinif": secilen_siniflar,
-        "verilisTarihi": tarih_uret(tc, 365*3),  # 3 yıl önce
-        "ilkVerilisTarihi": tarih_uret(tc, 365*8),  # 8 yıl önce
-        "sonGecerlilikTarihi": tarih_uret(tc, -365*5),  # 5 yıl sonra
-        "verildigiYer": f"{kisi['il']} İl Emniyet Müdürlüğü Trafik Şubesi",
-        "kanGrubu": kan_gruplari[seed % len(kan_gruplari)],
+        "verilisTarihi": kimlik.tarih(365*3),  # 3 yıl önce
+        "ilkVerilisTarihi": kimlik.tarih(365*8),  # 8 yıl önce
+        "sonGecerlilikTarihi": kimlik.tarih(-365*5),  # 5 yıl sonra
+        "verildigiYer": f"{kisi.il} İl Emniyet Müdürlüğü Trafik Şubesi",
+        "kanGrubu": sozluk.KAN_GRUPLARI[seed % len(sozluk.KAN_GRUPLARI)],
         "cezaPuani": ceza_puani,
         "cezalar": cezalar,
         "durum": durum,
         "durumAciklama": durum_aciklama,
         "kayipCaldirma": "Yok",
         "kayipCaldirmaTarihi": None,
-        "saglikRaporuGecerlilik": tarih_uret(tc, -365*2),  # 2 yıl sonra
+        "saglikRaporuGecerlilik": kimlik.tarih(-365*2),  # 2 yıl sonra
         "saglikRaporuNo": f"SR{seed % 100000:06d}",
-        "fotoGuncellemeTarihi": tarih_uret(tc, 180),
-        "ehliyetTeslimTarihi": tarih_uret(tc, 365*3 - 7),
-        "dogrulamaKodu": f"EHL-{hashlib.md5(tc.encode()).hexdigest()[:6].upper()}",
+        "fotoGuncellemeTarihi": kimlik.tarih(180),
+        "ehliyetTeslimTarihi": kimlik.tarih(365*3 - 7),
+        "dogrulamaKodu": f"EHL-{hashlib.md5(kimlik.tc.encode()).hexdigest()[:6].upper()}",
         "uyari": f"Ceza puanınız: {ceza_puani}/20. 20 puana ulaşıldığında ehliyetiniz askıya alınacaktır."
     }
-    return jsonify_utf8(response)
+    return kisi_yaniti(kisi, response)
 
 # ========== DİĞER API'LER (KISA VERSİYONLAR) ==========
 
-@app.route('/api/v1/saglik/kronik-hastalik', methods=['GET'])
-def kronik_hastalik():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    hastaliklar = [
-        {"ad": "Hipertansiyon", "teshisTarihi": "2021-03-15", "durum": "Kontrollü", "ilac": "Concor 5 mg"},
-        {"ad": "Tip 2 Diyabet", "teshisTarihi": "2020-08-20", "durum": "Diyet ile kontrol", "ilac": "Metformin 850 mg"},
-        {"ad": "Astım", "teshisTarihi": "2019-05-10", "durum": "Ara sıra", "ilac": "Ventolin"},
-        {"ad": "Migren", "teshisTarihi": "2018-11-30", "durum": "İlaçlı kontrol", "ilac": "Maxalt"},
-        {"ad": "Kolesterol Yüksekliği", "teshisTarihi": "2022-01-15", "durum": "İzlemde", "ilac": "Crestor 10 mg"}
-    ]
-    
-    secilen_hastaliklar = [hastaliklar[i % len(hastaliklar)] for i in range(seed % 3)]  # 0-2 hastalık
-    
-    return jsonify_utf8({
-        **kisi,
-        "hastaliklar": secilen_hastaliklar,
-        "sonKontrol": tarih_uret(tc, seed % 100),
-        "birSonrakiKontrol": tarih_uret(tc, -30),
-        "kronikHastalikKartNo": f"KH{seed % 100000:06d}",
-        "takipMerkezi": f"{kisi['il']} Endokrinoloji Merkezi"
-    })
-
-@app.route('/api/v1/vergi/borc-sorgu', methods=['GET'])
-def vergi_borc():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    borc = (seed % 5000) + 100  # 100-5100 TL arası
-    
-    return jsonify_utf8({
-        **kisi,
-        "vergiNo": f"{seed % 1000000000:010d}",
-        "toplamBorc": f"{borc:,} TL".replace(",", "."),
-        "borcDetay": [
-            {"tur": "Gelir Vergisi", "tutar": f"{borc * 0.7:,.2f} TL".replace(",", "."), "sonOdeme": tarih_uret(tc, -30)},
-            {"tur": "MTV", "tutar": f"{borc * 0.3:,.2f} TL".replace(",", "."), "sonOdeme": tarih_uret(tc, -60)},
-            {"tur": "KDV", "tutar": f"{borc * 0.2:,.2f} TL".replace(",", "."), "sonOdeme": tarih_uret(tc, -15)}
-        ],
-        "odenen": f"{(seed % borc):,} TL".replace(",", ".") if seed % 3 != 0 else "0,00 TL",
-        "faiz": f"{(borc * 0.1):.2f} TL" if seed % 2 == 1 else "0,00 TL",
-        "faizDurumu": "Faiz işlemi başlamadı" if seed % 2 == 0 else f"{(borc * 0.1):.2f} TL faiz işledi",
-        "vergiDairesi": f"{kisi['il']} Vergi Dairesi Müdürlüğü",
-        "hesapNo": f"VH{seed % 1000000:07d}"
-    })
-
-@app.route('/api/v1/tapu/gayrimenkul', methods=['GET'])
-def gayrimenkul():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    gayrimenkul_tipleri = ["Daire", "Arsa", "Tarla", "Dükkan", "Depo", "Ofis", "Villa"]
-    tip = gayrimenkul_tipleri[seed % len(gayrimenkul_tipleri)]
-    
-    return jsonify_utf8({
-        **kisi,
-        "gayrimenkulListe": [{
-            "tip": tip,
-            "ada": str((seed % 100) + 1),
-            "parsel": str((seed % 1000) + 1),
-            "pafta": f"{(seed % 50) + 1}",
-            "alan": f"{(seed % 500) + 50} m²",
-            "il": kisi['il'],
-            "ilce": kisi['ilce'],
-            "mahalle": kisi['mahalle'],
-            "tapuTarihi": tarih_uret(tc, seed % 1000),
-            "tapuBedeli": f"{(seed % 1000000) + 50000:,} TL".replace(",", "."),
-            "ipotek": "Yok" if seed % 3 == 0 else "Var",
-            "ipotekTutari": f"{(seed % 500000) + 10000:,} TL".replace(",", ".") if seed % 3 != 0 else None,
-            "tapuNo": f"TP{seed % 1000000:07d}",
-            "ciltNo": f"{(seed % 100) + 1}",
-            "sayfaNo": f"{(seed % 500) + 1}"
-        }] if seed % 5 != 0 else [],  # %80 ihtimal gayrimenkul
-        "toplamGayrimenkul": 1 if seed % 5 != 0 else 0,
-        "tapuGenelMudurluk": f"{kisi['il']} Tapu ve Kadastro Müdürlüğü"
-    })
-
-@app.route('/api/v1/askerlik/durum', methods=['GET'])
-def askerlik():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    yas = 2023 - int(kisi['dogumTarihi'].split('.')[-1])
-    
-    if kisi['cinsiyet'] == 'Kadın':
-        durum = "Muaf"
-        aciklama = "Kadın askerlik yükümlülüğü bulunmamaktadır."
-    elif yas < 20:
-        durum = "Tecil"
-        aciklama = "Yaş sebebiyle tecilli"
-    elif yas > 41:
-        durum = "Muaf"
-        aciklama = "Yaş haddinden muaf"
-    elif seed % 4 == 0:
-        durum = "Yapıldı"
-        aciklama = "Askerlik görevini tamamladı"
-    elif seed % 4 == 1:
-        durum = "Tecil"
-        aciklama = "Yüksek öğrenim sebebiyle tecilli"
-    elif seed % 4 == 2:
-        durum = "Yapılmadı"
-        aciklama = "Askerlik görevi bekliyor"
-    else:
-        durum = "Muaf"
-        aciklama = "Sağlık sebebiyle muaf"
-    
-    return jsonify_utf8({
-        **kisi,
-        "durum": durum,
-        "aciklama": aciklama,
-        "tecilBitis": tarih_uret(tc, -365) if durum == "Tecil" else None,
-        "birlik": ["2. Kolordu", "3. Kolordu", "Eğitim Tugayı", "Piyade Alayı"][seed % 4] if durum == "Yapıldı" else None,
-        "sicilNo": f"ASK-{seed % 10000:05d}" if durum == "Yapıldı" else None,
-        "terhisTarihi": tarih_uret(tc, 365*2) if durum == "Yapıldı" else None,
-        "askerlikSube": f"{kisi['il']} Askerlik Şubesi Başkanlığı",
-        "saglikDurumu": ["Elverişli", "Geçici Elverişsiz", "Elverişsiz"][seed % 3],
-        "sinif": ["Yok", "1. Sınıf", "2. Sınıf"][seed % 3],
-        "kayitNo": f"AK{seed % 100000:06d}"
-    })
-
-@app.route('/api/v1/ibb/su-fatura', methods=['GET'])
-def su_fatura():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    
-    tutar = (seed % 300) + 50  # 50-350 TL
-    
-    return jsonify_utf8({
-        **kisi,
-        "aboneNo": f"SU-IST-{seed % 100000:06d}",
-        "aboneTipi": "Mesken",
-        "sonFatura": {
-            "donem": "Kasım 2023",
-            "tutar": f"{tutar:.2f} TL",
-            "sonOdeme": tarih_uret(tc, -15),
-            "durum": "ÖDENDİ" if seed % 2 == 0 else "BEKLİYOR",
-            "odemeTarihi": tarih_uret(tc, -20) if seed % 2 == 0 else None,
-            "faturaNo": f"FT{seed % 1000000:07d}"
-        },
-        "tuketim": f"{(seed % 20) + 5} m³",
-        "birimFiyat": "8.50 TL/m³",
-        "oncekiBorc": "0,00 TL",
-        "toplamBorc": "0,00 TL" if seed % 2 == 0 else f"{tutar:.2f} TL",
-        "sayaçNo": f"SY{seed % 1000000:07d}",
-        "sayaçDurumu": "Aktif",
-        "sonOkuma": tarih_uret(tc, -5),
-        "suIdaresi": "İstanbul Su ve Kanalizasyon İdaresi (İSKİ)"
-    })
+@parca_onbellegi.kalintili
+def _kronik_hastaliklar(adet):
+    return tuple(sozluk.HASTALIKLAR[i % len(sozluk.HASTALIKLAR)] for i in range(adet))
+
+tanimli_rota('/api/v1/saglik/kronik-hastalik', 'kronik_hastalik', {
+    "hastaliklar": lambda seed: _kronik_hastaliklar(seed % 3),  # 0-2 hastalık
+    "sonKontrol": lambda kimlik, seed: kimlik.tarih(seed % 100),
+    "birSonrakiKontrol": lambda kimlik: kimlik.tarih(-30),
+    "kronikHastalikKartNo": lambda seed: f"KH{seed % 100000:06d}",
+    "takipMerkezi": lambda kisi: f"{kisi.il} Endokrinoloji Merkezi"
+})
+
+tanimli_rota('/api/v1/vergi/borc-sorgu', 'vergi_borc', {
+    "vergiNo": lambda seed: f"{seed % 1000000000:010d}",
+    "toplamBorc": lambda borc: f"{borc:,} TL".replace(",", "."),
+    "borcDetay": lambda kimlik, borc: [
+        {"tur": "Gelir Vergisi", "tutar": f"{borc * 0.7:,.2f} TL".replace(",", "."), "sonOdeme": kimlik.tarih(-30)},
+        {"tur": "MTV", "tutar": f"{borc * 0.3:,.2f} TL".replace(",", "."), "sonOdeme": kimlik.tarih(-60)},
+        {"tur": "KDV", "tutar": f"{borc * 0.2:,.2f} TL".replace(",", "."), "sonOdeme": kimlik.tarih(-15)}
+    ],
+    "odenen": lambda seed, borc: f"{(seed % borc):,} TL".replace(",", ".") if seed % 3 != 0 else "0,00 TL",
+    "faiz": lambda seed, borc: f"{(borc * 0.1):.2f} TL" if seed % 2 == 1 else "0,00 TL",
+    "faizDurumu": lambda seed, borc: "Faiz işlemi başlamadı" if seed % 2 == 0 else f"{(borc * 0.1):.2f} TL faiz işledi",
+    "vergiDairesi": lambda kisi: f"{kisi.il} Vergi Dairesi Müdürlüğü",
+    "hesapNo": lambda seed: f"VH{seed % 1000000:07d}"
+}, ara={
+    "borc": lambda seed: (seed % 5000) + 100  # 100-5100 TL arası
+})
+
+tanimli_rota('/api/v1/tapu/gayrimenkul', 'gayrimenkul', {
+    "gayrimenkulListe": lambda kimlik, kisi, seed: [{
+        "tip": sozluk.GAYRIMENKUL_TIPLERI[seed % len(sozluk.GAYRIMENKUL_TIPLERI)],
+        "ada": str((seed % 100) + 1),
+        "parsel": str((seed % 1000) + 1),
+        "pafta": f"{(seed % 50) + 1}",
+        "alan": f"{(seed % 500) + 50} m²",
+        "il": kisi.il,
+        "ilce": kisi.ilce,
+        "mahalle": kisi.mahalle,
+        "tapuTarihi": kimlik.tarih(seed % 1000),
+        "tapuBedeli": f"{(seed % 1000000) + 50000:,} TL".replace(",", "."),
+        "ipotek": "Yok" if seed % 3 == 0 else "Var",
+        "ipotekTutari": f"{(seed % 500000) + 10000:,} TL".replace(",", ".") if seed % 3 != 0 else None,
+        "tapuNo": f"TP{seed % 1000000:07d}",
+        "ciltNo": f"{(seed % 100) + 1}",
+        "sayfaNo": f"{(seed % 500) + 1}"
+    }] if seed % 5 != 0 else [],  # %80 ihtimal gayrimenkul
+    "toplamGayrimenkul": lambda seed: 1 if seed % 5 != 0 else 0,
+    "tapuGenelMudurluk": lambda kisi: f"{kisi.il} Tapu ve Kadastro Müdürlüğü"
+})
+
+def _askerlik_durumu(kisi, seed, yas):
+    """(durum, açıklama)"""
+    if kisi.cinsiyet == 'Kadın':
+        return "Muaf", "Kadın askerlik yükümlülüğü bulunmamaktadır."
+    if yas < 20:
+        return "Tecil", "Yaş sebebiyle tecilli"
+    if yas > 41:
+        return "Muaf", "Yaş haddinden muaf"
+    if seed % 4 == 0:
+        return "Yapıldı", "Askerlik görevini tamamladı"
+    if seed % 4 == 1:
+        return "Tecil", "Yüksek öğrenim sebebiyle tecilli"
+    if seed % 4 == 2:
+        return "Yapılmadı", "Askerlik görevi bekliyor"
+    return "Muaf", "Sağlık sebebiyle muaf"
+
+tanimli_rota('/api/v1/askerlik/durum', 'askerlik', {
+    "durum": lambda durum: durum,
+    "aciklama": lambda durum_aciklama: durum_aciklama[1],
+    "tecilBitis": lambda kimlik, durum: kimlik.tarih(-365) if durum == "Tecil" else None,
+    "birlik": lambda seed, durum: sozluk.ASKERI_BIRLIKLER[seed % 4] if durum == "Yapıldı" else None,
+    "sicilNo": lambda seed, durum: f"ASK-{seed % 10000:05d}" if durum == "Yapıldı" else None,
+    "terhisTarihi": lambda kimlik, durum: kimlik.tarih(365*2) if durum == "Yapıldı" else None,
+    "askerlikSube": lambda kisi: f"{kisi.il} Askerlik Şubesi Başkanlığı",
+    "saglikDurumu": lambda seed: sozluk.ASKERLIK_SAGLIK_DURUMLARI[seed % 3],
+    "sinif": lambda seed: sozluk.ASKERLIK_SINIFLARI[seed % 3],
+    "kayitNo": lambda seed: f"AK{seed % 100000:06d}"
+}, ara={
+    "yas": lambda kisi: 2023 - int(kisi.dogumTarihi.split('.')[-1]),
+    "durum_aciklama": _askerlik_durumu,
+    "durum": lambda durum_aciklama: durum_aciklama[0]
+})
+
+tanimli_rota('/api/v1/ibb/su-fatura', 'su_fatura', {
+    "aboneNo": lambda seed: f"SU-IST-{seed % 100000:06d}",
+    "aboneTipi": "Mesken",
+    "sonFatura": lambda kimlik, seed, tutar: {
+        "donem": "Kasım 2023",
+        "tutar": f"{tutar:.2f} TL",
+        "sonOdeme": kimlik.tarih(-15),
+        "durum": "ÖDENDİ" if seed % 2 == 0 else "BEKLİYOR",
+        "odemeTarihi": kimlik.tarih(-20) if seed % 2 == 0 else None,
+        "faturaNo": f"FT{seed % 1000000:07d}"
+    },
+    "tuketim": lambda seed: f"{(seed % 20) + 5} m³",
+    "birimFiyat": "8.50 TL/m³",
+    "oncekiBorc": "0,00 TL",
+    "toplamBorc": lambda seed, tutar: "0,00 TL" if seed % 2 == 0 else f"{tutar:.2f} TL",
+    "sayaçNo": lambda seed: f"SY{seed % 1000000:07d}",
+    "sayaçDurumu": "Aktif",
+    "sonOkuma": lambda kimlik: kimlik.tarih(-5),
+    "suIdaresi": "İstanbul Su ve Kanalizasyon İdaresi (İSKİ)"
+}, ara={
+    "tutar": lambda seed: (seed % 300) + 50  # 50-350 TL
+})
 
 # ========== 15 TANE DAHA API ==========
 
-@app.route('/api/v1/elektrik/fatura', methods=['GET'])
-def elektrik():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    tutar = (seed % 500) + 100
-    return jsonify_utf8({
-        **kisi,
-        "aboneNo": f"ELEK-{seed % 100000:06d}",
-        "santral": f"{kisi['il']} Anadolu Dağıtım",
-        "sonFatura": {
-            "donem": "Kasım 2023",
-            "tutar": f"{tutar:.2f} TL",
-            "tuketim": f"{(seed % 300) + 100} kWh",
-            "durum": "ÖDENDİ" if seed % 3 != 0 else "BEKLİYOR"
-        }
-    })
-
-@app.route('/api/v1/turizm/otel-rezervasyon', methods=['GET'])
-def otel_rezervasyon():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "rezervasyonNo": f"RSV-{seed % 100000:06d}",
-        "otel": ["Rixos", "Hilton", "Sheraton", "Martı", "Divan"][seed % 5],
-        "lokasyon": ["Antalya", "Bodrum", "İzmir", "Muğla", "Çeşme"][seed % 5],
-        "giris": tarih_uret(tc, -seed % 30),
-        "cikis": tarih_uret(tc, -(seed % 30) + 7),
-        "durum": "ONAYLI"
-    })
-
-@app.route('/api/v1/ulasim/istanbulkart-bakiye', methods=['GET'])
-def istanbulkart():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "kartNo": f"ISTK-{seed % 10000:04d}-{seed % 10000:04d}",
-        "kartTipi": ["Anonim", "Kişiye Özel", "Öğrenci"][seed % 3],
-        "bakiye": f"{(seed % 100) + 5:.2f} TL",
-        "sonYukleme": tarih_uret(tc, seed % 10),
-        "sonKullanim": tarih_uret(tc, seed % 3),
-        "sonKullanimYeri": ["Metrobüs", "Metro", "Otobüs", "Tramvay"][seed % 4]
-    })
-
-@app.route('/api/v1/spor/federasyon/kayit', methods=['GET'])
-def spor_federasyon():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "lisansNo": f"SPR-{seed % 10000:04d}",
-        "sporDali": ["Futbol", "Basketbol", "Voleybol", "Yüzme", "Atletizm"][seed % 5],
-        "kulup": f"{kisi['il']} Spor Kulübü",
-        "baslamaTarihi": tarih_uret(tc, seed % 1000),
-        "lisansYili": 2023
-    })
-
-@app.route('/api/v1/kutuphane/uye-durum', methods=['GET'])
-def kutuphane():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "uyeNo": f"KUT-{seed % 10000:04d}",
-        "kutuphane": f"{kisi['il']} Halk Kütüphanesi",
-        "oduncKitap": [
-            {"kitap": "Suç ve Ceza", "yazar": "Dostoyevski", "iade": tarih_uret(tc, -10)},
-            {"kitap": "İnce Memed", "yazar": "Yaşar Kemal", "iade": tarih_uret(tc, -5)}
-        ] if seed % 2 == 0 else [],
-        "uyelikBaslangic": tarih_uret(tc, seed % 1000)
-    })
-
-@app.route('/api/v1/saglik/hasta-yatis-gecmisi', methods=['GET'])
-def hasta_yatis():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "yatislar": [{
-            "hastane": f"{kisi['il']} Hastanesi",
-            "bolum": ["Dahiliye", "Cerrahi", "Kardiyoloji", "Nöroloji"][seed % 4],
-            "giris": tarih_uret(tc, seed % 100),
-            "cikis": tarih_uret(tc, (seed % 100) - 5),
-            "tanilar": ["Akut Bronşit", "Hipertansiyon", "Gastrit"][:((seed % 2)+1)],
-            "hastaNo": f"HST-{(seed + 1) % 10000:04d}"
-        }] if seed % 4 != 0 else []
-    })
-
-@app.route('/api/v1/dijital/banka-musteri', methods=['GET'])
-def banka_musteri():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "banka": ["Ziraat Bankası", "İş Bankası", "Garanti BBVA", "Yapı Kredi", "Akbank"][seed % 5],
-        "musteriNo": f"BNK-{seed % 100000:06d}",
-        "musteriSince": tarih_uret(tc, seed % 2000),
-        "hesaplar": [{
-            "iban": f"TR{seed % 100:02d} 0001 0002 {seed % 10000000000:011d}",
-            "tip": "Vadesiz TL",
-            "bakiye": f"{(seed % 10000) + 500:.2f} TL"
-        }]
-    })
+tanimli_rota('/api/v1/elektrik/fatura', 'elektrik', {
+    "aboneNo": lambda seed: f"ELEK-{seed % 100000:06d}",
+    "santral": lambda kisi: f"{kisi.il} Anadolu Dağıtım",
+    "sonFatura": lambda seed: {
+        "donem": "Kasım 2023",
+        "tutar": f"{(seed % 500) + 100:.2f} TL",
+        "tuketim": f"{(seed % 300) + 100} kWh",
+        "durum": "ÖDENDİ" if seed % 3 != 0 else "BEKLİYOR"
+    }
+})
 
-@app.route('/api/v1/kredi/risk-raporu', methods=['GET'])
-def kredi_risk():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    kredi_notu = (seed % 500) + 1000
-    risk = "Düşük Risk" if kredi_notu > 1400 else "Orta Risk" if kredi_notu > 1200 else "Yüksek Risk"
-    return jsonify_utf8({
-        **kisi,
-        "krediNotu": kredi_notu,
-        "riskSeviyesi": risk,
-        "sorguTarihi": datetime.now().strftime("%Y-%m-%d"),
-        "aciklama": f"Findeks skoru: {kredi_notu}"
-    })
-
-@app.route('/api/v1/meb/mezuniyet', methods=['GET'])
-def meb_mezuniyet():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "okul": f"{kisi['il']} Lisesi",
-        "mezuniyetYili": 2010 + (seed % 10),
-        "alan": ["Fen", "Matematik", "Türkçe-Matematik", "Sosyal"][seed % 4],
-        "diplomaNo": f"DPL-{seed % 100000:06d}"
-    })
-
-@app.route('/api/v1/ticaret/sikayet-kaydi', methods=['GET'])
-def ticaret_sikayet():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "sikayetler": [{
-            "sirket": f"XYZ {['Elektronik', 'Giyim', 'Market', 'Turizm'][seed % 4]}",
-            "tarih": tarih_uret(tc, seed % 100),
-            "durum": "Çözüldü" if seed % 2 == 0 else "Beklemede",
-            "konu": ["Ürün hatası", "Hizmet kalitesi", "Teslimat gecikmesi"][seed % 3]
-        }] if seed % 3 != 0 else []
-    })
-
-@app.route('/api/v1/cevre/sehirlerarasi-ceza', methods=['GET'])
-def trafik_ceza():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "cezalar": [{
-            "plaka": f"34{chr(65 + (seed % 26))}{chr(65 + ((seed//26) % 26))} {seed % 1000:03d}",
-            "tarih": tarih_uret(tc, seed % 100),
-            "sebep": ["Hız İhlali", "Park İhlali", "Emniyet Kemeri", "Kırmızı Işık"][seed % 4],
-            "tutar": f"{(seed % 500) + 100} TL",
-            "durum": "Ödendi" if seed % 2 == 0 else "Ödenmedi"
-        } for _ in range(seed % 4)]
-    })
-
-@app.route('/api/v1/noter/gereceklesen-islem', methods=['GET'])
-def noter_islem():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "islemler": [{
-            "tip": ["Vekalet", "Miras", "Satış", "Kira", "İpotek"][seed % 5],
-            "tarih": tarih_uret(tc, seed % 100),
-            "noter": f"{kisi['il']} {seed % 10}. Noterliği",
-            "islemNo": f"NT{seed % 100000:06d}"
-        }] if seed % 2 == 0 else []
-    })
-
-@app.route('/api/v1/ormancilik/avci-lisans', methods=['GET'])
-def avci_lisans():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "lisans": "Yok" if seed % 3 == 0 else "Var",
-        "lisansNo": f"AVC-{seed % 10000:04d}" if seed % 3 != 0 else None,
-        "gecerlilik": tarih_uret(tc, -365) if seed % 3 != 0 else None,
-        "avcilikKursu": "Tamamlandı" if seed % 3 != 0 else "Yok"
-    })
-
-@app.route('/api/v1/udhb/ucak-bilet', methods=['GET'])
-def ucak_bilet():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "biletNo": f"TK{seed % 10000:04d}",
-        "ucus": f"TK{seed % 1000:03d}",
-        "kalkis": ["İstanbul", "Ankara", "İzmir"][seed % 3],
-        "varis": ["Antalya", "Trabzon", "Adana"][seed % 3],
-        "tarih": tarih_uret(tc, -seed % 30),
-        "durum": "Onaylı"
-    })
-
-@app.route('/api/v1/mzk/seyahat-hareket', methods=['GET'])
-def mzk_seyahat():
-    tc = request.args.get('tc', '')
-    if not tc_dogrula(tc): return kayit_bulunamadi()
-    kisi = tcden_kisi_uret(tc)
-    seed = int(tc)
-    return jsonify_utf8({
-        **kisi,
-        "seyahatler": [{
-            "nereden": ["İstanbul", "Ankara", "İzmir"][seed % 3],
-            "nereye": ["Antalya", "Bursa", "Konya"][seed % 3],
-            "tarih": tarih_uret(tc, seed % 100),
-            "numara": f"MK{seed % 10000:04d}"
-        }] if seed % 2 == 0 else []
-    })
+tanimli_rota('/api/v1/turizm/otel-rezervasyon', 'otel_rezervasyon', {
+    "rezervasyonNo": lambda seed: f"RSV-{seed % 100000:06d}",
+    "otel": lambda seed: sozluk.OTELLER[seed % 5],
+    "lokasyon": lambda seed: sozluk.OTEL_LOKASYONLARI[seed % 5],
+    "giris": lambda kimlik, seed: kimlik.tarih(-seed % 30),
+    "cikis": lambda kimlik, seed: kimlik.tarih(-(seed % 30) + 7),
+    "durum": "ONAYLI"
+})
+
+tanimli_rota('/api/v1/ulasim/istanbulkart-bakiye', 'istanbulkart', {
+    "kartNo": lambda seed: f"ISTK-{seed % 10000:04d}-{seed % 10000:04d}",
+    "kartTipi": lambda seed: sozluk.ISTANBULKART_TIPLERI[seed % 3],
+    "bakiye": lambda seed: f"{(seed % 100) + 5:.2f} TL",
+    "sonYukleme": lambda kimlik, seed: kimlik.tarih(seed % 10),
+    "sonKullanim": lambda kimlik, seed: kimlik.tarih(seed % 3),
+    "sonKullanimYeri": lambda seed: sozluk.ISTANBULKART_KULLANIM_YERLERI[seed % 4]
+})
+
+tanimli_rota('/api/v1/spor/federasyon/kayit', 'spor_federasyon', {
+    "lisansNo": lambda seed: f"SPR-{seed % 10000:04d}",
+    "sporDali": lambda seed: sozluk.SPOR_DALLARI[seed % 5],
+    "kulup": lambda kisi: f"{kisi.il} Spor Kulübü",
+    "baslamaTarihi": lambda kimlik, seed: kimlik.tarih(seed % 1000),
+    "lisansYili": 2023
+})
+
+tanimli_rota('/api/v1/kutuphane/uye-durum', 'kutuphane', {
+    "uyeNo": lambda seed: f"KUT-{seed % 10000:04d}",
+    "kutuphane": lambda kisi: f"{kisi.il} Halk Kütüphanesi",
+    "oduncKitap": lambda kimlik, seed: [
+        {"kitap": "Suç ve Ceza", "yazar": "Dostoyevski", "iade": kimlik.tarih(-10)},
+        {"kitap": "İnce Memed", "yazar": "Yaşar Kemal", "iade": kimlik.tarih(-5)}
+    ] if seed % 2 == 0 else [],
+    "uyelikBaslangic": lambda kimlik, seed: kimlik.tarih(seed % 1000)
+})
+
+tanimli_rota('/api/v1/saglik/hasta-yatis-gecmisi', 'hasta_yatis', {
+    "yatislar": lambda kimlik, kisi, seed: [{
+        "hastane": f"{kisi.il} Hastanesi",
+        "bolum": sozluk.YATIS_BOLUMLERI[seed % 4],
+        "giris": kimlik.tarih(seed % 100),
+        "cikis": kimlik.tarih((seed % 100) - 5),
+        "tanilar": sozluk.YATIS_TANILARI[:((seed % 2)+1)],
+        "hastaNo": f"HST-{(seed + 1) % 10000:04d}"
+    }] if seed % 4 != 0 else []
+})
+
+tanimli_rota('/api/v1/dijital/banka-musteri', 'banka_musteri', {
+    "banka": lambda seed: sozluk.BANKALAR[seed % 5],
+    "musteriNo": lambda seed: f"BNK-{seed % 100000:06d}",
+    "musteriSince": lambda kimlik, seed: kimlik.tarih(seed % 2000),
+    "hesaplar": lambda seed: [{
+        "iban": f"TR{seed % 100:02d} 0001 0002 {seed % 10000000000:011d}",
+        "tip": "Vadesiz TL",
+        "bakiye": f"{(seed % 10000) + 500:.2f} TL"
+    }]
+})
+
+tanimli_rota('/api/v1/kredi/risk-raporu', 'kredi_risk', {
+    "krediNotu": lambda kredi_notu: kredi_notu,
+    "riskSeviyesi": lambda kredi_notu: "Düşük Risk" if kredi_notu > 1400 else "Orta Risk" if kredi_notu > 1200 else "Yüksek Risk",
+    "sorguTarihi": lambda: ANLIK_ALANLAR['kredi_risk']['sorguTarihi'](),
+    "aciklama": lambda kredi_notu: f"Findeks skoru: {kredi_notu}"
+}, ara={
+    "kredi_notu": lambda seed: (seed % 500) + 1000
+})
+
+tanimli_rota('/api/v1/meb/mezuniyet', 'meb_mezuniyet', {
+    "okul": lambda kisi: f"{kisi.il} Lisesi",
+    "mezuniyetYili": lambda seed: 2010 + (seed % 10),
+    "alan": lambda seed: sozluk.MEB_ALANLARI[seed % 4],
+    "diplomaNo": lambda seed: f"DPL-{seed % 100000:06d}"
+})
+
+tanimli_rota('/api/v1/ticaret/sikayet-kaydi', 'ticaret_sikayet', {
+    "sikayetler": lambda kimlik, seed: [{
+        "sirket": f"XYZ {sozluk.SIKAYET_SEKTORLERI[seed % 4]}",
+        "tarih": kimlik.tarih(seed % 100),
+        "durum": "Çözüldü" if seed % 2 == 0 else "Beklemede",
+        "konu": sozluk.SIKAYET_KONULARI[seed % 3]
+    }] if seed % 3 != 0 else []
+})
+
+tanimli_rota('/api/v1/cevre/sehirlerarasi-ceza', 'trafik_ceza', {
+    "cezalar": lambda kimlik, seed: [{
+        "plaka": f"34{chr(65 + (seed % 26))}{chr(65 + ((seed//26) % 26))} {seed % 1000:03d}",
+        "tarih": kimlik.tarih(seed % 100),
+        "sebep": sozluk.CEZA_TIPLERI[seed % 4],
+        "tutar": f"{(seed % 500) + 100} TL",
+        "durum": "Ödendi" if seed % 2 == 0 else "Ödenmedi"
+    } for _ in range(seed % 4)]
+})
+
+tanimli_rota('/api/v1/noter/gereceklesen-islem', 'noter_islem', {
+    "islemler": lambda kimlik, kisi, seed: [{
+        "tip": sozluk.NOTER_ISLEM_TIPLERI[seed % 5],
+        "tarih": kimlik.tarih(seed % 100),
+        "noter": f"{kisi.il} {seed % 10}. Noterliği",
+        "islemNo": f"NT{seed % 100000:06d}"
+    }] if seed % 2 == 0 else []
+})
+
+tanimli_rota('/api/v1/ormancilik/avci-lisans', 'avci_lisans', {
+    "lisans": lambda seed: "Yok" if seed % 3 == 0 else "Var",
+    "lisansNo": lambda seed: f"AVC-{seed % 10000:04d}" if seed % 3 != 0 else None,
+    "gecerlilik": lambda kimlik, seed: kimlik.tarih(-365) if seed % 3 != 0 else None,
+    "avcilikKursu": lambda seed: "Tamamlandı" if seed % 3 != 0 else "Yok"
+})
+
+tanimli_rota('/api/v1/udhb/ucak-bilet', 'ucak_bilet', {
+    "biletNo": lambda seed: f"TK{seed % 10000:04d}",
+    "ucus": lambda seed: f"TK{seed % 1000:03d}",
+    "kalkis": lambda seed: sozluk.KALKIS_SEHIRLERI[seed % 3],
+    "varis": lambda seed: sozluk.UCUS_VARIS_SEHIRLERI[seed % 3],
+    "tarih": lambda kimlik, seed: kimlik.tarih(-seed % 30),
+    "durum": "Onaylı"
+})
+
+tanimli_rota('/api/v1/mzk/seyahat-hareket', 'mzk_seyahat', {
+    "seyahatler": lambda kimlik, seed: [{
+        "nereden": sozluk.KALKIS_SEHIRLERI[seed % 3],
+        "nereye": sozluk.OTOBUS_VARIS_SEHIRLERI[seed % 3],
+        "tarih": kimlik.tarih(seed % 100),
+        "numara": f"MK{seed % 10000:04d}"
+    }] if seed % 2 == 0 else []
+})
+
+# Ön işlemeden geçen (ETag ve yanıt önbelleği uygulanan) uç noktalar: tüm /api/ rotaları
+ONBELLEKLI_UC_NOKTALAR = frozenset(
+    kural.endpoint for kural in app.url_map.iter_rules() if kural.rule.startswith('/api/')
+)
+
+# Uç nokta başına Cache-Control başlığı
+CACHE_CONTROL = {
+    uc_nokta: CACHE_CONTROL_ANLIK if uc_nokta in ANLIK_ALANLAR else CACHE_CONTROL_DETERMINISTIK
+    for uc_nokta in ONBELLEKLI_UC_NOKTALAR
+}
+
+# ========== WSGI HIZLI YOLU ==========
+# Flask'a uğramadan yanıtlanabilen rotalar: yol -> uç nokta. Handler'ı g/request
+# kullanan, gecikmeli ya da kabul kapılı uç noktalar dahil edilmez.
+HIZLI_ROTALAR = {
+    kural.rule: kural.endpoint for kural in app.url_map.iter_rules()
+    if kural.endpoint in TANIMLAR and kural.endpoint not in gecikme.GECIKMELI_UC_NOKTALAR
+    and kural.endpoint not in kabul.kapilar
+}
+
+# Uç nokta başına hazır başlıklar: (ETag biçimi, Cache-Control)
+_HIZLI_BASLIKLAR = {
+    uc_nokta: ('W/"%s"' if uc_nokta in ANLIK_ALANLAR else '"%s"', ('Cache-Control', CACHE_CONTROL[uc_nokta]))
+    for uc_nokta in HIZLI_ROTALAR.values()
+}
+_ICERIK_TURU = ('Content-Type', JSON_MIMETYPE)
+_VARY = ('Vary', 'Accept-Encoding')
+
+def hizli_yanit(uc_nokta, tc, environ):
+    """Hızlı yolun üstlendiği istek (bkz. hizli_yol.py): (durum, başlıklar, gövde).
+
+    Gövde ve başlıklar Flask yolundakiyle aynıdır. Kota reddi ve geçersiz TC
+    için None döner; istek Flask'a geçer (kota yeniden sayılmaz).
+    """
+    baslangic = time.perf_counter()
+    if kota.sinirlayici is not None:
+        bekleme = kota.sinirlayici.denetle(environ, uc_nokta)
+        environ[kota.ORTAM_ANAHTARI] = bekleme or 0
+        if bekleme:
+            return None
+    if not tc_dogrula(tc):
+        return None
+    kimlik = baglam.TCBaglami(tc)
+    kodlama = sikistirma.kodlama_sec(environ.get('HTTP_ACCEPT_ENCODING', ''))
+    etag = etag_hesapla(uc_nokta, tc, 'c' + (kodlama or ''))
+    anahtar = (tc, False, '')
+    sablon = yanit_onbellegi.getir(uc_nokta, anahtar) if yanit_onbellegi.etkin else None
+    asamalar = [('dogrulama', time.perf_counter() - baslangic)]
+
+    t0 = time.perf_counter()
+    isabet = sablon is not None
+    if isabet:
+        govde = _sablondan_govde(uc_nokta, sablon)
+    else:
+        kisi = tcden_kisi_uret(tc)
+        ek = TANIMLAR[uc_nokta].uret(kimlik, kisi, kimlik.seed)
+        onceki, t0 = t0, time.perf_counter()
+        asamalar.append(('uretim', t0 - onceki))
+        if yanit_onbellegi.etkin:
+            sablon, govde = _sablon_olustur(uc_nokta, ek, False, kisi.parca)
+        else:
+            govde = serilestirme.nesneye_ekle(kisi.parca, serilestirme.kodla(ek))
+    etag_bicimi, cache_control = _HIZLI_BASLIKLAR[uc_nokta]
+    basliklar = [_ICERIK_TURU, None, _VARY, ('ETag', etag_bicimi % etag), cache_control]
+    if kodlama is not None:
+        sikistirilmis = _sikistirilmis(govde, kodlama, sablon)
+        if sikistirilmis is not None:
+            govde = sikistirilmis
+            basliklar.append(('Content-Encoding', kodlama))
+    basliklar[1] = ('Content-Length', str(len(govde)))
+    # Sıkıştırmadan sonra konur: yeni sıkıştırılmış kopya da önbelleğe gider
+    if sablon is not None and (not isabet or sablon.kirli):
+        yanit_onbellegi.koy(uc_nokta, anahtar, sablon)
+
+    bitis = time.perf_counter()
+    asamalar.append(('serilestirme', bitis - t0))
+    asamalar.append(('toplam', bitis - baslangic))
+    metrik.kayitci.istek(uc_nokta, 200, len(govde), asamalar)
+    return '200 OK', basliklar, govde
+
+if hizli_yol.ETKIN and _ornekleyici is None:
+    app.wsgi_app = hizli_yol.HizliYol(app.wsgi_app, HIZLI_ROTALAR, hizli_yanit)
+
+# ========== ÖN RET (geçersiz TC) ==========
+_ON_RED_ROTALARI = {
+    kural.rule: kural.endpoint for kural in app.url_map.iter_rules() if kural.endpoint in ONBELLEKLI_UC_NOKTALAR
+}
+
+def on_red_izni(uc_nokta, environ):
+    """Kota Flask yolundaki gibi TC'den önce denetlenir; sınır aşıldıysa False
+    döner ve istek 429 için Flask'a geçer (kota yeniden sayılmaz)."""
+    if kota.sinirlayici is None:
+        return True
+    bekleme = environ.get(kota.ORTAM_ANAHTARI)
+    if bekleme is None:
+        bekleme = environ[kota.ORTAM_ANAHTARI] = kota.sinirlayici.denetle(environ, uc_nokta) or 0
+    return not bekleme
+
+def on_red_yaniti(uc_nokta, girintili, environ):
+    """Geçersiz TC'nin 404'ü Flask'a girmeden: (durum, başlıklar, gövde)"""
+    baslangic = time.perf_counter()
+    govde = bulunamadi_govdesi(girintili)
+    metrik.kayitci.istek(uc_nokta, 404, len(govde), (('toplam', time.perf_counter() - baslangic),))
+    return '404 NOT FOUND', [_ICERIK_TURU, ('Content-Length', str(len(govde)))], govde
+
+if hizli_yol.ON_RED_ETKIN:
+    _on_red = app.wsgi_app = hizli_yol.OnRed(app.wsgi_app, _ON_RED_ROTALARI, tc_red_nedeni, on_red_yaniti,
+                                             izin=on_red_izni)
+    metrik.kayitci.olcu_kaynagi_ekle(_on_red.olculer, hizli_yol.OLCU_TANIMLARI)
+
+# İsteğe bağlı örneklemeli cProfile; kapalıyken ara katman hiç takılmaz
+if profil.etkin():
+    app.wsgi_app = profil.ProfilMiddleware(app.wsgi_app, app.url_map)
+
+# ========== ÖN ISITMA ==========
+# Handler'ların TC'den bağımsız gün farkları (döngülerde ilk beş öğe)
+SABIT_GUN_FARKLARI = tuple(sorted(
+    {-365 * 5, -365 * 2, -365, -60, -30, -20, -15, -10, -5,
+     90, 120, 180, 200, 300, 365 * 2, 365 * 3 - 7, 365 * 3, 365 * 8, 2000}
+    | {(i + 1) * adim + fark for i in range(5) for adim, fark in ((30, 0), (45, 0), (45, -1), (60, 0), (90, 0), (90, -7))}
+))
+
+def isit():
+    """Fork öncesi (preload) bir kez çağrılır: worker'ların ilk isteklerde
+    ayrı ayrı dolduracağı tabloları master'da doldurur"""
+    baglam.isit(SABIT_GUN_FARKLARI)
+    # Kalıntı parçalarının tüm değer kümesi küçüktür; fork'tan önce kurulup paylaşılır
+    for adet in range(3):
+        _kronik_hastaliklar(adet)
+    for ilk in range(len(sozluk.ILACLAR)):
+        for adet in range(2, 5):
+            _recete_ilaclari(ilk, adet)
+    for ilk in range(len(sozluk.EHLIYET_SINIFLARI)):
+        for adet in range(1, 4):
+            _ehliyet_siniflari(ilk, adet)
+    # Isıtma ıskaları her worker'a kopyalanıp /metrics'te worker sayısı kadar sayılmasın
+    parca_onbellegi.sayaclari_sifirla()
 
 # ========== ÇALIŞTIRMA ==========
 if __name__ == '__main__':
@@ -1068,6 +1331,9 @@ if __name__ == '__main__':
     http://127.0.0.1:5000/api/v1/eczane/recete-gecmisi?tc=10000000146
     
     TÜRKÇE KARAKTER PROBLEMİ ÇÖZÜLDÜ!
+
+    Bu geliştirme sunucusudur (debug + reloader).
+    Üretim için: python sunucu.py
     ====================================================
     """)
     app.run(debug=True, host='0.0.0.0', port=5000)
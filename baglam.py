@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Doğrulanmış TC için istek bağlamı ve paylaşılan tarih belleği.
+
+TC istek başına bir kez doğrulanıp TCBaglami'na çevrilir; handler'lar
+int(tc), tarih hesabı ve strftime'ı kendileri tekrarlamaz. TC'ye özel
+tarihlerin tabanı yalnızca seed % 12 (ay) ve seed % 28 (gün) kalanlarına
+bağlıdır, bu yüzden biçimlenmiş tarihler (ay, gün, gün farkı) anahtarıyla
+tüm istekler arasında paylaşılır.
+"""
+import os
+from datetime import date, timedelta
+
+# (ay, gün, gün farkı) -> "YYYY-AA-GG"; taban tarih 336 farklı değer alabilir
+_TARIHLER = {}
+_TARIH_SINIRI = int(os.environ.get('NABI_TARIH_BELLEK_SINIRI', 65536))
+
+def tarih(ay, gun, gun_fark=0):
+    """2023-ay-gün tarihinden gun_fark gün öncesi (negatifse sonrası), ISO biçiminde"""
+    anahtar = (ay, gun, gun_fark)
+    deger = _TARIHLER.get(anahtar)
+    if deger is None:
+        deger = (date(2023, ay, gun) - timedelta(days=gun_fark)).isoformat()
+        if len(_TARIHLER) >= _TARIH_SINIRI:
+            _TARIHLER.clear()  # büyük farklar belleği şişirmesin; sıcak anahtarlar hemen geri dolar
+        _TARIHLER[anahtar] = deger
+    return deger
+
+def isit(gun_farklari):
+    """Tüm taban tarihler için verilen farkları belleğe önceden doldurur.
+
+    Preload edilen master'da fork'tan önce çağrılırsa bu girdiler worker'lar
+    arasında paylaşılan sayfalarda kalır.
+    """
+    for ay in range(1, 13):
+        for gun in range(1, 29):
+            for gun_fark in gun_farklari:
+                tarih(ay, gun, gun_fark)
+
+def tarih_saat(seed):
+    """TC'ye özel tarih-saat (2023-AA-GGTSS:DD:DDZ)"""
+    dakika = seed % 60
+    return f"2023-{seed % 12 + 1:02d}-{seed % 28 + 1:02d}T{seed % 24:02d}:{dakika:02d}:{dakika:02d}Z"
+
+class TCBaglami:
+    """Bir isteğin doğrulanmış TC'si ve ondan türeyen değerler"""
+    __slots__ = ('tc', 'rakamlar', 'seed', 'ay', 'gun')
+
+    def __init__(self, tc):
+        self.tc = tc
+        self.rakamlar = tuple(int(c) for c in tc)
+        seed = self.seed = int(tc)
+        self.ay = seed % 12 + 1
+        self.gun = seed % 28 + 1
+
+    def tarih(self, gun_fark=0):
+        return tarih(self.ay, self.gun, gun_fark)
+
+    def tarih_saat(self):
+        return tarih_saat(self.seed)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Altın derlem: tüm uç noktaların yanıt gövdelerini kaydeder ya da kayıtla karşılaştırır.
+
+Üretim mantığına dokunan bir değişiklikten önce derlem kaydedilir, sonra
+karşılaştırılır; gövdeler bayt bayt aynı olmalıdır. Her rota ve derlemdeki
+her TC için şu istekler yapılır (her biri iki kez: yanıt önbelleği ıskası ve
+isabeti):
+
+    sıkışık                 ?tc=...
+    girintili               ?tc=...&pretty=1
+    alan seçimi             ?tc=...&fields=tc,il,<uç noktanın ilk iki alanı>
+    iç içe alan seçimi      ?tc=...&fields=<liste alanı>.<ilk alt alanı>   (varsa)
+
+Geçersiz TC'ler için 404 gövdeleri de kaydedilir. Saate bağlı alanlar
+(ANLIK_ALANLAR) kayıt süresince sabit bir değerle üretilir; 404 gövdesindeki
+zaman damgası maskelenir. Gecikme ve kota kapatılır.
+
+    python benchmarks/altin_derlem.py --kaydet altin.json [--tc 50]
+    python benchmarks/altin_derlem.py --karsilastir altin.json
+"""
+import argparse
+import json
+import os
+import re
+import sys
+
+os.environ['NABI_GECIKME'] = 'kapali'
+os.environ.pop('NABI_KOTA', None)
+
+from derlem import api_rotalari, gecerli_tcler
+
+import backend  # noqa: E402
+import kisi  # noqa: E402
+
+GECERSIZ_TCLER = ('', '123', '00000000000', '12345678901', '1234567890a')
+SABIT_ANLIK = '<anlik>'
+_ZAMAN_DAMGASI = re.compile(rb'"timestamp": ?"[^"]*"')
+
+def _istekler(istemci, yol, tc):
+    """(sorgu dizesi) listesi; alan seçimi uç noktanın kendi alanlarından kurulur"""
+    sorgular = [f'tc={tc}', f'tc={tc}&pretty=1']
+    govde = json.loads(istemci.get(f'{yol}?tc={tc}').data)
+    ozel = [alan for alan in govde if alan not in kisi.ALANLAR]
+    sorgular.append('tc=' + tc + '&fields=' + ','.join(['tc', 'il'] + ozel[:2]))
+    for alan in ozel:
+        deger = govde[alan]
+        if isinstance(deger, list) and deger and isinstance(deger[0], dict):
+            sorgular.append(f'tc={tc}&fields={alan}.{next(iter(deger[0]))}')
+            break
+    return sorgular
+
+def topla(tc_sayisi):
+    """{url: gövde} (gövde metin; her url için ıska ve isabet gövdesi)"""
+    for uretici in backend.ANLIK_ALANLAR.values():
+        for alan in uretici:
+            uretici[alan] = lambda: SABIT_ANLIK
+    istemci = backend.app.test_client()
+    sonuc = {}
+    for yol, _ in api_rotalari(backend.app):
+        for tc in gecerli_tcler(tc_sayisi):
+            for sorgu in _istekler(istemci, yol, tc):
+                url = f'{yol}?{sorgu}'
+                for tur in ('iska', 'isabet'):
+                    yanit = istemci.get(url)
+                    sonuc[f'{tur} {url}'] = f'{yanit.status_code} ' + yanit.data.decode('utf-8')
+        for tc in GECERSIZ_TCLER:
+            yanit = istemci.get(f'{yol}?tc={tc}')
+            sonuc[f'404 {yol}?tc={tc}'] = f'{yanit.status_code} ' + _ZAMAN_DAMGASI.sub(
+                b'"timestamp":"*"', yanit.data).decode('utf-8')
+    return sonuc
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    islem = ap.add_mutually_exclusive_group(required=True)
+    islem.add_argument('--kaydet', metavar='DOSYA', help='derlemi bu dosyaya yaz')
+    islem.add_argument('--karsilastir', metavar='DOSYA', help='derlemi bu kayıtla karşılaştır')
+    ap.add_argument('--tc', type=int, default=50, help='rota başına geçerli TC sayısı')
+    ap.add_argument('--goster', type=int, default=5, help='yazdırılacak en fazla fark')
+    args = ap.parse_args()
+
+    if args.kaydet:
+        sonuc = topla(args.tc)
+        with open(args.kaydet, 'w', encoding='utf-8') as f:
+            json.dump({'tcSayisi': args.tc, 'govdeler': sonuc}, f, ensure_ascii=False, indent=0)
+        print(f"{len(sonuc)} gövde kaydedildi: {args.kaydet}")
+        return
+
+    with open(args.karsilastir, encoding='utf-8') as f:
+        kayit = json.load(f)
+    sonuc = topla(kayit['tcSayisi'])
+    altin = kayit['govdeler']
+    farkli = [url for url in altin if sonuc.get(url) != altin[url]]
+    fazla = [url for url in sonuc if url not in altin]
+    for url in farkli[:args.goster]:
+        print(f"FARK {url}\n  beklenen: {altin[url][:300]}\n  gelen:    {str(sonuc.get(url))[:300]}")
+    print(f"{len(altin)} gövde: {len(farkli)} farklı, {len(fazla)} kayıtta yok")
+    sys.exit(1 if farkli or fazla else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""Soğuk başlatma süresi ve worker başına bellek ölçümü.
+
+gunicorn.conf.py ile üç düzeni sırayla başlatır ve karşılaştırır:
+
+    onyuklemesiz    NABI_ONYUKLE=0; her worker uygulamayı kendisi yükler
+    onyukleme       preload, gc.freeze yok
+    onyukleme+gc    preload ve fork öncesi gc.freeze (varsayılan üretim düzeni)
+
+Her düzen için başlatmadan ilk başarılı yanıta kadar geçen süre ile worker
+başına RSS, PSS ve özel (başka süreçle paylaşılmayan) bellek önce boşta,
+sonra kısa bir yük altında ölçülür. PSS paylaşılan sayfaları paylaşan
+süreç sayısına böler; copy-on-write paylaşımının etkisini RSS'ten daha iyi
+gösterir. Bellek /proc/<pid>/smaps_rollup'tan okunur (yalnızca Linux).
+
+    python benchmarks/baslatma.py --isci 4 --sure 10
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+
+from derlem import KOK, api_rotalari, gecerli_tcler
+from yuk_testi import bos_port, isci_pidleri, yuk_uygula
+
+import backend  # noqa: E402  (yalnızca rota listesi için)
+
+DUZENLER = {
+    'onyuklemesiz': {'NABI_ONYUKLE': '0'},
+    'onyukleme': {'NABI_ONYUKLE': '1', 'NABI_GC_DONDUR': '0'},
+    'onyukleme+gc': {'NABI_ONYUKLE': '1', 'NABI_GC_DONDUR': '1'},
+}
+
+def baslat(duzen, isci, port):
+    """(süreç, ilk başarılı yanıta kadar geçen saniye)"""
+    ortam = dict(os.environ, NABI_GECIKME='kapali', NABI_ISCI=str(isci),
+                 NABI_BAGLANTI=f'127.0.0.1:{port}', **DUZENLER[duzen])
+    baslangic = time.perf_counter()
+    surec = subprocess.Popen([sys.executable, os.path.join(KOK, 'sunucu.py'), '--log-level', 'warning'],
+                             cwd=KOK, env=ortam)
+    son = time.monotonic() + 30
+    while time.monotonic() < son:
+        if surec.poll() is not None:
+            raise RuntimeError(f"gunicorn başlatılamadı (çıkış kodu {surec.returncode})")
+        try:
+            baglanti = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            baglanti.request('GET', '/api/v1/nufus/sorgu?tc=10000000146')
+            durum = baglanti.getresponse().status
+            baglanti.close()
+            if durum == 200:
+                return surec, time.perf_counter() - baslangic
+        except OSError:
+            pass
+        time.sleep(0.01)
+    surec.terminate()
+    raise RuntimeError("gunicorn 30 saniyede hazır olmadı")
+
+def bellek_olc(pidler):
+    """pid -> {'rss', 'pss', 'ozel'} KiB"""
+    sonuc = {}
+    for pid in pidler:
+        alanlar = {}
+        try:
+            with open(f'/proc/{pid}/smaps_rollup') as f:
+                for satir in f:
+                    ad, _, deger = satir.partition(':')
+                    if deger.strip().endswith('kB'):
+                        alanlar[ad] = int(deger.split()[0])
+        except OSError:
+            continue
+        sonuc[pid] = {
+            'rss': alanlar.get('Rss', 0),
+            'pss': alanlar.get('Pss', 0),
+            'ozel': alanlar.get('Private_Clean', 0) + alanlar.get('Private_Dirty', 0),
+        }
+    return sonuc
+
+def ozetle(olcumler):
+    """Worker başına ortalamalar ve tüm worker'ların toplam PSS'i"""
+    adet = len(olcumler) or 1
+    ozet = {k: round(sum(o[k] for o in olcumler.values()) / adet) for k in ('rss', 'pss', 'ozel')}
+    ozet['toplamPss'] = sum(o['pss'] for o in olcumler.values())
+    return ozet
+
+def duzen_olc(duzen, isci, sure, karisim, tcler):
+    port = bos_port()
+    sunucu, soguk = baslat(duzen, isci, port)
+    try:
+        time.sleep(1)  # tüm worker'lar ayağa kalksın
+        pidler = isci_pidleri(sunucu.pid)
+        bos = ozetle(bellek_olc(pidler))
+        yuk_uygula(port, karisim, tcler, isci * 4, sure, 0.5, {})
+        yuklu = ozetle(bellek_olc(pidler))
+    finally:
+        sunucu.terminate()
+        sunucu.wait(timeout=30)
+    return {'sogukBaslatmaMs': round(soguk * 1e3, 1), 'bosta': bos, 'yukSonrasi': yuklu}
+
+def yazdir(sonuclar):
+    print(f"{'düzen':<15}{'soğuk ms':>10}  {'RSS':>8}{'PSS':>8}{'özel':>8}{'ΣPSS':>9}  "
+          f"{'RSS':>8}{'PSS':>8}{'özel':>8}{'ΣPSS':>9}")
+    print(f"{'':<25}  {'--- boşta (KiB/worker) ---':^33}  {'--- yük sonrası ---':^33}")
+    for duzen, s in sonuclar.items():
+        b, y = s['bosta'], s['yukSonrasi']
+        print(f"{duzen:<15}{s['sogukBaslatmaMs']:>10.1f}  {b['rss']:>8}{b['pss']:>8}{b['ozel']:>8}{b['toplamPss']:>9}  "
+              f"{y['rss']:>8}{y['pss']:>8}{y['ozel']:>8}{y['toplamPss']:>9}")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--isci', type=int, default=4, help='gunicorn worker sayısı')
+    ap.add_argument('--sure', type=float, default=5, help='yük süresi (sn)')
+    ap.add_argument('--duzen', action='append', choices=tuple(DUZENLER),
+                    help='yalnızca bu düzen(ler)i ölç (varsayılan: hepsi)')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    args = ap.parse_args()
+
+    karisim = {yol: 1.0 for yol, _ in api_rotalari(backend.app)}
+    tcler = gecerli_tcler(500)
+    sonuclar = {duzen: duzen_olc(duzen, args.isci, args.sure, karisim, tcler)
+                for duzen in (args.duzen or DUZENLER)}
+    yazdir(sonuclar)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'isci': args.isci, 'sure': args.sure, 'duzenler': sonuclar}, f,
+                      ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""Ölçüm betiklerinin ortak yardımcıları: sabit TC derlemi ve rota listesi."""
+import os
+import sys
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if KOK not in sys.path:
+    sys.path.insert(0, KOK)
+
+def tc_tamamla(ilk_dokuz):
+    """İlk 9 haneye algoritmaya uygun 10. ve 11. haneleri ekler"""
+    rakamlar = [int(c) for c in ilk_dokuz]
+    tekler = sum(rakamlar[0:9:2])
+    ciftler = sum(rakamlar[1:9:2])
+    onuncu = ((tekler * 7) - ciftler) % 10
+    onbirinci = (sum(rakamlar) + onuncu) % 10
+    return f"{ilk_dokuz}{onuncu}{onbirinci}"
+
+def gecerli_tcler(adet=200, baslangic=100000000, adim=7919):
+    """Her çalıştırmada aynı olan, algoritmaya uygun TC listesi"""
+    return [tc_tamamla(str(baslangic + i * adim)) for i in range(adet)]
+
+def api_rotalari(app):
+    """(yol, endpoint) listesi; yalnızca /api/ rotaları"""
+    return sorted(
+        (kural.rule, kural.endpoint)
+        for kural in app.url_map.iter_rules()
+        if kural.rule.startswith('/api/')
+    )
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""WSGI hızlı yolu ile Flask yolunun istek/sn karşılaştırması.
+
+İki düzeyde ölçer:
+
+    süreç içi   WSGI uygulaması doğrudan çağrılır (ağ ve sunucu yok); iki yol
+                aynı süreçte, aynı environ'larla sırayla dolaşılır. Yalnızca
+                çerçeve + üretim maliyetini gösterir.
+    --http      gunicorn (sync) NABI_HIZLI_YOL=0 ve =1 ile ayrı ayrı başlatılır
+                ve yuk_testi ile aynı karışım yüklenir; sunucu ve istemci
+                maliyeti de dahildir.
+
+Varsayılan rotalar hızlı yolun üstlendiği tüm rotalardır (--filtre ile
+daraltılır). Yanıt önbelleği varsayılan ayarındadır; --onbelleksiz ile her
+istekte gövde yeniden üretilir. Her rotada iki yolun gövdeleri bayt bayt
+karşılaştırılır.
+
+    python benchmarks/hizli_yol.py --filtre istanbulkart --sure 2
+    python benchmarks/hizli_yol.py --http --isci 2 --eszamanli 16 --sure 10
+"""
+import argparse
+import json
+import os
+import time
+
+from derlem import api_rotalari, gecerli_tcler
+
+os.environ['NABI_GECIKME'] = 'kapali'
+
+import backend  # noqa: E402
+import hizli_yol  # noqa: E402
+from yuk_testi import bos_port, ozetle, sunucu_baslat, yuk_uygula  # noqa: E402
+
+def _environ(yol, tc, basliklar):
+    environ = {
+        'REQUEST_METHOD': 'GET', 'SCRIPT_NAME': '', 'PATH_INFO': yol, 'QUERY_STRING': f'tc={tc}',
+        'SERVER_NAME': '127.0.0.1', 'SERVER_PORT': '5000', 'SERVER_PROTOCOL': 'HTTP/1.1',
+        'REMOTE_ADDR': '127.0.0.1', 'wsgi.version': (1, 0), 'wsgi.url_scheme': 'http',
+        'wsgi.input': None, 'wsgi.errors': None, 'wsgi.multithread': False,
+        'wsgi.multiprocess': True, 'wsgi.run_once': False,
+    }
+    for ad, deger in basliklar.items():
+        environ['HTTP_' + ad.upper().replace('-', '_')] = deger
+    return environ
+
+def _cagir(wsgi, environ):
+    durum = []
+    govde = b''.join(wsgi(dict(environ), lambda d, b, e=None: durum.append(d)))
+    return durum[0], govde
+
+def _istek_sn(wsgi, environlar, sure):
+    """Süre dolana kadar environ listesini dolaşır; istek/sn"""
+    adet, bitis = 0, time.perf_counter() + sure
+    while time.perf_counter() < bitis:
+        for environ in environlar:
+            b''.join(wsgi(dict(environ), _start_response))
+        adet += len(environlar)
+    return adet / (sure + time.perf_counter() - bitis)
+
+def _start_response(durum, basliklar, exc_info=None):
+    pass
+
+def surec_ici(rotalar, tcler, sure, basliklar):
+    flask_wsgi = backend.app.wsgi_app
+    if isinstance(flask_wsgi, hizli_yol.HizliYol):
+        flask_wsgi = flask_wsgi.wsgi_app
+    hizli = hizli_yol.HizliYol(flask_wsgi, backend.HIZLI_ROTALAR, backend.hizli_yanit)
+    sonuclar = {}
+    for yol in rotalar:
+        environlar = [_environ(yol, tc, basliklar) for tc in tcler]
+        for environ in environlar:  # ısınma; önbellekler iki yol için aynı durumda
+            if _cagir(flask_wsgi, environ) != _cagir(hizli, environ):
+                raise AssertionError(f"{yol}: iki yolun yanıtı farklı")
+        flask_sn = _istek_sn(flask_wsgi, environlar, sure)
+        hizli_sn = _istek_sn(hizli, environlar, sure)
+        sonuclar[yol] = {'flaskIstekSn': round(flask_sn), 'hizliIstekSn': round(hizli_sn),
+                         'flaskUs': round(1e6 / flask_sn, 1), 'hizliUs': round(1e6 / hizli_sn, 1)}
+    return sonuclar
+
+def http(rotalar, tcler, args, basliklar):
+    sonuclar = {}
+    for ad, deger in (('flask', '0'), ('hizli', '1')):
+        os.environ['NABI_HIZLI_YOL'] = deger
+        port = bos_port()
+        sunucu = sunucu_baslat('sync', args.isci, 1, port, 'kapali')
+        try:
+            kayitci = yuk_uygula(port, {yol: 1.0 for yol in rotalar}, tcler,
+                                 args.eszamanli, args.sure, args.isinma, basliklar)
+        finally:
+            sunucu.terminate()
+            sunucu.wait(timeout=30)
+        sonuclar[ad] = ozetle(kayitci, args.sure)
+    return {yol: {'flaskIstekSn': sonuclar['flask'][yol]['istekSn'], 'hizliIstekSn': sonuclar['hizli'][yol]['istekSn'],
+                  'flaskP50Ms': sonuclar['flask'][yol]['p50Ms'], 'hizliP50Ms': sonuclar['hizli'][yol]['p50Ms']}
+            for yol in rotalar if yol in sonuclar['flask'] and yol in sonuclar['hizli']}
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--filtre', default='', help='yalnızca yolunda bu metin geçen rotalar')
+    ap.add_argument('--tc', type=int, default=200, help='derlemdeki TC sayısı')
+    ap.add_argument('--sure', type=float, default=1.0, help='rota ve yol başına ölçüm süresi (sn)')
+    ap.add_argument('--onbelleksiz', action='store_true', help='yanıt önbelleğini kapat')
+    ap.add_argument('--gzip', action='store_true', help='Accept-Encoding: gzip gönder')
+    ap.add_argument('--http', action='store_true', help='gunicorn altında yük testiyle ölç')
+    ap.add_argument('--isci', type=int, default=1, help='--http: gunicorn worker sayısı')
+    ap.add_argument('--eszamanli', type=int, default=8, help='--http: eşzamanlı istemci sayısı')
+    ap.add_argument('--isinma', type=float, default=1, help='--http: ısınma süresi (sn)')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    args = ap.parse_args()
+
+    if args.onbelleksiz:
+        backend.yanit_onbellegi.kapasite = 0
+        os.environ['NABI_YANIT_ONBELLEK_KAPASITE'] = '0'
+    hizli_yollar = set(backend.HIZLI_ROTALAR)
+    rotalar = [yol for yol, _ in api_rotalari(backend.app) if yol in hizli_yollar and args.filtre in yol]
+    tcler = gecerli_tcler(args.tc)
+    basliklar = {'Accept-Encoding': 'gzip'} if args.gzip else {}
+    sonuclar = http(rotalar, tcler, args, basliklar) if args.http else surec_ici(rotalar, tcler, args.sure, basliklar)
+
+    print(f"{'rota':<40}{'flask istek/sn':>16}{'hızlı istek/sn':>16}{'fark':>8}")
+    for yol, s in sonuclar.items():
+        print(f"{yol:<40}{s['flaskIstekSn']:>16}{s['hizliIstekSn']:>16}"
+              f"{(s['hizliIstekSn'] / s['flaskIstekSn'] - 1) * 100:>+7.0f}%")
+    if sonuclar:
+        flask = sum(s['flaskIstekSn'] for s in sonuclar.values()) / len(sonuclar)
+        hizli = sum(s['hizliIstekSn'] for s in sonuclar.values()) / len(sonuclar)
+        print(f"\nrota ortalaması: {flask:.0f} → {hizli:.0f} istek/sn ({(hizli / flask - 1) * 100:+.0f}%)")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'ayar': vars(args), 'kodlayici': backend.serilestirme.KODLAYICI_ADI,
+                       'rotalar': sonuclar}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""Kişi yanıt yazıcısı ölçümü: sözlük birleştirme ile önceden kodlanmış parça.
+
+Eski yol önbellekteki profili (salt okunur sözlük görünümü) `{**kisi, **ek}`
+ile yeni bir sözlüğe kopyalar ve tüm gövdeyi kodlar. Yeni yol (kisi_yaniti)
+yalnızca uç noktaya özel `ek` alanlarını kodlar ve KisiKaydi'nın önceden
+kodlanmış parçasının arkasına ekler.
+
+Her rota için derlemdeki TC'lerin handler'ları bir kez çalıştırılıp ürettikleri
+`ek` sözlükleri toplanır; ardından iki yazıcı aynı girdilerle, istek bağlamı
+içinde ölçülür (handler'ın kendi hesabı iki yolda aynıdır). İşlem başına
+ortalama ve p99 gecikme, tepe bellek tahsisi (tracemalloc) ve kodlanan bayt
+raporlanır. Yanıt önbelleği kapatılır; iki yolun gövdeleri bayt bayt
+karşılaştırılır.
+
+    python benchmarks/kisi_yazici.py [--tc 100] [--tekrar 20] [--json sonuc.json]
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from types import MappingProxyType
+
+from derlem import api_rotalari, gecerli_tcler
+
+import backend  # noqa: E402
+import gecikme  # noqa: E402
+import serilestirme  # noqa: E402
+
+def girdileri_topla(app, yol, uc_nokta, tcler):
+    """[(kişi kaydı, ek alanlar)]; handler'lar kisi_yaniti yerine kaydediciyle çalıştırılır"""
+    girdiler = []
+    asil = backend.kisi_yaniti
+    backend.kisi_yaniti = lambda kisi, ek: girdiler.append((kisi, ek))
+    try:
+        view = app.view_functions[uc_nokta]
+        for tc in tcler:
+            with app.test_request_context(f"{yol}?tc={tc}"):
+                view()
+    finally:
+        backend.kisi_yaniti = asil
+    return girdiler
+
+def olc(islemler, tekrar):
+    saat = time.perf_counter_ns
+    for islem in islemler[:10]:  # ısındırma
+        islem()
+    sureler = []
+    for _ in range(tekrar):
+        for islem in islemler:
+            t0 = saat()
+            islem()
+            sureler.append(saat() - t0)
+    sureler.sort()
+
+    tracemalloc.start()
+    tepe = 0
+    for islem in islemler:
+        once = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        islem()
+        tepe += tracemalloc.get_traced_memory()[1] - once
+    tracemalloc.stop()
+    return {
+        'ortUs': round(sum(sureler) / len(sureler) / 1e3, 2),
+        'p99Us': round(sureler[int(len(sureler) * 0.99) - 1] / 1e3, 2),
+        'tepeBayt': round(tepe / len(islemler)),
+    }
+
+def rota_olc(app, yol, uc_nokta, tcler, tekrar):
+    girdiler = girdileri_topla(app, yol, uc_nokta, tcler)
+    eski_kisiler = [MappingProxyType(dict(kisi)) for kisi, _ in girdiler]
+    with app.test_request_context(f"{yol}?tc={tcler[0]}"):
+        backend.istek_baglami()  # handler'daki gibi: TC bağlamı kurulu, ?fields= yok
+        eski = [lambda k=k, e=e: backend.jsonify_utf8({**k, **e}) for k, (_, e) in zip(eski_kisiler, girdiler)]
+        yeni = [lambda k=k, e=e: backend.kisi_yaniti(k, e) for k, e in girdiler]
+        for e, y in zip(eski, yeni):
+            if e().get_data() != y().get_data():
+                raise AssertionError(f"{yol}: iki yazıcının gövdesi farklı")
+        sonuc = {'eski': olc(eski, tekrar), 'yeni': olc(yeni, tekrar)}
+    sonuc['eski']['kodlananBayt'] = round(sum(len(serilestirme.kodla({**k, **e})) for k, e in girdiler) / len(girdiler))
+    sonuc['yeni']['kodlananBayt'] = round(sum(len(serilestirme.kodla(e)) for _, e in girdiler) / len(girdiler))
+    return sonuc
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--tc', type=int, default=100, help='derlemdeki TC sayısı')
+    ap.add_argument('--tekrar', type=int, default=20, help='derlemin kaç kez dolaşılacağı')
+    ap.add_argument('--filtre', default='', help='yalnızca yolunda bu metin geçen rotalar')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    args = ap.parse_args()
+
+    gecikme.yapilandir('kapali')
+    backend.yanit_onbellegi.kapasite = 0
+    app = backend.app
+    tcler = gecerli_tcler(args.tc)
+
+    sonuclar = {yol: rota_olc(app, yol, uc_nokta, tcler, args.tekrar)
+                for yol, uc_nokta in api_rotalari(app) if args.filtre in yol}
+
+    print(f"{'rota':<40}{'ort µs':>16}{'p99 µs':>16}{'tepe B':>14}{'kodlanan B':>14}")
+    print(f"{'':<40}{'eski → yeni':>16}{'eski → yeni':>16}{'eski → yeni':>14}{'eski → yeni':>14}")
+    toplam = {'eski': 0.0, 'yeni': 0.0}
+    for yol, s in sonuclar.items():
+        e, y = s['eski'], s['yeni']
+        toplam['eski'] += e['ortUs']
+        toplam['yeni'] += y['ortUs']
+        print(f"{yol:<40}{e['ortUs']:>8.2f}{y['ortUs']:>8.2f}{e['p99Us']:>8.2f}{y['p99Us']:>8.2f}"
+              f"{e['tepeBayt']:>7}{y['tepeBayt']:>7}{e['kodlananBayt']:>7}{y['kodlananBayt']:>7}")
+    if sonuclar:
+        print(f"\nrota ortalaması: {toplam['eski'] / len(sonuclar):.2f} µs → {toplam['yeni'] / len(sonuclar):.2f} µs "
+              f"({(toplam['yeni'] - toplam['eski']) / toplam['eski'] * 100:+.1f}%)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'kodlayici': serilestirme.KODLAYICI_ADI, 'tcSayisi': args.tc,
+                       'tekrar': args.tekrar, 'sonuclar': sonuclar}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
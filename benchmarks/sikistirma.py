@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Yanıt sıkıştırmanın hat üzerindeki bayt ve istek başına CPU etkisi.
+
+Her rota için sabit TC derlemi üzerinde üç durum ölçülür:
+
+    identity     Accept-Encoding gönderilmez (mevcut çıktı)
+    <kod>-soguk  sıkıştırma açık, yanıt önbelleği kapalı (her istekte sıkıştırılır)
+    <kod>-sicak  sıkıştırma açık, önbellek dolu (sıkıştırılmış gövde yeniden kullanılır)
+
+    python benchmarks/sikistirma.py [--tc 50] [--json sonuc.json]
+"""
+import argparse
+import json
+import os
+import time
+
+os.environ.setdefault('NABI_GECIKME', 'kapali')
+
+from derlem import api_rotalari, gecerli_tcler  # noqa: E402
+
+import backend  # noqa: E402
+import sikistirma  # noqa: E402
+
+def olc(istemci, yollar, basliklar):
+    """İstek başına ortalama gövde baytı ve CPU süresi (µs)"""
+    bayt = 0
+    cpu = time.process_time()
+    for yol in yollar:
+        bayt += len(istemci.get(yol, headers=basliklar).data)
+    cpu = time.process_time() - cpu
+    return bayt / len(yollar), cpu / len(yollar) * 1e6
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--tc', type=int, default=50, help='rota başına TC sayısı')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    args = ap.parse_args()
+
+    istemci = backend.app.test_client()
+    tcler = gecerli_tcler(args.tc)
+    onbellek = backend.yanit_onbellegi
+    kapasite = onbellek.kapasite
+    sonuclar = {}
+
+    print(f"{'rota':<40}{'durum':>14}{'bayt':>9}{'oran':>8}{'CPU µs':>9}")
+    for yol, uc_nokta in api_rotalari(backend.app):
+        yollar = [f"{yol}?tc={tc}" for tc in tcler]
+        satir = {}
+        onbellek.kapasite = 0
+        satir['identity'] = olc(istemci, yollar, {})
+        for kod in sikistirma.TERCIH:
+            basliklar = {'Accept-Encoding': kod}
+            onbellek.kapasite = 0
+            satir[f'{kod}-soguk'] = olc(istemci, yollar, basliklar)
+            onbellek.kapasite = kapasite
+            onbellek.temizle()
+            olc(istemci, yollar, basliklar)  # ısındırma
+            satir[f'{kod}-sicak'] = olc(istemci, yollar, basliklar)
+        ham = satir['identity'][0]
+        for durum, (bayt, cpu) in satir.items():
+            print(f"{yol:<40}{durum:>14}{bayt:>9.0f}{bayt / ham:>8.2f}{cpu:>9.1f}")
+        sonuclar[uc_nokta] = {d: {'bayt': b, 'cpuUs': c} for d, (b, c) in satir.items()}
+    onbellek.kapasite = kapasite
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(sonuclar, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
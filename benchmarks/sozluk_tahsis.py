@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""Sözlük tablolarının istek başına bellek tahsisi ölçümü.
+
+Eski handler'lar her istekte aynı list/dict literal'lerini yeniden kuruyordu.
+Bu betik o davranışı (tabloların istek başına kopyası) sozluk modülündeki
+paylaşılan tablolarla karşılaştırır ve istek başına tahsis edilen blok/bayt
+sayısını ve süreyi raporlar.
+
+Gerçek handler'ları ölçmez: eski taraf, eski kodun tahsislerini yeni
+tablolar kopyalanarak taklit eden bir yaklaşıklıktır (öğe başına döngü içinde
+kurulan listeler bir kez sayılır). Yalnızca tablo kurulumunun payını gösterir;
+handler'ın uçtan uca süresi için benchmarks/uc_noktalar.py iki revizyonda
+ayrı ayrı çalıştırılıp --karsilastir ile karşılaştırılmalıdır.
+
+    python benchmarks/sozluk_tahsis.py [--tekrar 20000]
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sozluk  # noqa: E402
+
+KISI = {"il": "İstanbul", "ilce": "Kadıköy", "mahalle": "Zafer Mahallesi"}
+
+# Handler başına yeniden kurulan tablolar (literal'ler derleme zamanında sabit
+# olduğu için eski kodun tahsisi: yeni liste/dict kabukları + f-string'ler)
+_LISTELER = {
+    "tcden_kisi_uret": ("ADLAR", "SOYADLAR", "SEHIRLER", "ANNE_ADLARI", "BABA_ADLARI", "MAHALLELER", "SOKAKLAR"),
+    "rontgen_listesi": ("TETKIK_TURLERI", "TETKIK_SONUCLARI", "RADYOLOG_ADLARI", "RADYOLOG_SOYADLARI",
+                        "TETKIK_BRANSLARI", "TETKIK_BOLUMLERI", "ISTEYEN_DOKTOR_ADLARI", "ISTEYEN_DOKTOR_SOYADLARI"),
+    "recete_gecmisi": ("RECETE_BRANSLARI", "RECETE_DOKTOR_ADLARI", "RECETE_DOKTOR_SOYADLARI",
+                       "ECZACI_ADLARI", "ECZACI_SOYADLARI", "RECETE_TIPLERI"),
+    "pasaport_sorgu": ("ULKELER", "YURTDISI_SEHIRLER", "SEYAHAT_AMACLARI", "VIZE_ULKELERI", "VIZE_TIPLERI",
+                       "AMIR_ADLARI", "AMIR_SOYADLARI"),
+    "ehliyet_sorgu": ("KAN_GRUPLARI", "CEZA_TIPLERI"),
+    "kronik_hastalik": (),
+    "asi_kayitlari": ("ASI_TURLERI", "ASI_UYGULAYAN_ADLARI", "ASI_UYGULAYAN_SOYADLARI",
+                      "ASI_UYGULAMA_YERLERI", "AILE_HEKIMI_ADLARI", "AILE_HEKIMI_SOYADLARI"),
+    "askerlik": ("ASKERI_BIRLIKLER", "ASKERLIK_SAGLIK_DURUMLARI", "ASKERLIK_SINIFLARI"),
+}
+_SOZLUKLER = {
+    "recete_gecmisi": ("ILACLAR",),
+    "pasaport_sorgu": ("PASAPORT_TIPLERI",),
+    "ehliyet_sorgu": ("EHLIYET_SINIFLARI",),
+    "kronik_hastalik": ("HASTALIKLAR",),
+}
+_KALIPLAR = {
+    "rontgen_listesi": "HASTANE_KALIPLARI",
+    "recete_gecmisi": "ECZANE_KALIPLARI",
+}
+
+def eski_kur(handler):
+    """Eski kodun istek başına yaptığı tablo kurulumunu taklit eder"""
+    tablolar = [list(getattr(sozluk, ad)) for ad in _LISTELER[handler]]
+    tablolar += [[dict(d) for d in getattr(sozluk, ad)] for ad in _SOZLUKLER.get(handler, ())]
+    if handler == "tcden_kisi_uret":
+        tablolar.append({il: list(ilceler) for il, ilceler in sozluk.ILCELER.items()})
+    if handler in _KALIPLAR:
+        tablolar.append([k.format_map(KISI) for k in getattr(sozluk, _KALIPLAR[handler])])
+    return tablolar
+
+def yeni_kur(handler):
+    """Yeni kod: tablolar paylaşılır, yalnızca seçilen kalıp biçimlendirilir"""
+    tablolar = [getattr(sozluk, ad) for ad in _LISTELER[handler]]
+    tablolar += [getattr(sozluk, ad) for ad in _SOZLUKLER.get(handler, ())]
+    if handler in _KALIPLAR:
+        tablolar.append(getattr(sozluk, _KALIPLAR[handler])[0].format_map(KISI))
+    return tablolar
+
+def tahsis_olc(fonk, handler, tekrar):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    once = tracemalloc.take_snapshot()
+    tut = [fonk(handler) for _ in range(tekrar)]  # sonuçları canlı tut ki sayılsın
+    sonra = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    fark = sonra.compare_to(once, "filename")
+    bayt = sum(s.size_diff for s in fark if s.size_diff > 0)
+    blok = sum(s.count_diff for s in fark if s.count_diff > 0)
+    del tut
+    return blok / tekrar, bayt / tekrar
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--tekrar", type=int, default=20000)
+    args = ap.parse_args()
+
+    print(f"{'handler':<18}{'eski blok':>11}{'yeni blok':>11}{'eski bayt':>11}{'yeni bayt':>11}{'eski µs':>10}{'yeni µs':>10}")
+    for handler in _LISTELER:
+        eb, eby = tahsis_olc(eski_kur, handler, args.tekrar)
+        yb, yby = tahsis_olc(yeni_kur, handler, args.tekrar)
+        es = timeit.timeit(lambda: eski_kur(handler), number=args.tekrar) / args.tekrar * 1e6
+        ys = timeit.timeit(lambda: yeni_kur(handler), number=args.tekrar) / args.tekrar * 1e6
+        print(f"{handler:<18}{eb:>11.1f}{yb:>11.1f}{eby:>11.0f}{yby:>11.0f}{es:>10.2f}{ys:>10.2f}")
+
+if __name__ == "__main__":
+    main()
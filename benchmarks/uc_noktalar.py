@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""Uç nokta ve üretici fonksiyon mikro ölçümleri.
+
+Sabit bir TC derlemi üzerinde:
+
+    istemci:<rota>   Flask test istemcisi ile tam istek (yönlendirme, kancalar, kodlama)
+    handler:<rota>   handler fonksiyonu doğrudan (istek bağlamı içinde, kancasız)
+    uretici:<ad>     tc_dogrula, kişi üretimi, tarih_uret, tarih_saat_uret, JSON kodlama
+
+Her satır için işlem/sn, ortalama ve p99 gecikme, işlem başına tepe bellek
+tahsisi ve yanıt boyutu raporlanır. Simüle gecikmeler kapatılır; önbellekler
+varsayılan olarak kapalıdır (--onbellekli ile açık ölçülür).
+
+    python benchmarks/uc_noktalar.py --json sonuc.json
+    python benchmarks/uc_noktalar.py --json yeni.json --karsilastir sonuc.json
+    python benchmarks/uc_noktalar.py --filtre recete
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+from derlem import api_rotalari, gecerli_tcler
+
+import backend  # noqa: E402
+import gecikme  # noqa: E402
+import serilestirme  # noqa: E402
+
+def olc(ad, islemler, tekrar, boyut=None):
+    """islemler: argümansız çağrılabilirler (derlemdeki her TC için bir tane)"""
+    for islem in islemler[:10]:  # ısındırma
+        islem()
+
+    sureler = []
+    saat = time.perf_counter_ns
+    for _ in range(tekrar):
+        for islem in islemler:
+            t0 = saat()
+            islem()
+            sureler.append(saat() - t0)
+    sureler.sort()
+    toplam = sum(sureler)
+
+    # Tahsis ölçümü ayrı turda: tracemalloc süre ölçümünü bozmasın
+    tracemalloc.start()
+    tepe = 0
+    for islem in islemler:
+        once = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        islem()
+        tepe += tracemalloc.get_traced_memory()[1] - once
+    tracemalloc.stop()
+
+    return {
+        'opsSn': round(len(sureler) / (toplam / 1e9), 1),
+        'ortUs': round(toplam / len(sureler) / 1e3, 2),
+        'p99Us': round(sureler[int(len(sureler) * 0.99) - 1] / 1e3, 2),
+        'tepeBayt': round(tepe / len(islemler)),
+        'boyut': boyut,
+    }
+
+def istemci_islemleri(istemci, yol, tcler):
+    return [lambda u=f"{yol}?tc={tc}": istemci.get(u) for tc in tcler]
+
+def handler_islemleri(app, yol, uc_nokta, tcler):
+    view = app.view_functions[uc_nokta]
+
+    def islem(u):
+        with app.test_request_context(u):
+            return view()
+    return [lambda u=f"{yol}?tc={tc}": islem(u) for tc in tcler]
+
+def uretici_olcumleri(tcler, tekrar, onbellekli):
+    kisi = backend.tcden_kisi_uret if onbellekli else backend._kisi_hesapla
+    govdeler = []
+    with backend.app.test_request_context():
+        for tc in tcler[:20]:
+            govdeler.append(dict(backend.tcden_kisi_uret(tc)))
+    return {
+        'uretici:tc_dogrula': olc('tc_dogrula', [lambda t=tc: backend.tc_dogrula(t) for tc in tcler], tekrar),
+        'uretici:tcden_kisi_uret': olc('kisi', [lambda t=tc: kisi(t) for tc in tcler], tekrar),
+        'uretici:tarih_uret': olc('tarih', [lambda t=tc: backend.tarih_uret(t, 365) for tc in tcler], tekrar),
+        'uretici:tarih_saat_uret': olc('tarih_saat', [lambda t=tc: backend.tarih_saat_uret(t) for tc in tcler], tekrar),
+        'uretici:kodla': olc('kodla', [lambda v=v: serilestirme.kodla(v) for v in govdeler], tekrar),
+    }
+
+def karsilastir(yeni, eski):
+    print(f"\n{'ölçüm':<52}{'ort eski':>10}{'ort yeni':>10}{'fark':>8}{'p99 fark':>10}")
+    for ad, y in yeni['sonuclar'].items():
+        e = eski['sonuclar'].get(ad)
+        if not e:
+            continue
+        fark = (y['ortUs'] - e['ortUs']) / e['ortUs'] * 100
+        p99_fark = (y['p99Us'] - e['p99Us']) / e['p99Us'] * 100
+        print(f"{ad:<52}{e['ortUs']:>10.2f}{y['ortUs']:>10.2f}{fark:>+7.1f}%{p99_fark:>+9.1f}%")
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--tc', type=int, default=100, help='derlemdeki TC sayısı')
+    ap.add_argument('--tekrar', type=int, default=5, help='derlemin kaç kez dolaşılacağı')
+    ap.add_argument('--filtre', default='', help='yalnızca adında bu metin geçen ölçümler')
+    ap.add_argument('--onbellekli', action='store_true', help='kişi ve yanıt önbelleklerini açık bırak')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    ap.add_argument('--karsilastir', help='önceki bir --json çıktısı ile karşılaştır')
+    args = ap.parse_args()
+
+    gecikme.yapilandir('kapali')
+    if not args.onbellekli:
+        backend.kisi_onbellegi.kapasite = 0
+        backend.yanit_onbellegi.kapasite = 0
+
+    app = backend.app
+    istemci = app.test_client()
+    tcler = gecerli_tcler(args.tc)
+    sonuclar = {}
+
+    for yol, uc_nokta in api_rotalari(app):
+        boyut = len(istemci.get(f"{yol}?tc={tcler[0]}").data)
+        for ad, islemler in (
+            (f"istemci:{yol}", istemci_islemleri(istemci, yol, tcler)),
+            (f"handler:{yol}", handler_islemleri(app, yol, uc_nokta, tcler)),
+        ):
+            if args.filtre in ad:
+                sonuclar[ad] = olc(ad, islemler, args.tekrar, boyut)
+    for ad, sonuc in uretici_olcumleri(tcler, args.tekrar, args.onbellekli).items():
+        if args.filtre in ad:
+            sonuclar[ad] = sonuc
+
+    print(f"{'ölçüm':<52}{'işlem/sn':>10}{'ort µs':>9}{'p99 µs':>9}{'tepe B':>9}{'boyut':>7}")
+    for ad, s in sonuclar.items():
+        print(f"{ad:<52}{s['opsSn']:>10.0f}{s['ortUs']:>9.1f}{s['p99Us']:>9.1f}{s['tepeBayt']:>9}{s['boyut'] or '':>7}")
+
+    cikti = {
+        'meta': {
+            'tarih': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'kodlayici': serilestirme.KODLAYICI_ADI,
+            'tcSayisi': args.tc,
+            'tekrar': args.tekrar,
+            'onbellekli': args.onbellekli,
+        },
+        'sonuclar': sonuclar,
+    }
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(cikti, f, ensure_ascii=False, indent=2)
+    if args.karsilastir:
+        with open(args.karsilastir, encoding='utf-8') as f:
+            karsilastir(cikti, json.load(f))
+
+if __name__ == '__main__':
+    main()
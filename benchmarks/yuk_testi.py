@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""Kapalı döngü yük testi.
+
+Uygulamayı seçilen worker modeliyle gunicorn altında yerelde başlatır,
+/api/v1/* rotalarının ağırlıklı bir karışımını hedef eşzamanlılıkla oynatır
+ve rota başına verim, p50/p95/p99 gecikme ve hata oranını raporlar. Worker
+süreçlerinin CPU süresi ve RSS'i /proc üzerinden okunur (yalnızca Linux).
+
+    python benchmarks/yuk_testi.py --model gthread --isci 4 --eszamanli 64 --sure 20
+    python benchmarks/yuk_testi.py --model sync --gecikme kapali
+    python benchmarks/yuk_testi.py --model async --karisim nufus_sorgu=10,rontgen_listesi=1
+    python benchmarks/yuk_testi.py --rota-basina --sure 5   # rota başına worker CPU/RSS
+
+async modeli uvicorn kurulu olmasını gerektirir.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from derlem import KOK, api_rotalari, gecerli_tcler
+
+import backend  # noqa: E402  (yalnızca rota listesi için)
+
+_SAAT_TIK = os.sysconf('SC_CLK_TCK')
+
+# ========== SUNUCU ==========
+def bos_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def sunucu_baslat(model, isci, thread, port, gecikme_modu):
+    komut = [sys.executable, '-m', 'gunicorn', '-b', f'127.0.0.1:{port}', '-w', str(isci),
+             '--log-level', 'warning']
+    if model == 'sync':
+        komut += ['-k', 'sync', 'backend:app']
+    elif model == 'gthread':
+        komut += ['-k', 'gthread', '--threads', str(thread), 'backend:app']
+    elif model == 'async':
+        komut += ['-k', 'uvicorn.workers.UvicornWorker', 'asgi:app']
+    else:
+        raise ValueError(f"Bilinmeyen worker modeli: {model}")
+    ortam = dict(os.environ)
+    if gecikme_modu == 'kapali':
+        ortam['NABI_GECIKME'] = 'kapali'
+    else:
+        ortam.pop('NABI_GECIKME', None)
+    surec = subprocess.Popen(komut, cwd=KOK, env=ortam)
+
+    son = time.monotonic() + 30
+    while time.monotonic() < son:
+        if surec.poll() is not None:
+            raise RuntimeError(f"gunicorn başlatılamadı (çıkış kodu {surec.returncode})")
+        try:
+            baglanti = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            baglanti.request('GET', '/api/v1/nufus/sorgu?tc=10000000146')
+            baglanti.getresponse().read()
+            baglanti.close()
+            return surec
+        except OSError:
+            time.sleep(0.1)
+    surec.terminate()
+    raise RuntimeError("gunicorn 30 saniyede hazır olmadı")
+
+def isci_pidleri(ana_pid):
+    pidler = []
+    for ad in os.listdir('/proc'):
+        if not ad.isdigit():
+            continue
+        try:
+            with open(f'/proc/{ad}/stat') as f:
+                alanlar = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        if int(alanlar[1]) == ana_pid:
+            pidler.append(int(ad))
+    return pidler
+
+def surec_olc(pidler):
+    """pid -> (CPU saniyesi, RSS KiB)"""
+    sonuc = {}
+    for pid in pidler:
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                alanlar = f.read().rsplit(')', 1)[1].split()
+            with open(f'/proc/{pid}/status') as f:
+                rss = next(int(s.split()[1]) for s in f if s.startswith('VmRSS:'))
+        except (OSError, StopIteration):
+            continue
+        sonuc[pid] = ((int(alanlar[11]) + int(alanlar[12])) / _SAAT_TIK, rss)
+    return sonuc
+
+# ========== YÜK ÜRETİCİ ==========
+class Kayitci:
+    def __init__(self):
+        self.kilit = threading.Lock()
+        self.sureler = defaultdict(list)
+        self.durumlar = defaultdict(Counter)
+
+    def ekle(self, rota, sure, durum):
+        with self.kilit:
+            self.sureler[rota].append(sure)
+            self.durumlar[rota][durum] += 1
+
+def istemci_dongusu(port, rotalar, agirliklar, tcler, bitis, olcum_basi, kayitci, tohum, basliklar):
+    rnd = random.Random(tohum)
+    baglanti = None
+    while True:
+        simdi = time.monotonic()
+        if simdi >= bitis:
+            break
+        rota = rnd.choices(rotalar, agirliklar)[0]
+        yol = f"{rota}?tc={rnd.choice(tcler)}"
+        t0 = time.perf_counter()
+        try:
+            if baglanti is None:
+                baglanti = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            baglanti.request('GET', yol, headers=basliklar)
+            yanit = baglanti.getresponse()
+            yanit.read()
+            durum = yanit.status
+            if yanit.getheader('Connection', '').lower() == 'close':
+                baglanti.close()
+                baglanti = None
+        except (OSError, http.client.HTTPException):
+            durum = 'hata'
+            if baglanti is not None:
+                baglanti.close()
+            baglanti = None
+        if t0 >= olcum_basi:  # ısınma dönemindeki istekler sayılmaz
+            kayitci.ekle(rota, time.perf_counter() - t0, durum)
+    if baglanti is not None:
+        baglanti.close()
+
+def yuzdelik(sirali, p):
+    return sirali[min(len(sirali) - 1, int(len(sirali) * p))] if sirali else 0.0
+
+def yuk_uygula(port, karisim, tcler, eszamanli, sure, isinma, basliklar):
+    rotalar = list(karisim)
+    agirliklar = [karisim[r] for r in rotalar]
+    kayitci = Kayitci()
+    olcum_basi = time.perf_counter() + isinma
+    bitis = time.monotonic() + isinma + sure
+    threadler = [
+        threading.Thread(target=istemci_dongusu, daemon=True,
+                         args=(port, rotalar, agirliklar, tcler, bitis, olcum_basi, kayitci, i, basliklar))
+        for i in range(eszamanli)
+    ]
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+    return kayitci
+
+def ozetle(kayitci, sure):
+    satirlar = {}
+    for rota in sorted(kayitci.sureler):
+        sirali = sorted(kayitci.sureler[rota])
+        durumlar = kayitci.durumlar[rota]
+        toplam = sum(durumlar.values())
+        hatali = sum(n for d, n in durumlar.items() if d == 'hata' or d >= 500 or d == 429)
+        satirlar[rota] = {
+            'istek': toplam,
+            'istekSn': round(toplam / sure, 1),
+            'p50Ms': round(yuzdelik(sirali, 0.50) * 1e3, 2),
+            'p95Ms': round(yuzdelik(sirali, 0.95) * 1e3, 2),
+            'p99Ms': round(yuzdelik(sirali, 0.99) * 1e3, 2),
+            'hataOrani': round(hatali / toplam, 4) if toplam else 0.0,
+            'durumlar': {str(d): n for d, n in durumlar.items()},
+        }
+    return satirlar
+
+def yazdir(satirlar):
+    print(f"{'rota':<42}{'istek/sn':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'hata':>8}{'CPU ms/ist':>12}")
+    for rota, s in satirlar.items():
+        cpu = f"{s['cpuMsIstek']:.2f}" if 'cpuMsIstek' in s else ''
+        print(f"{rota:<42}{s['istekSn']:>10.1f}{s['p50Ms']:>9.2f}{s['p95Ms']:>9.2f}{s['p99Ms']:>9.2f}"
+              f"{s['hataOrani']:>8.2%}{cpu:>12}")
+
+def karisim_oku(metin, rotalar):
+    uc_noktadan = {uc: yol for yol, uc in rotalar}
+    if not metin:
+        return {yol: 1.0 for yol, _ in rotalar}
+    karisim = {}
+    for oge in metin.split(','):
+        ad, _, agirlik = oge.partition('=')
+        ad = ad.strip()
+        yol = uc_noktadan.get(ad, ad)
+        if yol not in dict(rotalar):
+            raise SystemExit(f"Bilinmeyen rota: {ad}")
+        karisim[yol] = float(agirlik or 1)
+    return karisim
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument('--model', choices=('sync', 'gthread', 'async'), default='sync')
+    ap.add_argument('--isci', type=int, default=2, help='gunicorn worker sayısı')
+    ap.add_argument('--thread', type=int, default=8, help='gthread için worker başına thread')
+    ap.add_argument('--eszamanli', type=int, default=16, help='eşzamanlı istemci sayısı')
+    ap.add_argument('--sure', type=float, default=15, help='ölçüm süresi (sn)')
+    ap.add_argument('--isinma', type=float, default=2, help='ısınma süresi (sn)')
+    ap.add_argument('--gecikme', choices=('acik', 'kapali'), default='acik',
+                    help='rontgen_listesi ve adli_sicil simüle gecikmeleri')
+    ap.add_argument('--karisim', default='', help='uc_nokta=agirlik,... (varsayılan: tüm rotalar eşit)')
+    ap.add_argument('--gzip', action='store_true', help='Accept-Encoding: gzip gönder')
+    ap.add_argument('--rota-basina', action='store_true',
+                    help='her rotayı ayrı ayrı yükleyip rota başına worker CPU/RSS ölç')
+    ap.add_argument('--json', help='sonuçların yazılacağı dosya')
+    args = ap.parse_args()
+
+    if args.model == 'async':
+        try:
+            import uvicorn  # noqa: F401
+        except ImportError:
+            raise SystemExit("async modeli için uvicorn gerekli: pip install uvicorn")
+
+    rotalar = api_rotalari(backend.app)
+    karisim = karisim_oku(args.karisim, rotalar)
+    tcler = gecerli_tcler(500)
+    basliklar = {'Accept-Encoding': 'gzip'} if args.gzip else {}
+    port = bos_port()
+    sunucu = sunucu_baslat(args.model, args.isci, args.thread, port, args.gecikme)
+    try:
+        pidler = isci_pidleri(sunucu.pid)
+        if args.rota_basina:
+            satirlar = {}
+            for rota in karisim:
+                once = surec_olc(pidler)
+                kayitci = yuk_uygula(port, {rota: 1.0}, tcler, args.eszamanli, args.sure, args.isinma, basliklar)
+                sonra = surec_olc(pidler)
+                satir = ozetle(kayitci, args.sure).get(rota)
+                if not satir:
+                    continue
+                # CPU ısınma dahil ölçülür; ısınmadaki istekler de oranlanır
+                toplam_istek = satir['istek'] * (args.sure + args.isinma) / args.sure
+                cpu = sum(sonra[p][0] - once[p][0] for p in sonra if p in once)
+                satir['cpuMsIstek'] = round(cpu / toplam_istek * 1e3, 3)
+                satir['rssKiB'] = sum(r for _, r in sonra.values())
+                satirlar[rota] = satir
+        else:
+            once = surec_olc(pidler)
+            kayitci = yuk_uygula(port, karisim, tcler, args.eszamanli, args.sure, args.isinma, basliklar)
+            sonra = surec_olc(pidler)
+            satirlar = ozetle(kayitci, args.sure)
+    finally:
+        sunucu.terminate()
+        sunucu.wait(timeout=30)
+
+    yazdir(satirlar)
+    toplam = sum(s['istek'] for s in satirlar.values())
+    hatali = sum(s['istek'] * s['hataOrani'] for s in satirlar.values())
+    print(f"\nmodel={args.model} isci={args.isci} eszamanli={args.eszamanli} gecikme={args.gecikme}")
+    print(f"toplam verim: {toplam / args.sure:.1f} istek/sn, hata oranı: {hatali / max(toplam, 1):.2%}")
+    if not args.rota_basina:
+        cpu = sum(sonra[p][0] - once[p][0] for p in sonra if p in once)
+        print(f"worker CPU: {cpu:.2f} sn ({cpu / max(toplam, 1) * 1e3:.3f} ms/istek), "
+              f"RSS: " + ", ".join(f"{pid}={rss // 1024} MiB" for pid, (_, rss) in sorted(sonra.items())))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'ayar': vars(args), 'rotalar': satirlar}, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Simüle edilen servis gecikmeleri.
+
+Gecikme süresi burada hesaplanır; beklemenin kendisi çalışma moduna göre
+yapılır. Senkron (WSGI) modda backend'in istek ön işlemesi time.sleep ile
+bekler. Asenkron (ASGI) modda asgi.py event loop üzerinde bekler ve ortam
+anahtarı ile beklemenin yapıldığını bildirir.
+
+Her gecikmeli uç nokta için bir gecikme profili seçilir:
+
+    kapali                            gecikme yok
+    sabit        sure                 her istekte aynı süre
+    duzgun       en_az, en_cok        [en_az, en_cok) aralığında düzgün dağılım
+    uzun_kuyruk  medyan, p99, en_cok  log-normal; p99 hedefine göre ayarlanır
+
+Ayarlar ortam değişkenlerinden okunur:
+
+    NABI_GECIKME        JSON ayar ya da tüm uç noktalar için tek mod adı
+                        (ör. "kapali")
+    NABI_GECIKME_DOSYA  aynı biçimde JSON ayar dosyası
+    NABI_GECIKME_TOHUM  verilirse örnekler tekrarlanabilir olur
+
+JSON ayar örneği (İngilizce mod adları da kabul edilir: off, fixed,
+uniform, longtail):
+
+    {"*": {"mod": "kapali"},
+     "rontgen_listesi": {"mod": "uzun_kuyruk", "medyan": 0.3, "p99": 1.2}}
+
+İstemci X-Deadline-Ms başlığı ile kalan süre bütçesini (milisaniye)
+gönderirse hiçbir istek bu bütçeden uzun beklemez.
+"""
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from statistics import NormalDist
+
+import rastgele
+
+# Varsayılan profiller: uç nokta -> (en az, en çok) saniye
+GECIKMELI_UC_NOKTALAR = {
+    'rontgen_listesi': (0.2, 0.7),
+    'adli_sicil': (0.4, 1.0),
+}
+
+# WSGI environ içinde gecikmenin daha önce (ör. ASGI katmanında) uygulandığını belirtir
+ORTAM_ANAHTARI = 'nabisorgun.gecikme_uygulandi'
+
+# İstemcinin kalan süre bütçesi (milisaniye)
+BUTCE_BASLIGI = 'HTTP_X_DEADLINE_MS'
+
+_MOD_ADLARI = {
+    'kapali': 'kapali', 'off': 'kapali',
+    'sabit': 'sabit', 'fixed': 'sabit',
+    'duzgun': 'duzgun', 'uniform': 'duzgun',
+    'uzun_kuyruk': 'uzun_kuyruk', 'longtail': 'uzun_kuyruk',
+}
+
+# Standart normal dağılımın %99 noktası
+_Z99 = NormalDist().inv_cdf(0.99)
+
+# ========== PROFİLLER ==========
+class GecikmeProfili:
+    """Tek bir uç noktanın gecikme dağılımı"""
+    __slots__ = ('mod', 'sure', 'en_az', 'en_cok', '_mu', '_sigma')
+
+    def __init__(self, mod='kapali', sure=0.0, en_az=0.0, en_cok=None, medyan=None, p99=None):
+        if mod not in _MOD_ADLARI:
+            raise ValueError(f"Bilinmeyen gecikme modu: {mod!r}")
+        self.mod = _MOD_ADLARI[mod]
+        self.sure = float(sure)
+        self.en_az = float(en_az)
+        self.en_cok = float(en_cok) if en_cok is not None else None
+        self._mu = self._sigma = 0.0
+        if self.mod == 'duzgun' and (self.en_cok is None or self.en_cok < self.en_az):
+            raise ValueError("duzgun profil için en_az <= en_cok gerekir")
+        if self.mod == 'uzun_kuyruk':
+            if not medyan or not p99 or p99 < medyan:
+                raise ValueError("uzun_kuyruk profil için 0 < medyan <= p99 gerekir")
+            self._mu = math.log(medyan)
+            self._sigma = math.log(p99 / medyan) / _Z99
+
+    @classmethod
+    def ayardan(cls, ayar):
+        if isinstance(ayar, str):
+            return cls(ayar)
+        ayar = dict(ayar)
+        return cls(ayar.pop('mod'), **ayar)
+
+    def ornekle(self, u):
+        """[0, 1) aralığındaki u değerini gecikme süresine çevirir (ters CDF)"""
+        if self.mod == 'kapali':
+            return 0.0
+        if self.mod == 'sabit':
+            return self.sure
+        if self.mod == 'duzgun':
+            return self.en_az + (self.en_cok - self.en_az) * u
+        u = min(max(u, 1e-12), 1 - 1e-12)
+        sure = math.exp(self._mu + self._sigma * NormalDist().inv_cdf(u))
+        return min(sure, self.en_cok) if self.en_cok is not None else sure
+
+    def __repr__(self):
+        return f"GecikmeProfili({self.mod!r})"
+
+_profiller = {}
+_tohum = None
+_siralar = {}
+_kilit = threading.Lock()
+
+def yapilandir(ayar=None, tohum=None):
+    """Profilleri ayarlar; ayar verilmeyen uç noktalar varsayılana döner"""
+    global _profiller, _tohum, _siralar
+    if isinstance(ayar, str):
+        ayar = {'*': ayar}
+    ayar = dict(ayar or {})
+    genel = ayar.pop('*', None)
+    bilinmeyen = set(ayar) - set(GECIKMELI_UC_NOKTALAR)
+    if bilinmeyen:
+        raise ValueError(f"Gecikmeli olmayan uç nokta için profil: {sorted(bilinmeyen)}")
+
+    profiller = {}
+    for uc_nokta, (en_az, en_cok) in GECIKMELI_UC_NOKTALAR.items():
+        if uc_nokta in ayar:
+            profiller[uc_nokta] = GecikmeProfili.ayardan(ayar[uc_nokta])
+        elif genel is not None:
+            profiller[uc_nokta] = GecikmeProfili.ayardan(genel)
+        else:
+            profiller[uc_nokta] = GecikmeProfili('duzgun', en_az=en_az, en_cok=en_cok)
+    with _kilit:
+        _profiller = profiller
+        _tohum = int(tohum) if tohum is not None else None
+        _siralar = {uc_nokta: itertools.count() for uc_nokta in profiller}
+
+def ortamdan_yapilandir(ortam=os.environ):
+    """NABI_GECIKME / NABI_GECIKME_DOSYA / NABI_GECIKME_TOHUM değişkenlerini uygular"""
+    ayar = None
+    if ortam.get('NABI_GECIKME_DOSYA'):
+        with open(ortam['NABI_GECIKME_DOSYA'], encoding='utf-8') as f:
+            ayar = json.load(f)
+    metin = ortam.get('NABI_GECIKME', '').strip()
+    if metin:
+        ayar = json.loads(metin) if metin.startswith('{') else metin
+    yapilandir(ayar, ortam.get('NABI_GECIKME_TOHUM') or None)
+
+def profil(uc_nokta):
+    return _profiller.get(uc_nokta)
+
+def etkin_mi():
+    """En az bir uç noktada gecikme açık mı"""
+    return any(p.mod != 'kapali' for p in _profiller.values())
+
+# ========== ÖRNEKLEME VE BEKLEME ==========
+def butce_oku(environ):
+    """X-Deadline-Ms başlığından kalan bütçeyi saniye olarak döner (yoksa None)"""
+    deger = environ.get(BUTCE_BASLIGI)
+    if not deger:
+        return None
+    try:
+        return max(0.0, float(deger) / 1000.0)
+    except ValueError:
+        return None
+
+def gecikme_suresi(uc_nokta, tc, butce=None):
+    """Uç nokta ve TC için bu çağrıya özel gecikme süresi (saniye)"""
+    p = _profiller.get(uc_nokta)
+    if p is None or p.mod == 'kapali':
+        return 0.0
+    if _tohum is None:
+        u = rastgele.birim(tc, uc_nokta, rastgele.tekil())
+    else:
+        # Tohumlu modda aynı istek sırası aynı gecikmeleri üretir
+        u = rastgele.birim(_tohum, uc_nokta, tc, next(_siralar[uc_nokta]))
+    sure = p.ornekle(u)
+    return min(sure, butce) if butce is not None else sure
+
+def uygula(uc_nokta, tc, environ):
+    """Senkron modda gecikmeyi uygular; ASGI katmanı zaten beklediyse atlar"""
+    if environ.get(ORTAM_ANAHTARI):
+        return
+    sure = gecikme_suresi(uc_nokta, tc, butce_oku(environ))
+    if sure > 0:
+        time.sleep(sure)
+
+ortamdan_yapilandir()
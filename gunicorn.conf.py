@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Üretim gunicorn ayarları.
+
+    python sunucu.py
+    gunicorn -c gunicorn.conf.py
+
+Uygulama master'da bir kez yüklenir (preload): sabit tablolar ve tarih
+belleği fork'tan önce kurulur, ardından gc.freeze ile kalıcı nesilde
+dondurulur. Döngüsel GC dondurulmuş nesnelerin başlıklarına yazmadığı için
+bu sayfalar worker'lar arasında copy-on-write ile paylaşılmaya devam eder.
+
+Worker sınıfı gecikme ayarına göre seçilir: simüle gecikme kapalıysa iş
+tamamen CPU'ya bağlıdır ve çekirdek başına bir sync worker yeterlidir.
+Gecikme açıksa worker bekleme sırasında başka istek alabilmelidir: uvicorn
+kuruluysa ASGI modu (asgi:app), değilse gthread kullanılır.
+
+    NABI_BAGLANTI        dinlenecek adres (varsayılan 0.0.0.0:5000)
+    NABI_ISCI            worker sayısı (varsayılan: kullanılabilir CPU sayısı)
+    NABI_ISCI_SINIFI     sync | gthread | async (varsayılan: yukarıdaki seçim)
+    NABI_THREAD          gthread için worker başına thread (varsayılan 8)
+    NABI_MAX_ISTEK       worker bu kadar istekten sonra yenilenir (0: hiç)
+    NABI_ONYUKLE         0: preload kapalı, her worker uygulamayı kendi yükler
+    NABI_GC_DONDUR       0: fork öncesi gc.freeze yapılmaz
+"""
+import gc
+import glob
+import os
+import sys
+
+KOK = os.path.dirname(os.path.abspath(__file__))
+if KOK not in sys.path:
+    sys.path.insert(0, KOK)
+
+import gecikme  # noqa: E402
+
+def _cpu_sayisi():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def _uvicorn_var():
+    try:
+        import uvicorn.workers  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _isci_sinifi():
+    sinif = os.environ.get('NABI_ISCI_SINIFI')
+    if sinif:
+        if sinif not in ('sync', 'gthread', 'async'):
+            raise ValueError(f"Bilinmeyen worker sınıfı: {sinif!r}")
+        return sinif
+    if not gecikme.etkin_mi():
+        return 'sync'
+    return 'async' if _uvicorn_var() else 'gthread'
+
+_SINIF = _isci_sinifi()
+_ONYUKLE = os.environ.get('NABI_ONYUKLE', '1') != '0'
+_GC_DONDUR = os.environ.get('NABI_GC_DONDUR', '1') != '0'
+
+chdir = KOK
+bind = os.environ.get('NABI_BAGLANTI', '0.0.0.0:5000')
+workers = int(os.environ.get('NABI_ISCI', 0)) or _cpu_sayisi()
+preload_app = _ONYUKLE
+max_requests = int(os.environ.get('NABI_MAX_ISTEK', 0))
+max_requests_jitter = max_requests // 10
+if _SINIF == 'async':
+    wsgi_app = 'asgi:app'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'backend:app'
+    worker_class = _SINIF
+    threads = int(os.environ.get('NABI_THREAD', 8)) if _SINIF == 'gthread' else 1
+
+def on_starting(server):
+    # Ölmüş worker'ların metrik dosyaları önceki çalıştırmadan kalmasın
+    dizin = os.environ.get('NABI_METRIK_DIZIN')
+    if dizin:
+        for yol in glob.glob(os.path.join(dizin, 'metrik-*.json*')):
+            try:
+                os.remove(yol)
+            except OSError:
+                pass
+
+def when_ready(server):
+    # preload: uygulama master'da yüklendi, ilk fork'tan hemen önceyiz
+    backend = sys.modules.get('backend')
+    if backend is None:
+        return
+    backend.isit()
+    if _GC_DONDUR:
+        gc.collect()
+        gc.freeze()
+    server.log.info("Ön ısıtma tamam (%d nesne donduruldu)", gc.get_freeze_count())
+
+def post_worker_init(worker):
+    backend = sys.modules.get('backend')
+    if backend is None:
+        return
+    if not _ONYUKLE:
+        backend.isit()
+    # Worker sinyallerini kendisi kurar; preload'da master'ın SIGUSR2'si kaybolur
+    import ornekleyici
+    ornekleyici.sinyal_kur()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Sık çağrılan GET rotaları için WSGI hızlı yolu.
+
+Ucuz uç noktalarda (istanbulkart, avci_lisans, kredi_risk vb.) istek
+süresinin önemli bir kısmı Flask'ın kendisine gider: istek bağlamının
+kurulması, url_map eşleştirmesi, request.args ayrıştırması, kancalar ve
+Response nesnesi. Hızlı yol Flask'ın önünde duran bir WSGI ara katmanıdır:
+yolu önceden kurulmuş bir sözlükte arar, sorgu dizesinden yalnızca tc'yi
+okur ve gövdeyi hazır başlık listesiyle doğrudan döndürür.
+
+Yalnızca şu istekleri üstlenir, geri kalan her şey Flask'a olduğu gibi geçer:
+
+    - GET ve yol tablodaki bir rota (bildirimsel tanımlı, gecikmesiz,
+      kabul kapısı olmayan uç noktalar)
+    - sorgu dizesi tam olarak tc=<11 rakam> (pretty, fields vb. yok)
+    - If-None-Match başlığı yok (304 Flask'ta verilir)
+    - işleyici kabul etti (geçersiz TC'nin 404'ü ön retten ya da Flask'tan gelir)
+
+Üstlenilen yanıtın gövdesi ve başlıkları (ETag, Cache-Control, Vary,
+Content-Encoding) Flask yolundakiyle aynıdır; yanıt önbelleği, kota ve
+metrikler aynı şekilde işler (bkz. backend.hizli_yanit). Sürekli
+örnekleyici (NABI_ORNEKLEYICI_HZ) açıkken hızlı yol kurulmaz; örnekleyici
+rotayı Flask istek bağlamından öğrenir.
+
+Ön ret (OnRed) aynı katmanda, hızlı yolun da önünde durur: tarayıcı
+trafiğindeki biçimsiz ya da sağlama hanesi tutmayan TC'ler Flask'a hiç
+girmeden 404 alır. Gövde önceden kodlanmıştır, yalnızca saniyelik zaman
+damgası yerleştirilir; Flask yolundaki 404 ile aynıdır. Sorgu dizesinden
+yalnızca tc ve pretty okunur; kodlanmış karakter (% ya da +) içeren sorgular
+Flask'a bırakılır. Kota, Flask yolundaki gibi TC doğrulamasından önce
+denetlenir; sınırı aşan istemci için TC'ye hiç bakılmaz, 429 Flask'ta verilir.
+
+    NABI_HIZLI_YOL   1: açık (varsayılan 0)
+    NABI_ON_RED      0: kapalı (varsayılan 1)
+"""
+import os
+import threading
+
+ETKIN = os.environ.get('NABI_HIZLI_YOL', '0') not in ('', '0')
+ON_RED_ETKIN = os.environ.get('NABI_ON_RED', '1') not in ('', '0')
+
+_TC_SORGUSU_UZUNLUGU = len('tc=') + 11
+
+class HizliYol:
+    """rotalar: PATH_INFO -> endpoint.
+
+    isleyici(endpoint, tc, environ) -> (durum, başlıklar, gövde); None
+    dönerse istek Flask'a geçer.
+    """
+
+    def __init__(self, wsgi_app, rotalar, isleyici):
+        self.wsgi_app = wsgi_app
+        self.rotalar = dict(rotalar)
+        self.isleyici = isleyici
+
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] == 'GET':
+            uc_nokta = self.rotalar.get(environ.get('PATH_INFO'))
+            sorgu = environ.get('QUERY_STRING', '')
+            if (uc_nokta is not None and len(sorgu) == _TC_SORGUSU_UZUNLUGU and sorgu.startswith('tc=')
+                    and 'HTTP_IF_NONE_MATCH' not in environ):
+                tc = sorgu[3:]
+                if tc.isascii() and tc.isdigit():
+                    yanit = self.isleyici(uc_nokta, tc, environ)
+                    if yanit is not None:
+                        durum, basliklar, govde = yanit
+                        start_response(durum, basliklar)
+                        return [govde]
+        return self.wsgi_app(environ, start_response)
+
+    def __repr__(self):
+        return f"HizliYol({len(self.rotalar)} rota)"
+
+class OnRed:
+    """Geçersiz TC'li istekleri Flask'a girmeden reddeden WSGI ara katmanı.
+
+    rotalar: PATH_INFO -> endpoint. izin(endpoint, environ): False dönerse
+    TC'ye bakılmadan istek Flask'a geçer (kota). red_nedeni(tc): geçerliyse
+    None, değilse neden. reddet(endpoint, girintili, environ) -> (durum,
+    başlıklar, gövde).
+    """
+
+    def __init__(self, wsgi_app, rotalar, red_nedeni, reddet, izin=None):
+        self.wsgi_app = wsgi_app
+        self.rotalar = dict(rotalar)
+        self.red_nedeni = red_nedeni
+        self.reddet = reddet
+        self.izin = izin
+        self.red = {}  # (rota, neden) -> reddedilen istek
+        self._kilit = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] == 'GET':
+            uc_nokta = self.rotalar.get(environ.get('PATH_INFO'))
+            sorgu = environ.get('QUERY_STRING', '')
+            if (uc_nokta is not None and '%' not in sorgu and '+' not in sorgu
+                    and (self.izin is None or self.izin(uc_nokta, environ))):
+                tc, girintili = _tc_ve_girinti(sorgu)
+                neden = self.red_nedeni(tc)
+                if neden is not None:
+                    durum, basliklar, govde = self.reddet(uc_nokta, girintili, environ)
+                    anahtar = (uc_nokta, neden)
+                    with self._kilit:
+                        self.red[anahtar] = self.red.get(anahtar, 0) + 1
+                    start_response(durum, basliklar)
+                    return [govde]
+        return self.wsgi_app(environ, start_response)
+
+    def olculer(self):
+        with self._kilit:
+            red = list(self.red.items())
+        for (rota, neden), adet in red:
+            yield ('nabi_on_red_toplam', f'rota="{rota}",neden="{neden}"', adet)
+
+    def __repr__(self):
+        return f"OnRed({len(self.rotalar)} rota)"
+
+OLCU_TANIMLARI = {
+    'nabi_on_red_toplam': ('counter', 'WSGI katmanında reddedilen (404) geçersiz TC istekleri'),
+}
+
+def _tc_ve_girinti(sorgu):
+    """request.args ile aynı: ilk tc değeri (yoksa '') ve ?pretty= istendi mi"""
+    if sorgu.startswith('tc=') and '&' not in sorgu:
+        return sorgu[3:], False
+    tc = girinti = None
+    for oge in sorgu.split('&'):
+        ad, _, deger = oge.partition('=')
+        if ad == 'tc':
+            if tc is None:
+                tc = deger
+        elif ad == 'pretty' and girinti is None:
+            girinti = deger
+    return tc or '', girinti not in (None, '', '0', 'false')
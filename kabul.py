@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""Rota başına kabul kontrolü (eşzamanlılık sınırı ve sınırlı bekleme kuyruğu).
+
+Yavaş uç noktalar (simüle gecikmeli rontgen_listesi ve adli_sicil) trafik
+arttığında worker'ın tüm thread'lerini uykuda tutar; ucuz uç noktalar
+(nufus_sorgu vb.) da arkalarında kuyruğa girer. Her yavaş rota bir kapıdan
+geçer: en fazla `sinir` istek aynı anda işlenir, en fazla `kuyruk` istek yer
+açılmasını `bekleme` saniye bekler; kuyruk doluysa ya da bekleme dolarsa
+istek hemen 503 ve Retry-After ile reddedilir.
+
+Kuyrukta bekleyen istek de bir thread tutar. Bu yüzden kapıların toplam
+sınır + kuyruk değeri worker kapasitesinden `ayrilmis` kadar az olmak
+zorundadır: bu kadar thread her zaman kapısız (ucuz) rotalara kalır.
+
+Sınırlar worker başınadır. gthread worker'ında kapasite worker başına thread
+sayısıdır; sync worker'da tek thread olduğu için kapı anlamsızdır (yavaş
+rotalar için gecikme açıkken gunicorn.conf.py zaten gthread ya da ASGI
+seçer). ASGI modunda bekleme event loop'ta yapıldığından kapı beklemesiz
+denenir (kuyruk kullanılmaz).
+
+Ayar NABI_KABUL ortam değişkeninden okunur:
+
+    (boş) / kapali   kapalı (varsayılan)
+    acik             varsayılan değerlerle açık
+    JSON             {"kapasite": 8, "ayrilmis": 2,
+                      "rotalar": {"rontgen_listesi": {"sinir": 3, "kuyruk": 6,
+                                                      "bekleme": 0.25, "yeniden_dene": 1}}}
+
+Kapasite verilmezse NABI_THREAD (yoksa 8) kullanılır; ayrılmış kapasite
+varsayılan olarak kapasitenin dörtte biridir (en az 1). Ayarı verilmeyen
+gecikmeli rotalar kalan kapasiteyi eşit paylaşır; paylarının üçte ikisi
+sınır, kalanı kuyruk olur.
+"""
+import json
+import os
+import threading
+import time
+
+import gecikme
+
+# WSGI environ: kapıdan önceki bir katmanda (ASGI) geçildi (True) ya da reddedildi (red nedeni)
+ORTAM_ANAHTARI = 'nabisorgun.kabul'
+
+KUYRUK_DOLU = 'kuyruk_dolu'
+ZAMAN_ASIMI = 'zaman_asimi'
+
+class Kapi:
+    """Bir rotanın eşzamanlılık sınırı; thread güvenli"""
+
+    def __init__(self, rota, sinir, kuyruk=0, bekleme=0.25, yeniden_dene=1):
+        if sinir < 1 or kuyruk < 0 or bekleme < 0:
+            raise ValueError(f"Geçersiz kapı ayarı: {rota}")
+        self.rota = rota
+        self.sinir = int(sinir)
+        self.kuyruk = int(kuyruk)
+        self.bekleme = float(bekleme)
+        self.yeniden_dene = max(1, int(yeniden_dene))
+        self._sifirla()
+
+    def _sifirla(self):
+        self._kosul = threading.Condition(threading.Lock())
+        self.aktif = 0
+        self.bekleyen = 0
+        self.kabul = 0
+        self.red = {KUYRUK_DOLU: 0, ZAMAN_ASIMI: 0}
+
+    def gir(self, bekle=True):
+        """(red nedeni ya da None, kuyrukta beklenen saniye ya da None)"""
+        with self._kosul:
+            # Bekleyenler varken gelen istek sıranın önüne geçmez
+            if self.aktif < self.sinir and not self.bekleyen:
+                self.aktif += 1
+                self.kabul += 1
+                return None, None
+            if not bekle or self.bekleyen >= self.kuyruk:
+                self.red[KUYRUK_DOLU] += 1
+                return KUYRUK_DOLU, None
+            t0 = time.perf_counter()
+            self.bekleyen += 1
+            try:
+                yer_acildi = self._kosul.wait_for(lambda: self.aktif < self.sinir, self.bekleme)
+            finally:
+                self.bekleyen -= 1
+            beklenen = time.perf_counter() - t0
+            if not yer_acildi:
+                self.red[ZAMAN_ASIMI] += 1
+                return ZAMAN_ASIMI, beklenen
+            self.aktif += 1
+            self.kabul += 1
+            if self.aktif < self.sinir:
+                self._kosul.notify()  # zaman aşımına uğrayan bir bekleyenin uyandırması kaybolmasın
+            return None, beklenen
+
+    def cik(self):
+        with self._kosul:
+            self.aktif -= 1
+            self._kosul.notify()
+
+    def __repr__(self):
+        return f"Kapi({self.rota!r}, sinir={self.sinir}, kuyruk={self.kuyruk})"
+
+def kapilari_kur(ayar):
+    """Ayardan rota -> Kapi; kapalıysa boş sözlük"""
+    if ayar is None or ayar in ('', 'kapali', 'off'):
+        return {}
+    if ayar in ('acik', 'on'):
+        ayar = {}
+    elif isinstance(ayar, str):
+        raise ValueError(f"Bilinmeyen kabul ayarı: {ayar!r}")
+    ayar = dict(ayar)
+    kapasite = int(ayar.pop('kapasite', 0) or os.environ.get('NABI_THREAD', 8))
+    ayrilmis = int(ayar.pop('ayrilmis', max(1, kapasite // 4)))
+    rotalar = dict(ayar.pop('rotalar', {}))
+    if ayar:
+        raise ValueError(f"Bilinmeyen kabul ayarları: {sorted(ayar)}")
+    if not 0 < ayrilmis < kapasite:
+        raise ValueError(f"Ayrılmış kapasite 1 ile {kapasite - 1} arasında olmalı: {ayrilmis}")
+
+    paylasilacak = kapasite - ayrilmis
+    kapilar = {rota: Kapi(rota, **a) for rota, a in rotalar.items()}
+    verilmeyen = [r for r in gecikme.GECIKMELI_UC_NOKTALAR if r not in rotalar]
+    if verilmeyen:
+        pay = (paylasilacak - _kullanilan(kapilar)) // len(verilmeyen)
+        sinir = max(1, pay * 2 // 3)
+        for rota in verilmeyen:
+            kapilar[rota] = Kapi(rota, sinir, kuyruk=max(0, pay - sinir))
+    toplam = _kullanilan(kapilar)
+    if toplam > paylasilacak:
+        raise ValueError(f"Kapıların sınır + kuyruk toplamı ({toplam}) "
+                         f"kapasite - ayrılmış ({paylasilacak}) değerini aşıyor")
+    return kapilar
+
+def _kullanilan(kapilar):
+    return sum(k.sinir + k.kuyruk for k in kapilar.values())
+
+def ortamdan(ortam=os.environ):
+    metin = ortam.get('NABI_KABUL', '').strip()
+    return kapilari_kur(json.loads(metin) if metin.startswith('{') else metin)
+
+kapilar = ortamdan()
+if kapilar and hasattr(os, 'register_at_fork'):
+    # Fork anında tutulmuş bir kilit ya da yarım sayaç worker'a geçmesin
+    for _kapi in kapilar.values():
+        os.register_at_fork(after_in_child=_kapi._sifirla)
+
+# ---------- metrikler ----------
+OLCU_TANIMLARI = {
+    'nabi_kabul_sinir': ('gauge', 'Rota başına eşzamanlı istek sınırı (tüm worker\'lar)'),
+    'nabi_kabul_aktif': ('gauge', 'Kapıdan geçmiş, işlenmekte olan istekler'),
+    'nabi_kabul_kuyruk_siniri': ('gauge', 'Bekleme kuyruğu kapasitesi'),
+    'nabi_kabul_kuyruk': ('gauge', 'Şu anda kuyrukta bekleyen istekler'),
+    'nabi_kabul_toplam': ('counter', 'Kapıdan kabul edilen istekler'),
+    'nabi_kabul_red_toplam': ('counter', 'Reddedilen (503) istekler'),
+}
+
+def olculer():
+    for rota, kapi in kapilar.items():
+        etiket = f'rota="{rota}"'
+        yield ('nabi_kabul_sinir', etiket, kapi.sinir)
+        yield ('nabi_kabul_aktif', etiket, kapi.aktif)
+        yield ('nabi_kabul_kuyruk_siniri', etiket, kapi.kuyruk)
+        yield ('nabi_kabul_kuyruk', etiket, kapi.bekleyen)
+        yield ('nabi_kabul_toplam', etiket, kapi.kabul)
+        for neden, adet in kapi.red.items():
+            yield ('nabi_kabul_red_toplam', f'{etiket},neden="{neden}"', adet)
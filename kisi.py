@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""TC'den üretilen kişi profili kaydı.
+
+Her kayıt yanıtı kişi alanlarıyla başlar. Eskiden handler'lar önbellekteki
+profili `{**kisi, ...}` ile yeni bir sözlüğe kopyalayıp tümünü kodluyordu;
+kişi alanları her istekte yeniden kodlanıyordu. KisiKaydi bu alanları
+__slots__ ile tutar ve sıkışık JSON parçasını oluşturulurken bir kez kodlar.
+Yanıt yazıcı yalnızca uç noktaya özel alanları kodlayıp bu parçanın arkasına
+ekler (bkz. backend.kisi_yaniti ve serilestirme.nesneye_ekle).
+
+Kayıt önbellekte paylaşıldığı için salt okunurdur. `kisi['il']` erişimi ve
+`dict(kisi)` / `{**kisi}` dönüşümü eskisi gibi çalışır.
+"""
+import serilestirme
+
+# Yanıttaki sırayla
+ALANLAR = (
+    'tc', 'ad', 'soyad', 'dogumTarihi', 'dogumYeri', 'babaAdi', 'anneAdi', 'cinsiyet',
+    'il', 'ilce', 'mahalle', 'sokak', 'kapiNo', 'daireNo', 'telefon', '_seed',
+)
+_ALAN_KUMESI = frozenset(ALANLAR)
+
+class KisiKaydi:
+    """Salt okunur kişi profili; `parca` süslü parantezsiz sıkışık JSON alanlarıdır"""
+    __slots__ = ALANLAR + ('parca',)
+
+    def __init__(self, **alanlar):
+        if alanlar.keys() != _ALAN_KUMESI:
+            raise TypeError(f"Eksik ya da fazla kişi alanları: {sorted(alanlar.keys() ^ _ALAN_KUMESI)}")
+        yaz = object.__setattr__
+        for ad in ALANLAR:
+            yaz(self, ad, alanlar[ad])
+        yaz(self, 'parca', serilestirme.kodla({ad: alanlar[ad] for ad in ALANLAR})[1:-1])
+
+    def __setattr__(self, ad, deger):
+        raise AttributeError("KisiKaydi salt okunurdur")
+
+    def __delattr__(self, ad):
+        raise AttributeError("KisiKaydi salt okunurdur")
+
+    # Eşleme arayüzü: mevcut `kisi['il']` erişimleri ve sözlük yolu (girintili çıktı, ?fields=) için
+    def keys(self):
+        return ALANLAR
+
+    def __getitem__(self, ad):
+        if ad not in _ALAN_KUMESI:
+            raise KeyError(ad)
+        return getattr(self, ad)
+
+    def __repr__(self):
+        return f"KisiKaydi(tc={self.tc!r}, ad={self.ad!r}, soyad={self.soyad!r})"
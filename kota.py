@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""İstemci başına hız sınırı (jeton kovası).
+
+İstemci X-Api-Key başlığıyla, yoksa IP adresiyle tanınır. Her istemcinin
+kovası saniyede `hiz` jetonla dolar ve en fazla `patlama` jeton tutar; her
+istek rotasının maliyeti kadar jeton harcar (gecikmeli rotalar daha
+pahalıdır). Jeton yetmezse istek, TC doğrulaması ve üretimden önce 429 ve
+Retry-After ile reddedilir.
+
+Kova GCRA biçiminde tutulur: istemci başına tek bir sayı, kovanın yeniden
+dolu olacağı an (teorik varış zamanı). Bu an geçmiş bir kayıt dolu bir
+kovayla eşdeğerdir ve kayıpsız atılabilir; boştaki istemciler böylece
+bellekten düşer. Kayıt sayısı `azami_istemci` ile de sınırlıdır.
+
+Ayar NABI_KOTA ortam değişkeninden okunur:
+
+    (boş) / kapali   kapalı (varsayılan)
+    acik             varsayılan değerlerle açık
+    JSON             {"hiz": 20, "patlama": 40,
+                      "maliyetler": {"rontgen_listesi": 5, "adli_sicil": 5},
+                      "azami_istemci": 100000, "paylasimli": false}
+
+Maliyeti verilmeyen rotalar 1 jeton, gecikmeli rotalar varsayılan olarak 5
+jeton harcar. Sınırlar varsayılan olarak worker başınadır (N worker'lı bir
+sunucuda istemci N kat hız alabilir). "paylasimli": true ile kovalar
+NABI_KOTA_YOL (varsayılan /dev/shm/nabisorgun-kota) dosyasında tüm worker'lar
+arasında paylaşılır.
+"""
+import fcntl
+import hashlib
+import json
+import math
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+import gecikme
+import paylasimli
+
+API_ANAHTARI_BASLIGI = 'HTTP_X_API_KEY'
+GECIKMELI_MALIYET = 5
+
+# WSGI environ: sınır önceki bir katmanda (ASGI) denetlendi; izin (0) ya da Retry-After saniyesi
+ORTAM_ANAHTARI = 'nabisorgun.kota'
+
+class KovaTablosu:
+    """Süreç içi kovalar: istemci -> teorik varış zamanı (time.monotonic)"""
+
+    def __init__(self, hiz, patlama, azami_istemci=100000):
+        if azami_istemci < 1:
+            raise ValueError(f"azami_istemci en az 1 olmalı: {azami_istemci}")
+        self.aralik = 1.0 / hiz
+        self.tolerans = patlama * self.aralik
+        self.azami_istemci = azami_istemci
+        self._sifirla()
+
+    def _sifirla(self):
+        self._kovalar = OrderedDict()
+        self._kilit = threading.Lock()
+
+    def al(self, istemci, maliyet, simdi):
+        """Jeton yettiyse 0, yetmediyse kaç saniye sonra yeteceği"""
+        kovalar = self._kovalar
+        with self._kilit:
+            tat = kovalar.get(istemci, simdi)
+            yeni = (tat if tat > simdi else simdi) + maliyet * self.aralik
+            fazla = yeni - simdi - self.tolerans
+            if fazla > 0:
+                return fazla
+            kovalar[istemci] = yeni
+            kovalar.move_to_end(istemci)
+            # En eski kayıt dolmuşsa atılır; her istekte en fazla birkaç adım
+            for _ in range(2):
+                eski, eski_tat = next(iter(kovalar.items()))
+                if eski_tat > simdi and len(kovalar) <= self.azami_istemci:
+                    break
+                del kovalar[eski]
+        return 0.0
+
+    def __len__(self):
+        return len(self._kovalar)
+
+# ---------- worker'lar arası paylaşılan kovalar ----------
+_SIHIR = b'NABIKOTA'
+_BASLIK = struct.Struct('<8sI')
+_BASLIK_BOYUTU = 64
+_YUVA = struct.Struct('<Qd')  # istemci özeti (0 = boş), teorik varış zamanı
+_KUME = 8                     # küme başına yuva; bir istemci yalnızca kendi kümesinde aranır
+_SERIT_SAYISI = 64
+
+class PaylasimliKovaTablosu:
+    """mmap üzerinde küme-ilişkili tablo; her küme bir şerit kilidiyle korunur.
+
+    Kümeler örtüşmediği için bir istemcinin okuma-değiştirme-yazması tek bir
+    şerit kilidi altında tamamlanır (süreç içinde threading.Lock, süreçler
+    arasında fcntl bayt aralığı kilidi). time.monotonic tüm süreçlerde aynı
+    saattir. Küme doluysa en erken dolacak kova (en küçük zaman) yer verir.
+    """
+
+    def __init__(self, yol, hiz, patlama, azami_istemci=100000):
+        self.aralik = 1.0 / hiz
+        self.tolerans = patlama * self.aralik
+        self.yol = yol
+        self.kume_sayisi = max(1, azami_istemci // _KUME)
+        self._fd, self._mm = self._ac()
+        self._sifirla()
+
+    def _sifirla(self):
+        self._serit_kilitleri = [threading.Lock() for _ in range(_SERIT_SAYISI)]
+
+    def _ac(self):
+        # Düzeni farklı bir dosya kesilmez, yenisiyle değiştirilir (bkz. paylasimli.dosya_esle)
+        boyut = _BASLIK_BOYUTU + self.kume_sayisi * _KUME * _YUVA.size
+        return paylasimli.dosya_esle(self.yol, boyut, _BASLIK.pack(_SIHIR, self.kume_sayisi))
+
+    def al(self, istemci, maliyet, simdi):
+        ozet = int.from_bytes(hashlib.blake2b(istemci.encode('utf-8'), digest_size=8).digest(), 'little') | 1
+        kume = ozet % self.kume_sayisi
+        bas = _BASLIK_BOYUTU + kume * _KUME * _YUVA.size
+        serit = kume % _SERIT_SAYISI
+        mm = self._mm
+        kilit = self._serit_kilitleri[serit]
+        with kilit:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, serit)
+            try:
+                hedef = bos = None
+                en_erken, en_erken_tat = bas, math.inf
+                for konum in range(bas, bas + _KUME * _YUVA.size, _YUVA.size):
+                    k_ozet, k_tat = _YUVA.unpack_from(mm, konum)
+                    if k_ozet == ozet:
+                        hedef, tat = konum, k_tat
+                        break
+                    if bos is None and (k_ozet == 0 or k_tat <= simdi):
+                        bos = konum  # boş ya da kovası dolmuş (kayıpsız atılabilir)
+                    if k_tat < en_erken_tat:
+                        en_erken, en_erken_tat = konum, k_tat
+                else:
+                    hedef, tat = (bos if bos is not None else en_erken), simdi
+                yeni = (tat if tat > simdi else simdi) + maliyet * self.aralik
+                fazla = yeni - simdi - self.tolerans
+                if fazla > 0:
+                    return fazla
+                _YUVA.pack_into(mm, hedef, ozet, yeni)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, serit)
+        return 0.0
+
+# ---------- sınırlayıcı ----------
+class Kota:
+    def __init__(self, tablo, maliyetler, patlama):
+        for rota, maliyet in maliyetler.items():
+            if not 0 < maliyet <= patlama:
+                raise ValueError(f"{rota} maliyeti 0 ile patlama ({patlama}) arasında olmalı: {maliyet}")
+        self.tablo = tablo
+        self.maliyetler = maliyetler
+        self.red = {}  # rota -> reddedilen istek
+        self._kilit = threading.Lock()
+
+    def denetle(self, environ, rota):
+        """İzin verildiyse None, verilmediyse Retry-After saniyesi"""
+        anahtar = environ.get(API_ANAHTARI_BASLIGI)
+        istemci = 'k:' + anahtar if anahtar else 'i:' + environ.get('REMOTE_ADDR', '')
+        bekleme = self.tablo.al(istemci, self.maliyetler.get(rota, 1), time.monotonic())
+        if not bekleme:
+            return None
+        with self._kilit:
+            self.red[rota] = self.red.get(rota, 0) + 1
+        return max(1, math.ceil(bekleme))
+
+def kur(ayar, ortam=os.environ):
+    """Ayardan Kota; kapalıysa None"""
+    if ayar is None or ayar in ('', 'kapali', 'off'):
+        return None
+    if ayar in ('acik', 'on'):
+        ayar = {}
+    elif isinstance(ayar, str):
+        raise ValueError(f"Bilinmeyen kota ayarı: {ayar!r}")
+    ayar = dict(ayar)
+    hiz = float(ayar.pop('hiz', 20))
+    patlama = float(ayar.pop('patlama', 2 * hiz))
+    azami_istemci = int(ayar.pop('azami_istemci', 100000))
+    maliyetler = {rota: GECIKMELI_MALIYET for rota in gecikme.GECIKMELI_UC_NOKTALAR}
+    maliyetler.update(ayar.pop('maliyetler', {}))
+    paylasimli = bool(ayar.pop('paylasimli', False))
+    if ayar:
+        raise ValueError(f"Bilinmeyen kota ayarları: {sorted(ayar)}")
+    if hiz <= 0 or patlama < 1:
+        raise ValueError("hiz pozitif, patlama en az 1 olmalı")
+    if azami_istemci < 1:
+        raise ValueError(f"azami_istemci en az 1 olmalı: {azami_istemci}")
+    if paylasimli:
+        varsayilan_dizin = '/dev/shm' if os.path.isdir('/dev/shm') else os.path.join(os.sep, 'tmp')
+        tablo = PaylasimliKovaTablosu(ortam.get('NABI_KOTA_YOL', os.path.join(varsayilan_dizin, 'nabisorgun-kota')),
+                                      hiz, patlama, azami_istemci)
+    else:
+        tablo = KovaTablosu(hiz, patlama, azami_istemci)
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=tablo._sifirla)
+    return Kota(tablo, maliyetler, patlama)
+
+def ortamdan(ortam=os.environ):
+    metin = ortam.get('NABI_KOTA', '').strip()
+    return kur(json.loads(metin) if metin.startswith('{') else metin, ortam)
+
+sinirlayici = ortamdan()
+
+# ---------- metrikler ----------
+OLCU_TANIMLARI = {
+    'nabi_kota_red_toplam': ('counter', 'Hız sınırına takılan (429) istekler'),
+    'nabi_kota_istemci': ('gauge', 'Çalışan worker\'ların belleğinde kovası tutulan istemciler'),
+}
+
+def olculer():
+    with sinirlayici._kilit:
+        red = list(sinirlayici.red.items())
+    for rota, adet in red:
+        yield ('nabi_kota_red_toplam', f'rota="{rota}"', adet)
+    if isinstance(sinirlayici.tablo, KovaTablosu):
+        # Paylaşılan tablo worker'lar arasında toplanırsa tekrar sayılacağı için yalnızca yerel.
+        # Gösterge olduğundan metrik.topla ölmüş worker'ların (kovaları da onlarla
+        # gitti) değerini toplama katmaz.
+        yield ('nabi_kota_istemci', '', len(sinirlayici.tablo))
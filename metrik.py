@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""İstek metrikleri ve Prometheus metin çıktısı.
+
+Her worker kendi sayaçlarını bellekte tutar; bir kayıt yalnızca birkaç sözlük
+erişimi ve bisect'ten ibarettir. /metrics yanıtı şunları içerir:
+
+    nabi_istek_toplam{rota,durum}                  sayaç (kayit_bulunamadi 404'leri dahil)
+    nabi_istek_suresi_saniye{rota,asama}           histogram; aşamalar:
+        dogrulama     TC doğrulama
+        kabul         kabul kontrolü kuyruğunda bekleme (yalnızca sıraya girenler)
+        gecikme       simüle servis gecikmesi
+        uretim        handler içinde veri üretimi (serileştirme hariç)
+        serilestirme  JSON kodlama, şablon birleştirme ve sıkıştırma
+        toplam        ön işlemeden son işlemenin sonuna kadar
+    nabi_yanit_boyutu_bayt{rota}                   histogram (hat üzerindeki gövde)
+    nabi_onbellek_isabet_toplam{onbellek,rota}     sayaç
+    nabi_onbellek_iska_toplam{onbellek,rota}       sayaç
+    nabi_onbellek_isabet_orani{onbellek,rota}      gösterge (toplanmış sayaçlardan)
+
+Diğer modüller olcu_kaynagi_ekle ile kendi sayaç ve göstergelerini ekler
+(ör. kabul.py); bunların değerleri de worker'lar arasında toplanır.
+
+Preforked worker'lar (gunicorn) için NABI_METRIK_DIZIN verilirse her worker
+sayaçlarının anlık görüntüsünü arka planda saniyede bir bu dizindeki kendi
+dosyasına yazar. /metrics isteğini hangi worker alırsa alsın tüm dosyaları
+toplayarak cevap verir (diğer worker'ların değerleri en fazla
+NABI_METRIK_ARALIK saniye geride kalır). Ölen worker'ların dosyaları silinmez,
+böylece sayaçlar geri gitmez; dizin sunucu başlatılırken boşaltılmalıdır.
+Göstergeler (tanımı 'gauge' olan ölçüler) ise yalnızca süreci hâlâ çalışan
+worker'ların dosyalarından toplanır: yenilenen ya da çöken bir worker'ın
+sınırları tekrar sayılmaz, istek ortasında ölenin aktif/kuyruk değeri kalmaz.
+"""
+import atexit
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+SURE_KOVALARI = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+BOYUT_KOVALARI = (128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+ESLESMEYEN = 'eslesmeyen'  # hiçbir rotaya uymayan istekler için rota etiketi
+
+_DIZIN = os.environ.get('NABI_METRIK_DIZIN') or None
+_ARALIK = float(os.environ.get('NABI_METRIK_ARALIK', 1.0))
+
+class Olcum:
+    """Tek bir isteğin aşama süreleri (saniye; ölçülmeyenler None)"""
+    __slots__ = ('baslangic', 'dogrulama', 'kabul', 'gecikme', 'handler', 'serilestirme')
+
+    def __init__(self, baslangic):
+        self.baslangic = baslangic
+        self.dogrulama = None
+        self.kabul = None
+        self.gecikme = None
+        self.handler = None       # handler'a girildiği an (perf_counter)
+        self.serilestirme = 0.0
+
+def _histogram(kovalar):
+    # [kova_0 ... kova_n, +Inf, toplam]; kovalar kümülatif değil
+    return [0] * (len(kovalar) + 1) + [0.0]
+
+class Kayitci:
+    """Süreç içi metrik deposu; iş parçacığı güvenli"""
+
+    def __init__(self, dizin=None):
+        self._dizin = dizin
+        self._onbellek_kaynaklari = []
+        self._olcu_kaynaklari = []
+        self._olcu_tanimlari = {}  # ad -> (tür, açıklama)
+        self._yazici = None
+        self._sifirla()
+        if dizin:
+            # max_requests ile yenilenen worker ilk yazma turundan önce çıkabilir
+            atexit.register(self._cikista_yaz)
+
+    def _sifirla(self):
+        self._kilit = threading.Lock()
+        self._istekler = {}  # (rota, durum) -> adet
+        self._sureler = {}   # (rota, aşama) -> histogram
+        self._boyutlar = {}  # rota -> histogram
+        self._dosya = None
+        self._yazici = None
+
+    # ---------- kayıt ----------
+    def istek(self, rota, durum, boyut, asamalar):
+        """asamalar: (aşama, saniye) çiftleri"""
+        with self._kilit:
+            anahtar = (rota, durum)
+            self._istekler[anahtar] = self._istekler.get(anahtar, 0) + 1
+            h = self._boyutlar.get(rota)
+            if h is None:
+                h = self._boyutlar[rota] = _histogram(BOYUT_KOVALARI)
+            h[bisect_left(BOYUT_KOVALARI, boyut)] += 1
+            h[-1] += boyut
+            for asama, sure in asamalar:
+                self._sure_ekle(rota, asama, sure)
+        if self._dizin and self._yazici is None:
+            self._yazici_baslat()
+
+    def sure(self, rota, asama, sure):
+        with self._kilit:
+            self._sure_ekle(rota, asama, sure)
+
+    def _sure_ekle(self, rota, asama, sure):
+        h = self._sureler.get((rota, asama))
+        if h is None:
+            h = self._sureler[(rota, asama)] = _histogram(SURE_KOVALARI)
+        h[bisect_left(SURE_KOVALARI, sure)] += 1
+        h[-1] += sure
+
+    def onbellek_kaynagi_ekle(self, kaynak):
+        """kaynak(): (önbellek, rota, isabet, ıska) dörtlüleri döndüren çağrılabilir"""
+        self._onbellek_kaynaklari.append(kaynak)
+
+    def olcu_kaynagi_ekle(self, kaynak, tanimlar):
+        """kaynak(): (ad, etiketler, değer) üçlüleri; etiketler 'rota="x"' biçiminde metin.
+        tanimlar: ad -> (tür, açıklama); çıktı bu sırayla yazılır."""
+        self._olcu_kaynaklari.append(kaynak)
+        self._olcu_tanimlari.update(tanimlar)
+
+    # ---------- anlık görüntü ve worker'lar arası toplama ----------
+    def goruntu(self):
+        """JSON'a yazılabilir anlık görüntü"""
+        with self._kilit:
+            goruntu = {
+                'istekler': [[r, d, n] for (r, d), n in self._istekler.items()],
+                'sureler': [[r, a, list(h)] for (r, a), h in self._sureler.items()],
+                'boyutlar': [[r, list(h)] for r, h in self._boyutlar.items()],
+            }
+        goruntu['onbellek'] = [list(s) for kaynak in self._onbellek_kaynaklari for s in kaynak()]
+        goruntu['olculer'] = [list(s) for kaynak in self._olcu_kaynaklari for s in kaynak()]
+        return goruntu
+
+    def _dosya_yolu(self):
+        if self._dosya is None:
+            self._dosya = os.path.join(self._dizin, f"metrik-{os.getpid()}-{time.time_ns()}.json")
+        return self._dosya
+
+    def yaz(self):
+        """Anlık görüntüyü bu worker'ın dosyasına atomik olarak yazar"""
+        yol = self._dosya_yolu()
+        gecici = yol + '.tmp'
+        with open(gecici, 'w', encoding='utf-8') as f:
+            json.dump(self.goruntu(), f, separators=(',', ':'))
+        os.replace(gecici, yol)
+
+    def _yazici_baslat(self):
+        with self._kilit:
+            if self._yazici is not None:
+                return
+            os.makedirs(self._dizin, exist_ok=True)
+            self._yazici = threading.Thread(target=self._yazici_dongusu, name='metrik-yazici', daemon=True)
+        self._yazici.start()
+
+    def _yazici_dongusu(self):
+        while True:
+            time.sleep(_ARALIK)
+            try:
+                self.yaz()
+            except OSError:
+                pass
+
+    def _cikista_yaz(self):
+        if self._yazici is not None:
+            try:
+                self.yaz()
+            except OSError:
+                pass
+
+    def topla(self):
+        """Bu worker ile dizindeki diğer worker'ların görüntülerini birleştirir"""
+        goruntuler = [(self.goruntu(), True)]
+        if self._dizin:
+            kendi = self._dosya
+            yollar = [yol for yol in glob.glob(os.path.join(self._dizin, 'metrik-*.json')) if yol != kendi]
+            canli = _canli_dosyalar(yollar)
+            for yol in yollar:
+                try:
+                    with open(yol, encoding='utf-8') as f:
+                        goruntuler.append((json.load(f), yol in canli))
+                except (OSError, ValueError):
+                    continue  # yazılırken silinmiş ya da yarım dosya
+        gostergeler = {ad for ad, (tur, _) in self._olcu_tanimlari.items() if tur == 'gauge'}
+        istekler, sureler, boyutlar, onbellek, olculer = {}, {}, {}, {}, {}
+        for gr, calisiyor in goruntuler:
+            for r, d, n in gr['istekler']:
+                istekler[(r, d)] = istekler.get((r, d), 0) + n
+            for r, a, h in gr['sureler']:
+                _histogram_ekle(sureler, (r, a), h)
+            for r, h in gr['boyutlar']:
+                _histogram_ekle(boyutlar, r, h)
+            for ad, r, isabet, iska in gr['onbellek']:
+                eski = onbellek.get((ad, r), (0, 0))
+                onbellek[(ad, r)] = (eski[0] + isabet, eski[1] + iska)
+            for ad, etiketler, deger in gr.get('olculer', ()):
+                if not calisiyor and ad in gostergeler:
+                    continue  # ölmüş worker'ın anlık değeri artık geçerli değil
+                olculer[(ad, etiketler)] = olculer.get((ad, etiketler), 0) + deger
+        return istekler, sureler, boyutlar, onbellek, olculer
+
+    # ---------- Prometheus metin biçimi ----------
+    def prometheus(self):
+        istekler, sureler, boyutlar, onbellek, olculer = self.topla()
+        satirlar = [
+            '# HELP nabi_istek_toplam Rota ve durum koduna göre istek sayısı',
+            '# TYPE nabi_istek_toplam counter',
+        ]
+        for (r, d), n in sorted(istekler.items()):
+            satirlar.append(f'nabi_istek_toplam{{rota="{r}",durum="{d}"}} {n}')
+
+        satirlar += [
+            '# HELP nabi_istek_suresi_saniye Aşamalara göre istek süresi',
+            '# TYPE nabi_istek_suresi_saniye histogram',
+        ]
+        for (r, a), h in sorted(sureler.items()):
+            _histogram_yaz(satirlar, 'nabi_istek_suresi_saniye', f'rota="{r}",asama="{a}"', SURE_KOVALARI, h)
+
+        satirlar += [
+            '# HELP nabi_yanit_boyutu_bayt Hat üzerindeki yanıt gövdesi boyutu',
+            '# TYPE nabi_yanit_boyutu_bayt histogram',
+        ]
+        for r, h in sorted(boyutlar.items()):
+            _histogram_yaz(satirlar, 'nabi_yanit_boyutu_bayt', f'rota="{r}"', BOYUT_KOVALARI, h)
+
+        for ad, tur, aciklama in (
+            ('nabi_onbellek_isabet_toplam', 'counter', 'Önbellek isabetleri'),
+            ('nabi_onbellek_iska_toplam', 'counter', 'Önbellek ıskaları'),
+            ('nabi_onbellek_isabet_orani', 'gauge', 'Önbellek isabet oranı (tüm worker\'lar)'),
+        ):
+            satirlar += [f'# HELP {ad} {aciklama}', f'# TYPE {ad} {tur}']
+            for (o, r), (isabet, iska) in sorted(onbellek.items()):
+                if tur == 'gauge':
+                    deger = round(isabet / (isabet + iska), 6) if isabet + iska else 0
+                else:
+                    deger = isabet if ad.endswith('isabet_toplam') else iska
+                satirlar.append(f'{ad}{{onbellek="{o}",rota="{r}"}} {deger}')
+
+        for ad, (tur, aciklama) in self._olcu_tanimlari.items():
+            satirlar += [f'# HELP {ad} {aciklama}', f'# TYPE {ad} {tur}']
+            for (o, etiketler), deger in sorted(olculer.items()):
+                if o == ad:
+                    satirlar.append(f'{ad}{{{etiketler}}} {deger}' if etiketler else f'{ad} {deger}')
+        return '\n'.join(satirlar) + '\n'
+
+def _canli_dosyalar(yollar):
+    """Süreci hâlâ çalışan worker'ların dosyaları.
+
+    Dosya adı metrik-<pid>-<ns>.json; PID yeniden kullanılmış olabileceği için
+    her PID'in yalnızca en yeni dosyası o sürece aittir. Bu sürecin kendi
+    değerleri bellekten okunduğu için aynı PID'li eski dosyalar ölü sayılır.
+    """
+    en_yeni = {}
+    for yol in yollar:
+        try:
+            pid, ns = map(int, os.path.basename(yol)[len('metrik-'):-len('.json')].split('-'))
+        except ValueError:
+            continue
+        if pid not in en_yeni or ns > en_yeni[pid][0]:
+            en_yeni[pid] = (ns, yol)
+    kendi = os.getpid()
+    return {yol for pid, (_, yol) in en_yeni.items() if pid != kendi and _calisiyor(pid)}
+
+def _calisiyor(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # süreç var, yalnızca sinyal yetkisi yok
+    return True
+
+def _histogram_ekle(hedef, anahtar, h):
+    mevcut = hedef.get(anahtar)
+    if mevcut is None:
+        hedef[anahtar] = list(h)
+    else:
+        for i, deger in enumerate(h):
+            mevcut[i] += deger
+
+def _histogram_yaz(satirlar, ad, etiketler, kovalar, h):
+    kumulatif = 0
+    for sinir, adet in zip(kovalar, h):
+        kumulatif += adet
+        satirlar.append(f'{ad}_bucket{{{etiketler},le="{sinir}"}} {kumulatif}')
+    kumulatif += h[len(kovalar)]
+    satirlar.append(f'{ad}_bucket{{{etiketler},le="+Inf"}} {kumulatif}')
+    satirlar.append(f'{ad}_sum{{{etiketler}}} {h[-1]:.6f}')
+    satirlar.append(f'{ad}_count{{{etiketler}}} {kumulatif}')
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4'
+
+kayitci = Kayitci(_DIZIN)
+
+# Fork edilen worker ana süreçten sayaç ya da yazıcı thread devralmaz
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=kayitci._sifirla)
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+import functools
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+import serilestirme
+
+# ========== LRU ÖNBELLEK ==========
+class LRUOnbellek:
+    """Boyut sınırlı, iş parçacığı güvenli LRU önbellek (isteğe bağlı TTL).
+
+    bayt_butcesi verilirse kayıtlar agirlik(deger) ile tartılır ve toplam
+    ağırlık bütçeyi aşmayacak şekilde en eski kayıtlar atılır.
+    """
+
+    def __init__(self, kapasite=1024, ttl=None, saat=time.monotonic, bayt_butcesi=None, agirlik=None):
+        self.kapasite = max(0, int(kapasite))
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.bayt_butcesi = bayt_butcesi if bayt_butcesi and bayt_butcesi > 0 else None
+        self._agirlik = agirlik if self.bayt_butcesi else None
+        self._saat = saat
+        self._veri = OrderedDict()  # anahtar -> (deger, son_gecerlilik, agirlik)
+        self._bayt = 0
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+        self.tahliye = 0
+        self.suresi_dolan = 0
+
+    def getir(self, anahtar, varsayilan=None):
+        with self._kilit:
+            kayit = self._veri.get(anahtar)
+            if kayit is None:
+                self.iska += 1
+                return varsayilan
+            deger, son, agirlik = kayit
+            if son is not None and son <= self._saat():
+                del self._veri[anahtar]
+                self._bayt -= agirlik
+                self.suresi_dolan += 1
+                self.iska += 1
+                return varsayilan
+            self._veri.move_to_end(anahtar)
+            self.isabet += 1
+            return deger
+
+    def koy(self, anahtar, deger):
+        if not self.kapasite:
+            return
+        son = self._saat() + self.ttl if self.ttl else None
+        agirlik = self._agirlik(deger) if self._agirlik else 0
+        if self.bayt_butcesi and agirlik > self.bayt_butcesi:
+            return
+        with self._kilit:
+            eski = self._veri.pop(anahtar, None)
+            if eski is not None:
+                self._bayt -= eski[2]
+            self._veri[anahtar] = (deger, son, agirlik)
+            self._bayt += agirlik
+            while len(self._veri) > self.kapasite or (self.bayt_butcesi and self._bayt > self.bayt_butcesi):
+                self._bayt -= self._veri.popitem(last=False)[1][2]
+                self.tahliye += 1
+
+    def getir_veya_uret(self, anahtar, uretici):
+        """Önbellekte yoksa uretici() ile üretip saklar.
+
+        Üretim kilit dışında yapılır; aynı anahtar için eşzamanlı iki ıska
+        değeri iki kez üretebilir ama sonuç deterministik olduğundan zararsızdır.
+        """
+        deger = self.getir(anahtar, _YOK)
+        if deger is _YOK:
+            deger = uretici()
+            self.koy(anahtar, deger)
+        return deger
+
+    def temizle(self):
+        with self._kilit:
+            self._veri.clear()
+            self._bayt = 0
+
+    def __len__(self):
+        return len(self._veri)
+
+    def istatistik(self):
+        with self._kilit:
+            toplam = self.isabet + self.iska
+            return {
+                "kapasite": self.kapasite,
+                "ttl": self.ttl,
+                "boyut": len(self._veri),
+                "bayt": self._bayt,
+                "baytButcesi": self.bayt_butcesi,
+                "isabet": self.isabet,
+                "iska": self.iska,
+                "tahliye": self.tahliye,
+                "suresiDolan": self.suresi_dolan,
+                "isabetOrani": round(self.isabet / toplam, 4) if toplam else 0.0,
+            }
+
+_YOK = object()
+
+# ========== YANIT ŞABLONLARI ==========
+class YanitSablonu:
+    """Önceden kodlanmış yanıt gövdesi.
+
+    Gövde, anlık (saate bağlı) alanların bulunduğu yerlerden bölünmüş sabit
+    bayt parçaları olarak saklanır. Her istekte yalnızca bu alanların güncel
+    değerleri kodlanıp parçaların arasına eklenir.
+
+    Anlık alanı olmayan (gövdesi hiç değişmeyen) şablonlar sıkıştırılmış
+    hallerini de saklar, böylece aynı gövde iki kez sıkıştırılmaz.
+    """
+    __slots__ = ('parcalar', 'alanlar', 'boyut', 'sikistirilmis', 'kirli')
+
+    def __init__(self, parcalar, alanlar, sikistirilmis=None):
+        self.parcalar = parcalar
+        self.alanlar = alanlar
+        self.boyut = sum(len(p) for p in parcalar)
+        self.sikistirilmis = sikistirilmis or {}  # kodlama -> bayt
+        self.kirli = False  # önbelleğe konduktan sonra yeni sıkıştırılmış kopya eklendi
+
+    def sikistirilmis_getir(self, kodlama, sikistir):
+        """Sabit gövdenin sıkıştırılmış halini (gerekirse üretip) döner"""
+        veri = self.sikistirilmis.get(kodlama)
+        if veri is None:
+            veri = self.sikistirilmis[kodlama] = sikistir(self.parcalar[0], kodlama)
+            self.kirli = True
+        return veri
+
+    # Paylaşılan önbellek için ikili biçim:
+    #   u8 parça sayısı, u8 alan sayısı, u8 sıkıştırılmış kopya sayısı
+    #   parça başına u32 uzunluk; alan ve kodlama adları u8 uzunluk + UTF-8;
+    #   kopya başına u32 uzunluk; ardından parçalar ve kopyalar art arda
+    def paketle(self):
+        basliklar = [struct.pack('<BBB', len(self.parcalar), len(self.alanlar), len(self.sikistirilmis))]
+        basliklar += [struct.pack('<I', len(p)) for p in self.parcalar]
+        for ad in self.alanlar:
+            ad = ad.encode('utf-8')
+            basliklar.append(struct.pack('<B', len(ad)) + ad)
+        for kodlama, veri in self.sikistirilmis.items():
+            kodlama = kodlama.encode('ascii')
+            basliklar.append(struct.pack('<B', len(kodlama)) + kodlama + struct.pack('<I', len(veri)))
+        return b''.join(basliklar) + b''.join(self.parcalar) + b''.join(self.sikistirilmis.values())
+
+    @classmethod
+    def coz(cls, paket):
+        paket = memoryview(paket)
+        n_parca, n_alan, n_kopya = struct.unpack_from('<BBB', paket, 0)
+        konum = 3
+        parca_uz = struct.unpack_from(f'<{n_parca}I', paket, konum)
+        konum += 4 * n_parca
+        alanlar = []
+        for _ in range(n_alan):
+            uz = paket[konum]
+            alanlar.append(str(paket[konum + 1:konum + 1 + uz], 'utf-8'))
+            konum += 1 + uz
+        kopyalar = []
+        for _ in range(n_kopya):
+            uz = paket[konum]
+            kodlama = str(paket[konum + 1:konum + 1 + uz], 'ascii')
+            konum += 1 + uz
+            kopyalar.append((kodlama, struct.unpack_from('<I', paket, konum)[0]))
+            konum += 4
+        parcalar = []
+        for uz in parca_uz:
+            parcalar.append(bytes(paket[konum:konum + uz]))
+            konum += uz
+        sikistirilmis = {}
+        for kodlama, uz in kopyalar:
+            sikistirilmis[kodlama] = bytes(paket[konum:konum + uz])
+            konum += uz
+        return cls(tuple(parcalar), tuple(alanlar), sikistirilmis)
+
+    @classmethod
+    def olustur(cls, veri, anlik_alanlar, kodla, onek=None):
+        """veri'yi anlık alanların yerine yer tutucu koyarak kodlar ve böler.
+
+        onek: gövdenin başına eklenecek önceden kodlanmış (sıkışık, süslü
+        parantezsiz) alanlar; bkz. kisi.KisiKaydi.parca
+        """
+        alanlar = tuple(k for k in veri if k in anlik_alanlar)  # gövdedeki sırayla
+        if not alanlar:
+            govde = kodla(veri)
+            return cls((govde if onek is None else serilestirme.nesneye_ekle(onek, govde),), ())
+        kopya = dict(veri)
+        for i, alan in enumerate(alanlar):
+            kopya[alan] = f"\x00{i}\x00"  # gerçek veride NUL karakteri bulunmaz
+        kalan = kodla(kopya)
+        parcalar = []
+        for i in range(len(alanlar)):
+            once, kalan = kalan.split(kodla(f"\x00{i}\x00"), 1)
+            parcalar.append(once)
+        parcalar.append(kalan)
+        if onek is not None:
+            parcalar[0] = serilestirme.nesneye_ekle(onek, parcalar[0])
+        return cls(tuple(parcalar), alanlar)
+
+    def birlestir(self, degerler, kodla):
+        """Anlık alan değerlerini (self.alanlar sırasıyla) araya ekleyip gövdeyi üretir"""
+        parcalar = self.parcalar
+        if len(parcalar) == 1:
+            return parcalar[0]
+        cikti = [parcalar[0]]
+        for deger, parca in zip(degerler, parcalar[1:]):
+            cikti.append(kodla(deger))
+            cikti.append(parca)
+        return b''.join(cikti)
+
+def _sablon_agirligi(sablon):
+    # Sonradan eklenebilecek sıkıştırılmış kopyalar için %50 pay + kayıt başına ek yük
+    return sablon.boyut * 3 // 2 + 256
+
+class YanitOnbellegi:
+    """(uç nokta, anahtar) -> YanitSablonu; uç nokta başına isabet istatistiği tutar.
+
+    paylasimli verilirse (paylasimli.PaylasimliOnbellek) worker'a özel LRU
+    önündeki birinci seviye olarak kalır, ıskalar worker'lar arası paylaşılan
+    tabloya sorulur ve her yeni şablon oraya da yazılır. Yalnızca paylaşılan
+    tablo kullanılacaksa kapasite 0 verilebilir.
+    """
+
+    def __init__(self, kapasite=8192, ttl=None, bayt_butcesi=64 * 1024 * 1024, paylasimli=None):
+        self._lru = LRUOnbellek(kapasite, ttl=ttl, bayt_butcesi=bayt_butcesi,
+                                agirlik=_sablon_agirligi)
+        self.paylasimli = paylasimli
+        self._sayaclar = {}  # uç nokta -> [isabet, ıska]
+
+    @property
+    def etkin(self):
+        return self._lru.kapasite > 0 or self.paylasimli is not None
+
+    @property
+    def kapasite(self):
+        return self._lru.kapasite
+
+    @kapasite.setter
+    def kapasite(self, deger):
+        """Çalışırken yeniden boyutlandırır; 0 önbelleği devre dışı bırakır"""
+        self._lru.kapasite = max(0, int(deger))
+        if not self._lru.kapasite:
+            self._lru.temizle()
+
+    def getir(self, uc_nokta, anahtar):
+        sablon = self._lru.getir((uc_nokta, anahtar)) if self._lru.kapasite else None
+        if sablon is None and self.paylasimli is not None:
+            paket = self.paylasimli.getir(_paylasimli_anahtar(uc_nokta, anahtar))
+            if paket is not None:
+                sablon = YanitSablonu.coz(paket)
+                self._lru.koy((uc_nokta, anahtar), sablon)
+        with self._lru._kilit:  # LRU sayaçlarıyla aynı kilit; thread'li worker'da artış kaybolmaz
+            sayac = self._sayaclar.get(uc_nokta)
+            if sayac is None:
+                sayac = self._sayaclar[uc_nokta] = [0, 0]
+            sayac[sablon is None] += 1
+        return sablon
+
+    def koy(self, uc_nokta, anahtar, sablon):
+        sablon.kirli = False
+        self._lru.koy((uc_nokta, anahtar), sablon)
+        if self.paylasimli is not None:
+            self.paylasimli.koy(_paylasimli_anahtar(uc_nokta, anahtar), sablon.paketle())
+
+    def temizle(self):
+        self._lru.temizle()
+        if self.paylasimli is not None:
+            self.paylasimli.temizle()
+
+    def istatistik(self):
+        with self._lru._kilit:
+            sayaclar = sorted((uc_nokta, tuple(sayac)) for uc_nokta, sayac in self._sayaclar.items())
+        uc_noktalar = {}
+        for uc_nokta, (isabet, iska) in sayaclar:
+            toplam = isabet + iska
+            uc_noktalar[uc_nokta] = {
+                "isabet": isabet,
+                "iska": iska,
+                "isabetOrani": round(isabet / toplam, 4) if toplam else 0.0,
+            }
+        istatistik = {**self._lru.istatistik(), "ucNoktalar": uc_noktalar}
+        if self.paylasimli is not None:
+            istatistik["paylasimli"] = self.paylasimli.istatistik()
+        return istatistik
+
+def _paylasimli_anahtar(uc_nokta, anahtar):
+    return '\0'.join(map(str, (uc_nokta,) + anahtar)).encode('utf-8')
+
+# ========== KALINTI SINIFI PARÇALARI ==========
+class ParcaOnbellegi:
+    """Kimlikler arasında paylaşılan alt bölümler.
+
+    Birçok alt bölüm kimliğin tamamına değil seed'in küçük kalıntılarına
+    bağlıdır (ör. kronik hastalık seçimi seed % 3); aynı parça milyonlarca
+    kimlik için yeniden üretilir. Böyle bir bölümü üreten fonksiyon
+    `kalintili` ile sarılır: sonuç argümanlarıyla anahtarlanıp bir kez
+    üretilir, sonraki kimliklerde döngü çalışmadan aynı nesne döner.
+
+    Sarılan fonksiyon saf olmalı ve yalnızca argümanlarına (kalıntılara)
+    bağlı olmalıdır. Kimliğe özel değerler (tarih, il adı, seed'in kendisi)
+    parçaya girmez, handler'da parçanın çevresine eklenir; aksi halde parça
+    başka kimliklere yanlış değer taşır. Parça paylaşıldığı için salt
+    okunurdur (demet döndürülür).
+
+    Fonksiyon başına functools.lru_cache kullanılır (C uygulaması, thread
+    güvenli); kapasite sarma anında okunur, 0 önbelleği kapatır.
+    lru_cache sayaçları önbellek boşaltılmadan sıfırlanamadığı için
+    sayaclari_sifirla o anki değerleri taban olarak saklar.
+    """
+
+    def __init__(self, kapasite=1024):
+        self.kapasite = max(0, int(kapasite))
+        self._fonksiyonlar = []
+        self._taban = (0, 0)  # (isabet, ıska); sayaclari_sifirla anındaki toplamlar
+
+    def kalintili(self, uret):
+        sarmal = functools.lru_cache(maxsize=self.kapasite)(uret)
+        self._fonksiyonlar.append(sarmal)
+        return sarmal
+
+    def _toplamlar(self, bilgiler):
+        return (sum(b.hits for b in bilgiler) - self._taban[0],
+                sum(b.misses for b in bilgiler) - self._taban[1])
+
+    @property
+    def isabet(self):
+        return self._toplamlar([f.cache_info() for f in self._fonksiyonlar])[0]
+
+    @property
+    def iska(self):
+        return self._toplamlar([f.cache_info() for f in self._fonksiyonlar])[1]
+
+    def sayaclari_sifirla(self):
+        """İsabet/ıska sayaçlarını sıfırlar; önbellekteki parçalar kalır"""
+        bilgiler = [f.cache_info() for f in self._fonksiyonlar]
+        self._taban = (sum(b.hits for b in bilgiler), sum(b.misses for b in bilgiler))
+
+    def temizle(self):
+        for f in self._fonksiyonlar:
+            f.cache_clear()
+        self._taban = (0, 0)
+
+    def istatistik(self):
+        bilgiler = {f.__name__: f.cache_info() for f in self._fonksiyonlar}
+        isabet, iska = self._toplamlar(bilgiler.values())
+        toplam = isabet + iska
+        return {
+            "kapasite": self.kapasite,
+            "boyut": sum(b.currsize for b in bilgiler.values()),
+            "isabet": isabet,
+            "iska": toplam - isabet,
+            "isabetOrani": round(isabet / toplam, 4) if toplam else 0.0,
+            "parcalar": {ad: b.currsize for ad, b in bilgiler.items()},
+        }
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Sürekli açık istatistiksel örnekleyici.
+
+Arka plandaki bir thread saniyede NABI_ORNEKLEYICI_HZ kez, o anda istek
+işleyen thread'lerin Python yığınlarını (sys._current_frames) okur ve rota
+başına collapsed stack sayaçlarında biriktirir. Rota bilgisi Flask istek
+bağlamından gelir: backend'in ön işlemesi isteği işleyen thread'i endpoint
+adıyla kaydeder, teardown kaydı siler. Boştaki (accept/okuma bekleyen)
+thread'ler örneklenmez.
+
+C fonksiyonları (strftime, orjson.dumps, json'ın C kodlayıcısı) yığında
+görünmez; süreleri onları çağıran Python çerçevesinin öz süresine yazılır.
+
+    NABI_ORNEKLEYICI_HZ   örnekleme frekansı (0: kapalı, varsayılan)
+
+Biriken örnekler /debug/ornekler uç noktasından collapsed biçimde alınır
+(?sifirla=1 ile alınıp sıfırlanır, ?rota=<endpoint> ile süzülür). Uç nokta
+yalnızca NABI_PROFIL_ANAHTAR verilmişse kaydedilir ve X-Nabi-Profil başlığında
+bu anahtarı ister. Ana
+thread'den sinyal_kur() çağrıldıysa SIGUSR2 aynı çıktıyı NABI_PROFIL_DIZIN
+altına yazıp sıfırlar.
+"""
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+
+HZ = float(os.environ.get('NABI_ORNEKLEYICI_HZ', 0))
+ETKIN = HZ > 0
+
+def _etiket(kod):
+    return f"{kod.co_qualname} ({os.path.basename(kod.co_filename)}:{kod.co_firstlineno})"
+
+class Ornekleyici:
+    def __init__(self, hz, kok_kod=None):
+        self.aralik = 1.0 / hz
+        self.kok_kod = kok_kod  # yığın bu çerçevede kesilir (sunucu çerçeveleri atılır)
+        self._sifirla()
+
+    def _sifirla(self):
+        self._aktif = {}       # thread kimliği -> endpoint
+        self._sayaclar = {}    # endpoint -> Counter(kod nesneleri demeti)
+        self._etiketler = {}   # kod nesnesi -> etiket
+        self._kilit = threading.RLock()  # sinyal işleyicisi aynı thread'de araya girebilir
+        self._thread = None
+        self.ornek_sayisi = 0
+
+    # ---------- istek kaydı (istek thread'lerinden) ----------
+    def istek_basladi(self, rota):
+        self._aktif[threading.get_ident()] = rota
+        if self._thread is None:
+            self._baslat()
+
+    def istek_bitti(self):
+        self._aktif.pop(threading.get_ident(), None)
+
+    # ---------- örnekleme ----------
+    def _baslat(self):
+        with self._kilit:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._dongu, name='ornekleyici', daemon=True)
+        self._thread.start()
+
+    def _dongu(self):
+        kendi = threading.get_ident()
+        aralik = self.aralik
+        sonraki = time.monotonic()
+        while True:
+            sonraki += aralik
+            bekle = sonraki - time.monotonic()
+            if bekle > 0:
+                time.sleep(bekle)
+            else:
+                sonraki = time.monotonic()  # geride kaldıysak kaçanları telafi etme
+            self._ornekle(kendi)
+
+    def _ornekle(self, kendi):
+        aktif = dict(self._aktif)
+        if not aktif:
+            return
+        kareler = sys._current_frames()
+        kok_kod = self.kok_kod
+        with self._kilit:
+            for tid, rota in aktif.items():
+                kare = kareler.get(tid)
+                if kare is None or tid == kendi:
+                    continue
+                kodlar = []
+                while kare is not None:
+                    kod = kare.f_code
+                    kodlar.append(kod)
+                    if kod is kok_kod:
+                        break
+                    kare = kare.f_back
+                sayac = self._sayaclar.get(rota)
+                if sayac is None:
+                    sayac = self._sayaclar[rota] = Counter()
+                sayac[tuple(kodlar)] += 1
+                self.ornek_sayisi += 1
+
+    # ---------- çıktı ----------
+    def collapsed(self, rota=None, sifirla=False):
+        """'endpoint;kök;...;yaprak adet' satırları (flamegraph.pl / speedscope)"""
+        with self._kilit:
+            sayaclar = self._sayaclar
+            if sifirla:
+                self._sayaclar = {}
+                self.ornek_sayisi = 0
+            satirlar = []
+            for ad, sayac in sorted(sayaclar.items()):
+                if rota is not None and ad != rota:
+                    continue
+                for kodlar, adet in sayac.items():
+                    etiketler = [ad]
+                    for kod in reversed(kodlar):
+                        etiket = self._etiketler.get(kod)
+                        if etiket is None:
+                            etiket = self._etiketler[kod] = _etiket(kod)
+                        etiketler.append(etiket)
+                    satirlar.append(f"{';'.join(etiketler)} {adet}")
+        return '\n'.join(satirlar) + '\n' if satirlar else ''
+
+    def dosyaya_yaz(self, dizin):
+        os.makedirs(dizin, exist_ok=True)
+        yol = os.path.join(dizin, f"ornekler-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.collapsed")
+        with open(yol, 'w', encoding='utf-8') as f:
+            f.write(self.collapsed(sifirla=True))
+        return yol
+
+ornekleyici = None
+
+def kur(kok_kod=None):
+    """Ayar açıksa süreç geneli örnekleyiciyi oluşturur"""
+    global ornekleyici
+    if ETKIN and ornekleyici is None:
+        ornekleyici = Ornekleyici(HZ, kok_kod)
+        if hasattr(os, 'register_at_fork'):
+            # Fork edilen worker ana sürecin thread'ini ve sayaçlarını devralmaz
+            os.register_at_fork(after_in_child=ornekleyici._sifirla)
+    return ornekleyici
+
+def sinyal_kur(dizin=None, sinyal=signal.SIGUSR2):
+    """SIGUSR2 ile örnekleri dosyaya yazıp sıfırlar.
+
+    Sinyal işleyicisi yalnızca ana thread'den kurulabilir. gunicorn worker'ları
+    uygulamayı ana thread'de yükler; preload ile yüklenen uygulamada ise
+    worker kendi sinyallerini sıfırladığı için post_worker_init'te yeniden
+    çağrılmalıdır.
+    """
+    if ornekleyici is None or threading.current_thread() is not threading.main_thread():
+        return
+    if dizin is None:
+        dizin = os.environ.get('NABI_PROFIL_DIZIN', 'profiller')
+    signal.signal(sinyal, lambda *_: ornekleyici.dosyaya_yaz(dizin))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""Worker'lar arası paylaşılan bellek (mmap) önbelleği.
+
+Dosya destekli tek bir mmap bölgesi, sabit boyutlu yuvalardan oluşan açık
+adreslemeli bir tablo tutar. Tüm gunicorn worker'ları aynı dosyayı eşler;
+bir worker'ın yazdığı değer diğerlerinde hemen isabet eder. Dosya
+worker'lardan bağımsız yaşadığı için max_requests ile yenilenen worker'lar
+önbelleği boş bulmaz. Toplam boyut bayt bütçesini hiçbir zaman aşmaz
+(yuva sayısı = (bütçe - başlık) // yuva boyutu).
+
+Yuva düzeni (yuva_boyutu bayt):
+
+    0   u32  sıra (seqlock: tek = yazılıyor)
+    4   u32  anahtar uzunluğu (0 = boş)
+    8   u64  anahtar özeti
+    16  u32  değer uzunluğu
+    20  u32  (boş)
+    24  f64  yazılma zamanı (time.time)
+    32  anahtar baytları, ardından değer baytları
+
+Okuma kilitsizdir: sıra numarası okumadan önce ve sonra aynı ve çiftse okunan
+baytlar tutarlıdır, değilse birkaç kez yeniden denenir. Yazma, yuvanın
+bulunduğu şeridin kilidini alır (süreç içinde threading.Lock, süreçler
+arasında fcntl bayt aralığı kilidi). fcntl kilitleri süreç ölünce çekirdek
+tarafından bırakılır; yazarken öldürülen bir worker en fazla tek bir yuvayı
+"yazılıyor" durumunda bırakır, o yuva okumada ıska sayılır ve ilk yazmada
+düzelir.
+
+Bir anahtar özetinin gösterdiği yuvadan başlayarak en fazla `yoklama` yuvaya
+bakılır. Yazmada pencerede boş ya da aynı anahtarlı yuva yoksa en eski
+yazılmış yuva tahliye edilir. Silme yoktur, bu yüzden okumada boş bir yuvaya
+rastlanması anahtarın pencerenin devamında olmadığı anlamına gelir.
+
+Dosya adı veri sürümünün özetini ve düzeni (yuva sayısı x yuva boyutu)
+taşır: NABI_PAYLASIMLI_YOL=/dev/shm/nabisorgun-yanit ise dosya
+/dev/shm/nabisorgun-yanit-<sürüm>-<n>x<boyut> olur. Sürüm ya da bütçe farklı
+iki kurulum (rolling/USR2 yükseltmesinde eski ve yeni worker'lar) aynı tabloya
+hiç yazmaz, yeni worker'lar eski sürümün gövdelerini görmez. Eski sürümün
+dosyası, onu eşleyen süreçler kapandıktan sonra elle silinebilir.
+
+Not: seqlock x86'nın (TSO) bellek sıralamasına dayanır.
+"""
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+
+_SIHIR = b'NABIPAY1'
+_BASLIK = struct.Struct('<8sII32s')  # sihir, yuva sayısı, yuva boyutu, sürüm özeti
+BASLIK_BOYUTU = 4096
+_YUVA = struct.Struct('<IIQIId')
+_SIRA = struct.Struct('<I')
+_YUVA_BASLIGI = _YUVA.size
+
+_SERIT_SAYISI = 64
+
+def _ozet(anahtar):
+    return int.from_bytes(hashlib.blake2b(anahtar, digest_size=8).digest(), 'little')
+
+class PaylasimliOnbellek:
+    """bytes anahtar -> bytes değer; süreçler arası paylaşılan sabit boyutlu tablo"""
+
+    def __init__(self, yol, bayt_butcesi, yuva_boyutu=8192, surum='', ttl=None, yoklama=8):
+        if yuva_boyutu <= _YUVA_BASLIGI:
+            raise ValueError("yuva_boyutu yuva başlığından büyük olmalı")
+        self.yuva_boyutu = yuva_boyutu
+        self.yuva_sayisi = (bayt_butcesi - BASLIK_BOYUTU) // yuva_boyutu
+        if self.yuva_sayisi < 1:
+            raise ValueError(f"Bayt bütçesi en az bir yuvaya yetmeli: {bayt_butcesi}")
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self.yoklama = min(yoklama, self.yuva_sayisi)
+        self._surum = hashlib.blake2b(str(surum).encode('utf-8'), digest_size=32).digest()
+        self.yol = f"{yol}-{self._surum[:6].hex()}-{self.yuva_sayisi}x{yuva_boyutu}"
+        self._fd, self._mm = self._ac()
+        self._sifirla()
+
+    def _sifirla(self):
+        self._serit_kilitleri = [threading.Lock() for _ in range(_SERIT_SAYISI)]
+        self.isabet = 0
+        self.iska = 0
+        self.yazma = 0
+        self.tahliye = 0
+        self.sigmayan = 0
+
+    # ---------- dosya ----------
+    def _ac(self):
+        boyut = BASLIK_BOYUTU + self.yuva_sayisi * self.yuva_boyutu
+        return dosya_esle(self.yol, boyut, _BASLIK.pack(_SIHIR, self.yuva_sayisi, self.yuva_boyutu, self._surum))
+
+    def _konum(self, yuva):
+        return BASLIK_BOYUTU + yuva * self.yuva_boyutu
+
+    def _pencere(self, ozet):
+        n = self.yuva_sayisi
+        bas = ozet % n
+        return [(bas + j) % n for j in range(self.yoklama)]
+
+    def _serit_kilidi(self, yuva):
+        return _SeritKilidi(self, yuva % _SERIT_SAYISI)
+
+    # ---------- okuma ----------
+    def getir(self, anahtar):
+        ozet = _ozet(anahtar)
+        mm = self._mm
+        uzunluk = len(anahtar)
+        simdi = time.time() if self.ttl else 0.0
+        for yuva in self._pencere(ozet):
+            konum = self._konum(yuva)
+            for _ in range(4):  # eşzamanlı yazmaya denk gelinirse yeniden dene
+                sira, k_uz, k_ozet, d_uz, _, zaman = _YUVA.unpack_from(mm, konum)
+                if sira & 1:
+                    continue
+                if k_uz == 0:
+                    self.iska += 1
+                    return None
+                if k_ozet != ozet or k_uz != uzunluk:
+                    break
+                bas = konum + _YUVA_BASLIGI
+                k = mm[bas:bas + k_uz]
+                deger = mm[bas + k_uz:bas + k_uz + d_uz]
+                if _SIRA.unpack_from(mm, konum)[0] != sira:
+                    continue
+                if k != anahtar:
+                    break
+                if self.ttl and zaman + self.ttl <= simdi:
+                    self.iska += 1
+                    return None
+                self.isabet += 1
+                return deger
+            else:
+                self.iska += 1  # sürekli yazılan yuva: ıska say
+                return None
+        self.iska += 1
+        return None
+
+    # ---------- yazma ----------
+    def koy(self, anahtar, deger):
+        if _YUVA_BASLIGI + len(anahtar) + len(deger) > self.yuva_boyutu:
+            self.sigmayan += 1
+            return False
+        ozet = _ozet(anahtar)
+        mm = self._mm
+        hedef = en_eski = None
+        en_eski_zaman = float('inf')
+        for yuva in self._pencere(ozet):
+            konum = self._konum(yuva)
+            _, k_uz, k_ozet, _, _, zaman = _YUVA.unpack_from(mm, konum)
+            if k_uz == 0 or (k_ozet == ozet and k_uz == len(anahtar)
+                             and mm[konum + _YUVA_BASLIGI:konum + _YUVA_BASLIGI + k_uz] == anahtar):
+                hedef = yuva
+                break
+            if zaman < en_eski_zaman:
+                en_eski, en_eski_zaman = yuva, zaman
+        if hedef is None:
+            hedef = en_eski
+            self.tahliye += 1
+        konum = self._konum(hedef)
+        bas = konum + _YUVA_BASLIGI
+        with self._serit_kilidi(hedef):
+            sira = _SIRA.unpack_from(mm, konum)[0] | 1  # yarım kalmış yazma da tek sayıdır
+            _SIRA.pack_into(mm, konum, sira)
+            mm[bas:bas + len(anahtar)] = anahtar
+            mm[bas + len(anahtar):bas + len(anahtar) + len(deger)] = deger
+            _YUVA.pack_into(mm, konum, sira, len(anahtar), ozet, len(deger), 0, time.time())
+            _SIRA.pack_into(mm, konum, (sira + 1) & 0xFFFFFFFF)
+        self.yazma += 1
+        return True
+
+    def temizle(self):
+        mm = self._mm
+        for yuva in range(self.yuva_sayisi):
+            konum = self._konum(yuva)
+            if _YUVA.unpack_from(mm, konum)[1] == 0:
+                continue
+            with self._serit_kilidi(yuva):
+                sira = _SIRA.unpack_from(mm, konum)[0] | 1
+                _SIRA.pack_into(mm, konum, sira)
+                _YUVA.pack_into(mm, konum, sira, 0, 0, 0, 0, 0.0)
+                _SIRA.pack_into(mm, konum, (sira + 1) & 0xFFFFFFFF)
+
+    def istatistik(self):
+        mm = self._mm
+        dolu = sum(1 for yuva in range(self.yuva_sayisi) if _YUVA.unpack_from(mm, self._konum(yuva))[1])
+        toplam = self.isabet + self.iska
+        return {
+            "yol": self.yol,
+            "yuvaSayisi": self.yuva_sayisi,
+            "yuvaBoyutu": self.yuva_boyutu,
+            "bayt": BASLIK_BOYUTU + self.yuva_sayisi * self.yuva_boyutu,
+            "dolu": dolu,
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "yazma": self.yazma,
+            "tahliye": self.tahliye,
+            "sigmayan": self.sigmayan,
+            "isabetOrani": round(self.isabet / toplam, 4) if toplam else 0.0,
+        }
+
+def dosya_esle(yol, boyut, baslik):
+    """yol'daki tabloyu eşler; (fd, mmap) döner.
+
+    Dosya yoksa, boyutu ya da başlığı beklenenden farklıysa yenisi yanında
+    sıfırdan kurulup atomik olarak yerine konur. Var olan dosya hiçbir zaman
+    kesilmez: başka bir süreç onu eşlemiş olabilir ve eşlenmiş bir dosyanın
+    küçülmesi o süreci bir sonraki okumada SIGBUS ile öldürür. Eski dosyayı
+    eşleyen süreçler eski inode'da kalır. Kurulum yol + '.kilit' dosyasının
+    fcntl kilidiyle sıralanır; aynı anda başlayan worker'lar aynı dosyayı eşler.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(yol)), exist_ok=True)
+    kilit = os.open(yol + '.kilit', os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.lockf(kilit, fcntl.LOCK_EX)
+        try:
+            fd = os.open(yol, os.O_RDWR)
+        except FileNotFoundError:
+            fd = None
+        if fd is not None and (os.fstat(fd).st_size != boyut or os.pread(fd, len(baslik), 0) != baslik):
+            os.close(fd)
+            fd = None
+        if fd is None:
+            gecici = f"{yol}.{os.getpid()}.tmp"
+            fd = os.open(gecici, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.ftruncate(fd, boyut)
+                os.pwrite(fd, baslik, 0)
+                os.replace(gecici, yol)
+            except BaseException:
+                os.close(fd)
+                os.unlink(gecici)
+                raise
+        return fd, mmap.mmap(fd, boyut)
+    finally:
+        os.close(kilit)  # kilit dosya kapanınca bırakılır
+
+class _SeritKilidi:
+    __slots__ = ('onbellek', 'serit')
+
+    def __init__(self, onbellek, serit):
+        self.onbellek = onbellek
+        self.serit = serit
+
+    def __enter__(self):
+        # fcntl kilitleri süreç başınadır; aynı süreçteki thread'leri threading.Lock ayırır
+        self.onbellek._serit_kilitleri[self.serit].acquire()
+        fcntl.lockf(self.onbellek._fd, fcntl.LOCK_EX, 1, self.serit)
+
+    def __exit__(self, *_):
+        fcntl.lockf(self.onbellek._fd, fcntl.LOCK_UN, 1, self.serit)
+        self.onbellek._serit_kilitleri[self.serit].release()
+
+def ortamdan(surum=''):
+    """NABI_PAYLASIMLI_* ayarlarından önbellek; bütçe verilmediyse None.
+
+        NABI_PAYLASIMLI_BAYT        toplam bayt bütçesi (0: kapalı, varsayılan)
+        NABI_PAYLASIMLI_YOL         eşlenen dosyanın adı; sürüm ve düzen eklenir (varsayılan /dev/shm/nabisorgun-yanit)
+        NABI_PAYLASIMLI_YUVA_BAYT   yuva boyutu; daha büyük değerler önbelleğe girmez (varsayılan 8192)
+        NABI_PAYLASIMLI_TTL         saniye (0: süresiz)
+    """
+    butce = int(os.environ.get('NABI_PAYLASIMLI_BAYT', 0))
+    if butce <= 0:
+        return None
+    varsayilan_dizin = '/dev/shm' if os.path.isdir('/dev/shm') else os.path.join(os.sep, 'tmp')
+    onbellek = PaylasimliOnbellek(
+        os.environ.get('NABI_PAYLASIMLI_YOL', os.path.join(varsayilan_dizin, 'nabisorgun-yanit')),
+        butce,
+        yuva_boyutu=int(os.environ.get('NABI_PAYLASIMLI_YUVA_BAYT', 8192)),
+        surum=surum,
+        ttl=float(os.environ.get('NABI_PAYLASIMLI_TTL', 0)),
+    )
+    if hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=onbellek._sifirla)
+    return onbellek
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Örneklemeli istek profili (cProfile).
+
+Açıkken her N istekten biri ya da güvenilir başlığı taşıyan istekler
+cProfile altında çalıştırılır ve sonuç rota başına bir dizine yazılır:
+
+    <dizin>/<endpoint>/<zaman>-<pid>-<sıra>.prof        (snakeviz, pstats, gprof2dot)
+    <dizin>/<endpoint>/<zaman>-<pid>-<sıra>.collapsed   (flamegraph.pl, speedscope)
+
+Collapsed çıktı cProfile'ın çağıran-çağrılan kenarlarından türetilir; aynı
+fonksiyon farklı yollardan çağrılıyorsa süresi kenar oranlarıyla paylaştırılır
+(yaklaşıktır). Dosyalar birleştirilebilir: cat *.collapsed | flamegraph.pl
+
+Ayarlar:
+
+    NABI_PROFIL_ORAN        N: her N istekten birini profille (0: kapalı, varsayılan)
+    NABI_PROFIL_ANAHTAR     verilirse X-Nabi-Profil başlığı bu değeri taşıyan
+                            istekler oran dışında da profillenir
+    NABI_PROFIL_DIZIN       çıktı dizini (varsayılan ./profiller)
+    NABI_PROFIL_BICIM       prof | collapsed (varsayılan prof)
+    NABI_PROFIL_AZAMI_BAYT  rota dizini başına üst sınır; aşılınca en eski
+                            dosyalar silinir (varsayılan 50 MiB)
+
+İkisi de verilmezse ara katman hiç takılmaz, yani ek yük sıfırdır.
+"""
+import cProfile
+import hmac
+import itertools
+import os
+import pstats
+import time
+from collections import defaultdict
+
+ORAN = int(os.environ.get('NABI_PROFIL_ORAN', 0))
+ANAHTAR = os.environ.get('NABI_PROFIL_ANAHTAR', '')
+DIZIN = os.environ.get('NABI_PROFIL_DIZIN', 'profiller')
+BICIM = os.environ.get('NABI_PROFIL_BICIM', 'prof')
+AZAMI_BAYT = int(os.environ.get('NABI_PROFIL_AZAMI_BAYT', 50 * 1024 * 1024))
+
+BASLIK = 'HTTP_X_NABI_PROFIL'
+
+if BICIM not in ('prof', 'collapsed'):
+    raise ValueError(f"NABI_PROFIL_BICIM prof ya da collapsed olmalı: {BICIM!r}")
+
+def etkin():
+    return ORAN > 0 or bool(ANAHTAR)
+
+# ========== COLLAPSED STACK ==========
+def _etiket(fonksiyon):
+    dosya, satir, ad = fonksiyon
+    if dosya == '~':  # yerleşik fonksiyon
+        return ad
+    return f"{ad} ({os.path.basename(dosya)}:{satir})"
+
+def collapsed_satirlar(istatistik, azami_derinlik=64):
+    """pstats istatistiklerinden 'f1;f2;f3 mikrosaniye' satırları üretir"""
+    veriler = istatistik.stats
+    cocuklar = defaultdict(list)
+    for fonksiyon, (_, _, _, _, cagiranlar) in veriler.items():
+        for cagiran, kenar in cagiranlar.items():
+            cocuklar[cagiran].append((fonksiyon, kenar[3]))
+    toplamlar = defaultdict(float)
+
+    def dolas(fonksiyon, yol, pay, ziyaret):
+        _, _, oz_sure, _, _ = veriler[fonksiyon]
+        yol = yol + (_etiket(fonksiyon),)
+        if oz_sure * pay > 0:
+            toplamlar[';'.join(yol)] += oz_sure * pay
+        if len(yol) >= azami_derinlik:
+            return
+        for cocuk, kenar_sure in cocuklar.get(fonksiyon, ()):
+            cocuk_toplam = veriler[cocuk][3]
+            if cocuk in ziyaret or not cocuk_toplam:
+                continue  # özyineleme döngüleri kesilir
+            cocuk_pay = pay * kenar_sure / cocuk_toplam
+            if cocuk_toplam * cocuk_pay >= 1e-6:
+                dolas(cocuk, yol, cocuk_pay, ziyaret | {cocuk})
+
+    for fonksiyon, (_, _, _, _, cagiranlar) in veriler.items():
+        if not cagiranlar:
+            dolas(fonksiyon, (), 1.0, frozenset((fonksiyon,)))
+    return [f"{yol} {round(sure * 1e6)}" for yol, sure in toplamlar.items() if sure >= 5e-7]
+
+# ========== DOSYA YAZMA VE DÖNDÜRME ==========
+def _dondur(dizin):
+    """Dizin boyutu sınırı aşarsa en eski dosyaları siler"""
+    dosyalar = []
+    toplam = 0
+    with os.scandir(dizin) as girdiler:
+        for girdi in girdiler:
+            try:
+                bilgi = girdi.stat()
+            except FileNotFoundError:
+                continue  # başka bir worker sildi
+            dosyalar.append((bilgi.st_mtime, bilgi.st_size, girdi.path))
+            toplam += bilgi.st_size
+    dosyalar.sort()
+    for _, boyut, yol in dosyalar:
+        if toplam <= AZAMI_BAYT:
+            break
+        try:
+            os.remove(yol)
+        except FileNotFoundError:
+            pass
+        toplam -= boyut
+
+_sira = itertools.count()
+
+def kaydet(profil, rota):
+    dizin = os.path.join(DIZIN, rota)
+    os.makedirs(dizin, exist_ok=True)
+    yol = os.path.join(dizin, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_sira)}.{BICIM}")
+    if BICIM == 'prof':
+        profil.dump_stats(yol)
+    else:
+        satirlar = collapsed_satirlar(pstats.Stats(profil))
+        with open(yol, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(satirlar) + '\n')
+    _dondur(dizin)
+    return yol
+
+# ========== WSGI ARA KATMANI ==========
+class ProfilMiddleware:
+    """Seçilen istekleri cProfile altında çalıştıran WSGI ara katmanı"""
+
+    def __init__(self, wsgi_app, url_map, oran=ORAN, anahtar=ANAHTAR):
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.oran = oran
+        self.anahtar = anahtar
+        self._sayac = itertools.count(1)
+
+    def _secildi_mi(self, environ):
+        if self.anahtar:
+            baslik = environ.get(BASLIK)
+            if baslik is not None and hmac.compare_digest(baslik, self.anahtar):
+                return True
+        return self.oran > 0 and next(self._sayac) % self.oran == 0
+
+    def _rota(self, environ):
+        try:
+            return self.url_map.bind_to_environ(environ).match()[0]
+        except Exception:  # 404/405 vb. yönlendirme istisnaları
+            return 'eslesmeyen'
+
+    def __call__(self, environ, start_response):
+        if not self._secildi_mi(environ):
+            return self.wsgi_app(environ, start_response)
+        profil = cProfile.Profile()
+        profil.enable()
+        try:
+            yanit = self.wsgi_app(environ, start_response)
+        finally:
+            profil.disable()
+            kaydet(profil, self._rota(environ))
+        return yanit
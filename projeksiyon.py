@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Alan projeksiyonu (?fields=).
+
+    ?fields=pasaportNo,durum
+    ?fields=ad,seyahatKayitlari.ulke,seyahatKayitlari.giris
+
+Noktalı yollar iç içe alanları seçer; liste içindeki sözlüklere her öğe için
+uygulanır. Bir alanın kendisi istenirse tüm alt alanları gelir. Yanıtta
+bulunmayan alanlar yok sayılır. Handler'lar pahalı bölümleri üretmeden önce
+istendi() ile sorar; istenmeyen bölüm hiç üretilmez.
+"""
+from functools import lru_cache
+
+_TUMU = None  # ağaçta "bu alanın tamamı" işareti
+
+class Projeksiyon:
+    __slots__ = ('agac', 'anahtar')
+
+    def __init__(self, agac, anahtar):
+        self.agac = agac        # alan -> _TUMU ya da alt ağaç
+        self.anahtar = anahtar  # önbellek/ETag için kanonik metin
+
+    def istendi(self, alanlar):
+        """Üst düzey alanlardan herhangi biri (ya da bir alt alanı) istendi mi"""
+        agac = self.agac
+        return any(alan in agac for alan in alanlar)
+
+    def uygula(self, veri):
+        return _uygula(veri, self.agac)
+
+def _uygula(veri, agac):
+    if isinstance(veri, dict):
+        sonuc = {}
+        for alan, deger in veri.items():
+            if alan not in agac:
+                continue
+            alt = agac[alan]
+            sonuc[alan] = deger if alt is _TUMU else _uygula(deger, alt)
+        return sonuc
+    if isinstance(veri, (list, tuple)):  # demet: paylaşılan salt okunur parçalar
+        return [_uygula(oge, agac) for oge in veri]
+    return veri  # alt alan istenen skaler: olduğu gibi
+
+@lru_cache(maxsize=1024)
+def ayristir(metin):
+    """?fields= değerinden Projeksiyon; boşsa None"""
+    yollar = sorted({y.strip() for y in metin.split(',') if y.strip()})
+    if not yollar:
+        return None
+    agac = {}
+    for yol in yollar:
+        dugum = agac
+        parcalar = yol.split('.')
+        for parca in parcalar[:-1]:
+            alt = dugum.get(parca, {})
+            if alt is _TUMU:
+                break  # üst alanın tamamı zaten istendi
+            dugum = dugum.setdefault(parca, alt)
+        else:
+            dugum[parcalar[-1]] = _TUMU
+    return Projeksiyon(agac, ','.join(yollar))
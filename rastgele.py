@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Global durum paylaşmayan, sayaç tabanlı deterministik rastgele sayı üretimi.
+
+Her değer (tc, uç nokta, ...) gibi bir anahtarın splitmix64 karması ile
+doğrudan hesaplanır. Ortak bir RNG nesnesi olmadığı için iş parçacıkları
+arasında yarış durumu oluşmaz.
+"""
+import hashlib
+import itertools
+import os
+import time
+from functools import lru_cache
+
+_MASKE = (1 << 64) - 1
+_ALTIN = 0x9E3779B97F4A7C15
+
+def splitmix64(x):
+    """splitmix64 karıştırma fonksiyonu (64 bit girdi -> 64 bit çıktı)"""
+    z = (x + _ALTIN) & _MASKE
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASKE
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASKE
+    return z ^ (z >> 31)
+
+@lru_cache(maxsize=256)
+def _metin_u64(metin):
+    # hash() süreçten sürece değiştiği için kararlı bir özet kullanılır
+    return int.from_bytes(hashlib.blake2b(metin.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def _parca_u64(parca):
+    if isinstance(parca, int):
+        return parca & _MASKE if 0 <= parca <= _MASKE else _metin_u64(str(parca))
+    return _metin_u64(str(parca))
+
+def u64(*anahtar):
+    """Anahtar parçalarından 64 bitlik deterministik bir değer üretir"""
+    h = 0
+    for parca in anahtar:
+        h = splitmix64(h ^ _parca_u64(parca))
+    return h
+
+def birim(*anahtar):
+    """[0, 1) aralığında deterministik float"""
+    return (u64(*anahtar) >> 11) * (1.0 / (1 << 53))
+
+# ========== ÇAĞRI BAŞINA TEKİLLİK ==========
+# Deterministik olması istenmeyen değerler (ör. simüle gecikme) anahtara bir
+# tek seferlik sayı ekler. itertools.count GIL altında atomik ilerler; tuz
+# fork sonrası yenilenir ki preload edilmiş worker'lar aynı diziyi üretmesin.
+_sayac = itertools.count()
+_tuz = 0
+
+def _tuz_yenile():
+    global _tuz
+    _tuz = u64(os.getpid(), time.time_ns(), int.from_bytes(os.urandom(8), 'little'))
+
+_tuz_yenile()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_tuz_yenile)
+
+def tekil():
+    """Süreç içinde tekrar etmeyen, süreçler arasında çakışmayan çağrı anahtarı"""
+    return _tuz ^ next(_sayac)
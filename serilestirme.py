@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Değiştirilebilir JSON kodlayıcı katmanı.
+
+Kurulu ise orjson (C tabanlı) kullanılır, yoksa standart json modülüne
+düşülür. Her iki kodlayıcı da Türkçe karakterleri kaçışsız UTF-8 olarak
+yazar ve aynı girdi için bayt bayt aynı çıktıyı üretir.
+
+    NABI_JSON_KODLAYICI   auto (varsayılan) | orjson | stdlib
+"""
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # isteğe bağlı bağımlılık
+    orjson = None
+
+def _stdlib_kodla(veri, girintili=False):
+    """Veriyi UTF-8 JSON baytlarına kodlar (varsayılan sıkışık, girintili=True ile 2 boşluk)"""
+    if girintili:
+        return json.dumps(veri, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(veri, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+if orjson is not None:
+    _ORJSON_GIRINTI = orjson.OPT_INDENT_2
+
+    def _orjson_kodla(veri, girintili=False):
+        """_stdlib_kodla ile aynı çıktıyı orjson ile üretir"""
+        try:
+            return orjson.dumps(veri, option=_ORJSON_GIRINTI if girintili else 0)
+        except orjson.JSONEncodeError:
+            # orjson'un desteklemediği tipler (ör. 64 bitten büyük int) için
+            return _stdlib_kodla(veri, girintili)
+
+KODLAYICILAR = {'stdlib': _stdlib_kodla}
+if orjson is not None:
+    KODLAYICILAR['orjson'] = _orjson_kodla
+
+def kodlayici_sec(ad='auto'):
+    """Ada göre kodlayıcı fonksiyonu döner; 'auto' en hızlı kurulu olanı seçer"""
+    if ad == 'auto':
+        ad = 'orjson' if 'orjson' in KODLAYICILAR else 'stdlib'
+    if ad not in KODLAYICILAR:
+        raise ValueError(f"Kodlayıcı kullanılamıyor: {ad!r} (mevcut: {sorted(KODLAYICILAR)})")
+    return ad, KODLAYICILAR[ad]
+
+KODLAYICI_ADI, kodla = kodlayici_sec(os.environ.get('NABI_JSON_KODLAYICI', 'auto'))
+
+def nesneye_ekle(parca, govde):
+    """Sıkışık kodlanmış bir JSON nesnesinin başına süslü parantezsiz alan parçası ekler"""
+    if govde == b'{}':
+        return b'{' + parca + b'}'
+    return b''.join((b'{', parca, b',', memoryview(govde)[1:]))  # gövde tek kez kopyalanır
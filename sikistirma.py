@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Accept-Encoding müzakeresi ve yanıt sıkıştırma.
+
+gzip her zaman, brotli ise modülü kuruluysa desteklenir. Eşikten küçük
+gövdeler sıkıştırılmaz.
+
+    NABI_SIKISTIRMA_ESIK   bayt cinsinden en küçük gövde (varsayılan 512, 0: kapalı)
+    NABI_GZIP_SEVIYE       1-9 (varsayılan 6)
+    NABI_BROTLI_KALITE     0-11 (varsayılan 5)
+"""
+import gzip
+import os
+from functools import lru_cache
+
+try:
+    import brotli
+except ImportError:  # isteğe bağlı bağımlılık
+    brotli = None
+
+ESIK = int(os.environ.get('NABI_SIKISTIRMA_ESIK', 512))
+_GZIP_SEVIYE = int(os.environ.get('NABI_GZIP_SEVIYE', 6))
+_BROTLI_KALITE = int(os.environ.get('NABI_BROTLI_KALITE', 5))
+
+def _gzip(veri):
+    # mtime=0: aynı gövde her zaman aynı baytlara sıkışır
+    return gzip.compress(veri, compresslevel=_GZIP_SEVIYE, mtime=0)
+
+SIKISTIRICILAR = {'gzip': _gzip}
+if brotli is not None:
+    SIKISTIRICILAR['br'] = lambda veri: brotli.compress(veri, quality=_BROTLI_KALITE)
+
+# Eşit kalite değerlerinde sunucunun tercih sırası
+TERCIH = tuple(k for k in ('br', 'gzip') if k in SIKISTIRICILAR)
+
+@lru_cache(maxsize=256)
+def kodlama_sec(baslik):
+    """Accept-Encoding başlığına göre en uygun kodlama; uygun yoksa None"""
+    if not ESIK or not baslik:
+        return None
+    kaliteler = {}
+    for oge in baslik.split(','):
+        ad, _, parametreler = oge.partition(';')
+        ad = ad.strip().lower()
+        q = 1.0
+        for parametre in parametreler.split(';'):
+            anahtar, _, deger = parametre.partition('=')
+            if anahtar.strip() == 'q':
+                try:
+                    q = float(deger)
+                except ValueError:
+                    q = 0.0
+        kaliteler[ad] = q
+    en_iyi, en_iyi_q = None, 0.0
+    for kod in TERCIH:
+        q = kaliteler.get(kod, kaliteler.get('*', 0.0))
+        if q > en_iyi_q:
+            en_iyi, en_iyi_q = kod, q
+    return en_iyi
+
+def sikistir(veri, kodlama):
+    return SIKISTIRICILAR[kodlama](veri)
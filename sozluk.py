@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""Handler'ların ortak kullandığı sabit sözlük tabloları.
+
+Tablolar import sırasında bir kez oluşturulur; değiştirilemez tuple ve salt
+okunur eşlemeler olarak tutulur, metinler sys.intern ile tekilleştirilir.
+Preload edilen gunicorn master'ında yüklendiğinde tüm worker'lar aynı
+sayfaları fork üzerinden paylaşır.
+"""
+import sys
+from types import MappingProxyType
+
+class DonukSozluk(dict):
+    """Değiştirilemeyen dict.
+
+    dict alt sınıfı olduğu için JSON kodlayıcılar onu doğrudan serileştirir;
+    yanıtlara kopyalanmadan gömülebilir.
+    """
+    __slots__ = ()
+
+    def _salt_okunur(self, *args, **kwargs):
+        raise TypeError("DonukSozluk değiştirilemez")
+
+    __setitem__ = __delitem__ = __ior__ = _salt_okunur
+    clear = pop = popitem = setdefault = update = _salt_okunur
+
+    def __reduce__(self):
+        return (DonukSozluk, (dict(self),))
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+def _t(*ogeler):
+    return tuple(sys.intern(o) for o in ogeler)
+
+def _d(**alanlar):
+    return DonukSozluk((sys.intern(k), sys.intern(v)) for k, v in alanlar.items())
+
+# ========== KİŞİ BİLGİLERİ ==========
+ADLAR = _t("Ahmet", "Mehmet", "Ali", "Veli", "Mustafa", "Hasan", "Hüseyin",
+           "İbrahim", "Yusuf", "Murat", "Ömer", "Fatma", "Ayşe", "Zeynep",
+           "Emine", "Hatice", "Elif", "Merve", "Esra", "Selma", "Cem", "Can",
+           "Burak", "Berke", "Deniz", "Eren", "Kaan", "Arda", "Emir", "Efe")
+
+SOYADLAR = _t("Yılmaz", "Kaya", "Demir", "Çelik", "Şahin", "Yıldız", "Arslan",
+              "Koç", "Polat", "Kılıç", "Aksoy", "Erdoğan", "Öztürk", "Aydın",
+              "Taş", "Kara", "Sarı", "Güneş", "Bulut", "Ateş", "Deniz", "Toprak")
+
+SEHIRLER = _t("İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Adana",
+              "Konya", "Gaziantep", "Kayseri", "Mersin", "Eskişehir", "Trabzon",
+              "Samsun", "Diyarbakır", "Erzurum", "Van", "Malatya", "Şanlıurfa")
+
+ILCELER = MappingProxyType({
+    sys.intern("İstanbul"): _t("Kadıköy", "Beşiktaş", "Şişli", "Üsküdar", "Beyoğlu", "Fatih", "Bakırköy"),
+    sys.intern("Ankara"): _t("Çankaya", "Keçiören", "Yenimahalle", "Altındağ", "Mamak", "Etimesgut"),
+    sys.intern("İzmir"): _t("Karşıyaka", "Bornova", "Konak", "Buca", "Bayraklı", "Çiğli"),
+    sys.intern("Bursa"): _t("Osmangazi", "Yıldırım", "Nilüfer", "Gemlik", "İnegöl"),
+    sys.intern("Antalya"): _t("Muratpaşa", "Konyaaltı", "Kepez", "Alanya", "Manavgat"),
+})
+ILCE_VARSAYILAN = _t("Merkez")
+
+ANNE_ADLARI = _t("Fatma", "Ayşe", "Zeynep", "Emine", "Hatice", "Havva", "Meryem", "Şükran", "Gülşah")
+BABA_ADLARI = _t("Mehmet", "Ali", "Mustafa", "Hasan", "Hüseyin", "İbrahim", "Osman", "Ramazan", "Yusuf")
+
+MAHALLELER = _t("Atatürk", "Cumhuriyet", "İstiklal", "Zafer", "Barış", "Şehitler", "Bahçelievler",
+                "Yenişehir", "Çarşı", "Merkez", "Kültür", "Güzeltepe", "Çamlık", "Orhangazi")
+SOKAKLAR = _t("Atatürk", "Cumhuriyet", "İnönü", "Fevzi Çakmak")
+
+MEDENI_HALLER = _t("Bekar", "Evli", "Dul", "Boşanmış")
+KAN_GRUPLARI = _t("A Rh+", "A Rh-", "B Rh+", "B Rh-", "0 Rh+", "0 Rh-", "AB Rh+", "AB Rh-")
+
+# ========== RÖNTGEN / TETKİK ==========
+TETKIK_TURLERI = _t(
+    "Akciğer Röntgeni (PA)", "Akciğer Röntgeni (Lateral)",
+    "Batın Grafisi", "El Bileği Röntgeni", "Ayak Bileği Röntgeni",
+    "Beyin MR", "Bel MR", "Diz MR", "Boyun MR", "Kalp EKO",
+    "Karın USG", "Tiroid USG", "Mamografi", "Diş Panoramik Röntgen"
+)
+
+TETKIK_SONUCLARI = _t(
+    "Normal sınırlarda", "Minimal patoloji", "Hafif dejeneratif değişiklikler",
+    "Akciğer parankim alanlarında minimal fibrotik değişiklikler",
+    "Kemik yapılarda osteoporotik değişiklikler",
+    "Patoloji saptanmadı", "Hafif osteoartrit bulguları",
+    "Minimal plevral kalınlaşma", "Normal anatomik yapı"
+)
+
+# {il} kişinin iline göre doldurulur; yalnızca seçilen kalıp biçimlendirilir
+HASTANE_KALIPLARI = _t(
+    "{il} Eğitim ve Araştırma Hastanesi",
+    "Özel {il} Medicalpark Hastanesi",
+    "{il} Devlet Hastanesi",
+    "{il} Üniversitesi Hastanesi",
+    "{il} Şehir Hastanesi",
+    "Özel {il} Anadolu Hastanesi"
+)
+
+RADYOLOG_ADLARI = _t("Ali", "Veli", "Ayşe", "Fatma", "Zeynep", "Mehmet")
+RADYOLOG_SOYADLARI = _t("Yıldız", "Şahin", "Demir", "Çelik", "Arslan", "Koç")
+TETKIK_BRANSLARI = _t("Radyoloji", "Nöroradyoloji", "Ortopedi", "Kardiyoloji", "Genel Cerrahi")
+TETKIK_BOLUMLERI = _t("Radyoloji", "Görüntüleme Merkezi", "MR Ünitesi", "Tomografi Ünitesi")
+ISTEYEN_DOKTOR_ADLARI = _t("Ahmet", "Mehmet", "Ayşe")
+ISTEYEN_DOKTOR_SOYADLARI = _t("Yılmaz", "Kaya")
+
+# ========== REÇETE / ECZANE ==========
+ILACLAR = (
+    _d(ad="PAROL 500 mg", kutu="20 tablet", kullanim="Günde 3x1", etkenMadde="Parasetamol"),
+    _d(ad="MAJEZİK", kutu="12 tablet", kullanim="Gerektiğinde 1", etkenMadde="Tiyoprofenik asit"),
+    _d(ad="VENTOLİN 100 mcg", kutu="200 doz", kullanim="Günde 2x2", etkenMadde="Salbutamol"),
+    _d(ad="CORASPİN 100 mg", kutu="30 tablet", kullanim="Günde 1x1", etkenMadde="Asetilsalisilik asit"),
+    _d(ad="ATECOR 10 mg", kutu="28 tablet", kullanim="Günde 1x1", etkenMadde="Atorvastatin"),
+    _d(ad="CRESTOR 20 mg", kutu="28 tablet", kullanim="Günde 1x1", etkenMadde="Rosuvastatin"),
+    _d(ad="ARVELES 25 mg", kutu="20 tablet", kullanim="Gerektiğinde 1", etkenMadde="Dexketoprofen"),
+    _d(ad="AUGMENTİN 1g", kutu="14 tablet", kullanim="Günde 2x1", etkenMadde="Amoksisilin/Klavulanat"),
+    _d(ad="ZİNCO 15 mg", kutu="30 kapsül", kullanim="Günde 1x1", etkenMadde="Çinko"),
+    _d(ad="BEREKET VİTAMİN", kutu="30 tablet", kullanim="Günde 1x1", etkenMadde="Multivitamin"),
+)
+
+# {il}, {ilce}, {mahalle} kişi kaydından doldurulur
+ECZANE_KALIPLARI = _t(
+    "{ilce} Merkez Eczanesi",
+    "{ilce} Sağlık Eczanesi",
+    "{ilce} 24 Saat Eczanesi",
+    "{il} Eczanesi",
+    "{mahalle} Eczanesi",
+    "Özel {ilce} Eczanesi"
+)
+
+RECETE_BRANSLARI = _t("Dahiliye", "Kardiyoloji", "Genel Cerrahi", "Aile Hekimliği", "Kulak Burun Boğaz", "Göz Hastalıkları")
+RECETE_DOKTOR_ADLARI = _t("Ahmet", "Mehmet", "Ayşe", "Fatma", "Zeynep")
+RECETE_DOKTOR_SOYADLARI = _t("Yılmaz", "Kaya", "Demir", "Çelik", "Şahin")
+ECZACI_ADLARI = _t("Ali", "Veli", "Ayşe")
+ECZACI_SOYADLARI = _t("Yıldız", "Kaya")
+RECETE_TIPLERI = _t("Normal", "Yeşil", "Kırmızı", "Turuncu")
+
+# ========== PASAPORT ==========
+PASAPORT_TIPLERI = (
+    _d(tip="Umuma Mahsus (Bordo)", kod="P"),
+    _d(tip="Hususi (Yeşil)", kod="G"),
+    _d(tip="Hizmet (Gri)", kod="S"),
+    _d(tip="Diplomatik (Siyah)", kod="D"),
+)
+
+ULKELER = _t("Almanya", "Fransa", "Hollanda", "İtalya", "İspanya", "Yunanistan", "ABD", "İngiltere", "Japonya")
+YURTDISI_SEHIRLER = _t("Berlin", "Paris", "Amsterdam", "Roma", "Barcelona", "Atina", "New York", "Londra", "Tokyo")
+SEYAHAT_AMACLARI = _t("Turizm", "İş", "Eğitim", "Aile Ziyareti")
+VIZE_ULKELERI = _t("ABD", "İngiltere", "Kanada", "Avustralya", "Japonya", "Çin")
+VIZE_TIPLERI = _t("B1/B2", "Turist", "Öğrenci", "İş")
+AMIR_ADLARI = _t("Ahmet", "Mehmet", "Ayşe")
+AMIR_SOYADLARI = _t("Yılmaz", "Kaya")
+
+# ========== EHLİYET ==========
+EHLIYET_SINIFLARI = (
+    _d(kod="A1", aciklama="Motor (125 cc'ye kadar)"),
+    _d(kod="A2", aciklama="Motor (35 kW'ya kadar)"),
+    _d(kod="B", aciklama="Otomobil, Kamyonet"),
+    _d(kod="C", aciklama="Kamyon"),
+    _d(kod="D", aciklama="Otobüs"),
+    _d(kod="E", aciklama="Römorklu Araçlar"),
+    _d(kod="F", aciklama="Traktör"),
+)
+
+CEZA_TIPLERI = _t("Hız İhlali", "Park İhlali", "Emniyet Kemeri", "Kırmızı Işık", "Alkollü Araç Kullanma")
+
+# ========== KRONİK HASTALIK ==========
+HASTALIKLAR = (
+    _d(ad="Hipertansiyon", teshisTarihi="2021-03-15", durum="Kontrollü", ilac="Concor 5 mg"),
+    _d(ad="Tip 2 Diyabet", teshisTarihi="2020-08-20", durum="Diyet ile kontrol", ilac="Metformin 850 mg"),
+    _d(ad="Astım", teshisTarihi="2019-05-10", durum="Ara sıra", ilac="Ventolin"),
+    _d(ad="Migren", teshisTarihi="2018-11-30", durum="İlaçlı kontrol", ilac="Maxalt"),
+    _d(ad="Kolesterol Yüksekliği", teshisTarihi="2022-01-15", durum="İzlemde", ilac="Crestor 10 mg"),
+)
+
+# ========== AŞI ==========
+ASI_TURLERI = _t(
+    "COVID-19 (BioNTech)", "COVID-19 (Sinovac)", "Tetanoz",
+    "Hepatit B", "Grip Aşısı", "Kızamık-Kabakulak-Kızamıkçık",
+    "Suçiçeği", "Zatürre (Pnömokok)", "HPV Aşısı", "Menenjit Aşısı",
+    "Kuduz Aşısı", "Tüberküloz Aşısı (BCG)"
+)
+ASI_UYGULAYAN_ADLARI = _t("Ahmet", "Mehmet", "Ayşe", "Fatma")
+ASI_UYGULAYAN_SOYADLARI = _t("Yılmaz", "Kaya", "Demir", "Çelik")
+ASI_UYGULAMA_YERLERI = _t("Sol Kol", "Sağ Kol", "Kalçadan")
+AILE_HEKIMI_ADLARI = _t("Ali", "Veli", "Zeynep", "Elif")
+AILE_HEKIMI_SOYADLARI = _t("Yıldız", "Şahin", "Arslan")
+
+# ========== ADLİ SİCİL ==========
+SORGULAYAN_SIRKETLER = _t("ABC", "XYZ", "TECH", "GLOBAL")
+
+# ========== TAPU ==========
+GAYRIMENKUL_TIPLERI = _t("Daire", "Arsa", "Tarla", "Dükkan", "Depo", "Ofis", "Villa")
+NOTER_ISLEM_TIPLERI = _t("Vekalet", "Miras", "Satış", "Kira", "İpotek")
+
+# ========== ASKERLİK ==========
+ASKERI_BIRLIKLER = _t("2. Kolordu", "3. Kolordu", "Eğitim Tugayı", "Piyade Alayı")
+ASKERLIK_SAGLIK_DURUMLARI = _t("Elverişli", "Geçici Elverişsiz", "Elverişsiz")
+ASKERLIK_SINIFLARI = _t("Yok", "1. Sınıf", "2. Sınıf")
+
+# ========== DİĞER KISA UÇ NOKTALAR ==========
+OTELLER = _t("Rixos", "Hilton", "Sheraton", "Martı", "Divan")
+OTEL_LOKASYONLARI = _t("Antalya", "Bodrum", "İzmir", "Muğla", "Çeşme")
+ISTANBULKART_TIPLERI = _t("Anonim", "Kişiye Özel", "Öğrenci")
+ISTANBULKART_KULLANIM_YERLERI = _t("Metrobüs", "Metro", "Otobüs", "Tramvay")
+SPOR_DALLARI = _t("Futbol", "Basketbol", "Voleybol", "Yüzme", "Atletizm")
+YATIS_BOLUMLERI = _t("Dahiliye", "Cerrahi", "Kardiyoloji", "Nöroloji")
+YATIS_TANILARI = _t("Akut Bronşit", "Hipertansiyon", "Gastrit")
+BANKALAR = _t("Ziraat Bankası", "İş Bankası", "Garanti BBVA", "Yapı Kredi", "Akbank")
+MEB_ALANLARI = _t("Fen", "Matematik", "Türkçe-Matematik", "Sosyal")
+SIKAYET_SEKTORLERI = _t("Elektronik", "Giyim", "Market", "Turizm")
+SIKAYET_KONULARI = _t("Ürün hatası", "Hizmet kalitesi", "Teslimat gecikmesi")
+KALKIS_SEHIRLERI = _t("İstanbul", "Ankara", "İzmir")
+UCUS_VARIS_SEHIRLERI = _t("Antalya", "Trabzon", "Adana")
+OTOBUS_VARIS_SEHIRLERI = _t("Antalya", "Bursa", "Konya")
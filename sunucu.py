@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+"""Üretim başlatıcısı: uygulamayı gunicorn.conf.py ayarlarıyla gunicorn altında çalıştırır.
+
+    python sunucu.py
+    NABI_ISCI=8 NABI_GECIKME=kapali python sunucu.py
+    python sunucu.py --bind 127.0.0.1:8000 --log-level debug   # gunicorn seçenekleri aynen geçer
+
+Geliştirme sunucusu (python backend.py) reloader ve debugger ile iki süreç
+açar; yalnızca yerel deneme içindir.
+"""
+import os
+import sys
+
+from gunicorn.app.wsgiapp import run
+
+AYAR_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
+
+def main():
+    sys.argv = [sys.argv[0], '-c', AYAR_DOSYASI, *sys.argv[1:]]
+    run()
+
+if __name__ == '__main__':
+    main()
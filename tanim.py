@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Bildirimsel uç nokta tanımları ve bunlardan derlenen yanıt üreticileri.
+
+Kısa uç noktaların handler'ları aynı kalıbı elle tekrarlıyordu: TC bağlamını
+al, kişi kaydını getir, alanları seed aritmetiğiyle hesapla, kisi_yaniti ile
+yaz. Böyle bir uç nokta yalnızca alan -> üretici eşlemesiyle tanımlanır:
+
+    Tanim('elektrik', {
+        "aboneNo": lambda seed: f"ELEK-{seed % 100000:06d}",
+        "santral": lambda kisi: f"{kisi.il} Anadolu Dağıtım",
+        "tutar": lambda tutar: f"{tutar:.2f} TL",
+        "aboneTipi": "Mesken",
+    }, ara={"tutar": lambda seed: (seed % 500) + 100})
+
+Üreticinin parametre adları alanın bağımlılıklarıdır: `kimlik` (TCBaglami),
+`kisi` (KisiKaydi), `seed` ya da bir ara değerin adı. Ara değerler birden
+çok alanın paylaştığı hesaplardır; isteğe bir kez hesaplanır ve önceki ara
+değerleri kullanabilir. Çağrılamayan değerler sabittir ve tüm yanıtlarda
+paylaşılır (değiştirilmemelidir). Parametresiz üreticiler her istekte
+çağrılır (saat alanları).
+
+Tanım başlangıçta bir kez tek bir Python fonksiyonuna derlenir: gereken ara
+değerler sırayla yerel değişkenlere atanır ve yanıt tek bir sözlük ifadesiyle
+kurulur; alan başına döngü, arama ya da koşul yoktur. Bağımlılıklar bilindiği
+için ?fields= seçimi için ayrı bir fonksiyon derlenir: istenmeyen alanlar ve
+yalnızca onların kullandığı ara değerler hiç hesaplanmaz.
+"""
+import inspect
+import threading
+
+GIRDILER = ('kimlik', 'kisi', 'seed')
+
+# Tanım başına derlenip saklanan en fazla alan seçimi; fazlası her istekte derlenir
+AZAMI_SECIM = 64
+
+class Tanim:
+    """Bir uç noktanın alanları; `uret(kimlik, kisi, seed)` tam yanıtı üretir"""
+
+    def __init__(self, ad, alanlar, ara=None):
+        self.ad = ad
+        self.alanlar = dict(alanlar)
+        self.ara = dict(ara or {})
+        self.bagimliliklar = {}  # ('alan' | 'ara', ad) -> parametre adları
+        bilinen = set(GIRDILER)
+        for ara_ad, uretici in self.ara.items():
+            if ara_ad in GIRDILER:
+                raise ValueError(f"{ad}: ara değer adı girdiyle çakışıyor: {ara_ad}")
+            self.bagimliliklar[('ara', ara_ad)] = _parametreler(ad, ara_ad, uretici, bilinen)
+            bilinen.add(ara_ad)
+        for alan, uretici in self.alanlar.items():
+            if callable(uretici):
+                self.bagimliliklar[('alan', alan)] = _parametreler(ad, alan, uretici, bilinen)
+        self.uret = self._derle(tuple(self.alanlar))
+        self._secimler = {}
+        self._kilit = threading.Lock()
+
+    def secimli(self, secim):
+        """Projeksiyon için yalnızca seçimin üst düzey alanlarını üreten fonksiyon"""
+        agac = secim.agac
+        istenen = tuple(alan for alan in self.alanlar if alan in agac)
+        uret = self._secimler.get(istenen)
+        if uret is None:
+            uret = self._derle(istenen)
+            with self._kilit:
+                if len(self._secimler) < AZAMI_SECIM:
+                    self._secimler[istenen] = uret
+        return uret
+
+    def _gereken_aralar(self, alanlar):
+        """Alanların doğrudan ya da dolaylı kullandığı ara değerler, tanım sırasıyla"""
+        gereken = set()
+        bekleyen = [p for alan in alanlar for p in self.bagimliliklar.get(('alan', alan), ())]
+        while bekleyen:
+            ad = bekleyen.pop()
+            if ad in self.ara and ad not in gereken:
+                gereken.add(ad)
+                bekleyen.extend(self.bagimliliklar[('ara', ad)])
+        return [ad for ad in self.ara if ad in gereken]
+
+    def _derle(self, alanlar):
+        ad_alani = {}
+        satirlar = [f"def uret_{self.ad}(kimlik, kisi, seed):"]
+        for i, ara_ad in enumerate(self._gereken_aralar(alanlar)):
+            ad_alani[f'_a{i}'] = self.ara[ara_ad]
+            satirlar.append(f"    {ara_ad} = _a{i}({', '.join(self.bagimliliklar[('ara', ara_ad)])})")
+        ogeler = []
+        for i, alan in enumerate(alanlar):
+            uretici = self.alanlar[alan]
+            if callable(uretici):
+                ad_alani[f'_f{i}'] = uretici
+                ogeler.append(f"{alan!r}: _f{i}({', '.join(self.bagimliliklar[('alan', alan)])})")
+            else:
+                ad_alani[f'_s{i}'] = uretici
+                ogeler.append(f"{alan!r}: _s{i}")
+        satirlar.append(f"    return {{{', '.join(ogeler)}}}")
+        exec(compile('\n'.join(satirlar), f'<tanim {self.ad}>', 'exec'), ad_alani)
+        return ad_alani[f'uret_{self.ad}']
+
+    def __repr__(self):
+        return f"Tanim({self.ad!r}, {len(self.alanlar)} alan, {len(self.ara)} ara değer)"
+
+def _parametreler(tanim_ad, ad, uretici, bilinen):
+    parametreler = tuple(inspect.signature(uretici).parameters)
+    bilinmeyen = [p for p in parametreler if p not in bilinen]
+    if bilinmeyen:
+        raise ValueError(f"{tanim_ad}.{ad}: bilinmeyen bağımlılık {bilinmeyen} "
+                         f"(girdiler {GIRDILER} ya da önceki ara değerler)")
+    return parametreler